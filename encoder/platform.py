@@ -1,71 +1,81 @@
 """Platform-specific video encoding for TikTok, Reels, YouTube, Shorts."""
 
+import functools
+import os
 import subprocess
 import shutil
 from pathlib import Path
-from typing import Optional, Dict, List
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, Tuple
 
 from encoder.types import PlatformSettings, EncodeJob
 from encoder.errors import PlatformError, FFmpegNotFoundError, CodecError
 from encoder.captions import burn_captions
 
 
-# Platform-specific encoding settings
-PLATFORM_SETTINGS: Dict[str, PlatformSettings] = {
-    "tiktok": {
+# Platform-specific encoding settings (read-only; shared by all callers)
+PLATFORM_SETTINGS: Mapping[str, PlatformSettings] = MappingProxyType({
+    "tiktok": MappingProxyType({
         "resolution": (1080, 1920),  # 9:16
         "video_bitrate": "5M",
         "audio_bitrate": "192k",
         "burn_captions": True,
         "fps": 30,
         "max_duration": 180  # 3 minutes
-    },
-    "reels": {
+    }),
+    "reels": MappingProxyType({
         "resolution": (1080, 1920),  # 9:16
         "video_bitrate": "5M",
         "audio_bitrate": "192k",
         "burn_captions": True,
         "fps": 30,
         "max_duration": 90  # 90 seconds
-    },
-    "shorts": {
+    }),
+    "shorts": MappingProxyType({
         "resolution": (1080, 1920),  # 9:16
         "video_bitrate": "5M",
         "audio_bitrate": "192k",
         "burn_captions": True,
         "fps": 30,
         "max_duration": 60  # 60 seconds
-    },
-    "youtube": {
+    }),
+    "youtube": MappingProxyType({
         "resolution": (1920, 1080),  # 16:9
         "video_bitrate": "8M",
         "audio_bitrate": "320k",
         "burn_captions": False,  # Soft subtitles
         "fps": 30,
         "max_duration": None  # Unlimited
-    }
-}
+    })
+})
 
 
+@functools.lru_cache(maxsize=1)
 def find_ffmpeg_executable() -> Optional[str]:
     """Find FFmpeg executable on system PATH.
 
+    The PATH scan runs once per process; call
+    ``find_ffmpeg_executable.cache_clear()`` after changing PATH.
+
     Returns:
         Path to ffmpeg executable, or None if not found
     """
-    exe_path = shutil.which("ffmpeg")
-    return exe_path
+    return shutil.which("ffmpeg")
 
 
-def check_codec_support() -> Dict[str, bool]:
-    """Check which codecs are available in FFmpeg.
+@functools.lru_cache(maxsize=4)
+def _check_codec_support_cached(ffmpeg_path: str) -> Tuple[Tuple[str, bool], ...]:
+    """Probe codec availability for a specific FFmpeg binary.
+
+    Args:
+        ffmpeg_path: Resolved path to ffmpeg executable
 
     Returns:
-        Dict mapping codec name to availability
+        Tuple of (codec name, available) pairs
     """
     try:
         result = subprocess.run(
-            ["ffmpeg", "-codecs"],
+            [ffmpeg_path, "-codecs"],
             capture_output=True,
             text=True,
             timeout=5
@@ -73,15 +83,36 @@ def check_codec_support() -> Dict[str, bool]:
 
         output = result.stdout
 
-        return {
-            "h264": "libx264" in output,
-            "aac": "aac" in output,
-            "vp9": "libvpx-vp9" in output
-        }
+        return (
+            ("h264", "libx264" in output),
+            ("aac", "aac" in output),
+            ("vp9", "libvpx-vp9" in output)
+        )
 
     except (subprocess.SubprocessError, FileNotFoundError):
+        return (("h264", False), ("aac", False), ("vp9", False))
+
+
+def check_codec_support() -> Dict[str, bool]:
+    """Check which codecs are available in FFmpeg.
+
+    Results are cached per ffmpeg binary; call clear_codec_support_cache()
+    to force a re-probe.
+
+    Returns:
+        Dict mapping codec name to availability
+    """
+    ffmpeg = find_ffmpeg_executable()
+    if not ffmpeg:
         return {"h264": False, "aac": False, "vp9": False}
 
+    return dict(_check_codec_support_cached(ffmpeg))
+
+
+def clear_codec_support_cache() -> None:
+    """Forget cached codec probes so the next check re-runs ffmpeg."""
+    _check_codec_support_cached.cache_clear()
+
 
 def create_platform_variant(
     input_video: str,
@@ -256,12 +287,41 @@ def create_all_variants(
 def get_video_info(video_path: str) -> Dict[str, any]:
     """Get video file information using ffprobe.
 
+    Probe results are cached on the file's (path, mtime, size), so
+    repeated lookups of an unchanged file don't re-run ffprobe.
+
     Args:
         video_path: Path to video file
 
     Returns:
         Dict with duration, resolution, codec, bitrate info
     """
+    try:
+        stat = os.stat(video_path)
+    except OSError:
+        return {
+            "duration": 0.0,
+            "resolution": "unknown",
+            "codec": "unknown",
+            "exists": False,
+            "size_mb": 0.0
+        }
+
+    return dict(_probe_video(video_path, stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_video(video_path: str, mtime_ns: int, size: int) -> MappingProxyType:
+    """Run ffprobe on a video file (cached per file version).
+
+    Args:
+        video_path: Path to video file
+        mtime_ns: File modification time, part of the cache key
+        size: File size in bytes
+
+    Returns:
+        Read-only mapping with duration, resolution, codec, size info
+    """
     try:
         # Get duration
         result_duration = subprocess.run(
@@ -296,19 +356,19 @@ def get_video_info(video_path: str) -> Dict[str, any]:
         resolution = result_resolution.stdout.strip() if result_resolution.returncode == 0 else "unknown"
         codec = result_codec.stdout.strip() if result_codec.returncode == 0 else "unknown"
 
-        return {
+        return MappingProxyType({
             "duration": duration,
             "resolution": resolution,
             "codec": codec,
-            "exists": Path(video_path).exists(),
-            "size_mb": Path(video_path).stat().st_size / (1024*1024) if Path(video_path).exists() else 0.0
-        }
+            "exists": True,
+            "size_mb": size / (1024*1024)
+        })
 
     except Exception:
-        return {
+        return MappingProxyType({
             "duration": 0.0,
             "resolution": "unknown",
             "codec": "unknown",
             "exists": False,
             "size_mb": 0.0
-        }
+        })
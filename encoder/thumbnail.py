@@ -2,12 +2,42 @@
 
 import subprocess
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from encoder.types import ThumbnailSettings
 from encoder.errors import ThumbnailError, FFmpegNotFoundError
 
 
+# Recommended thumbnail settings per platform (read-only, shared by callers)
+_THUMBNAIL_SETTINGS: Mapping[str, ThumbnailSettings] = MappingProxyType({
+    "tiktok": MappingProxyType({
+        "timestamp": 0.0,
+        "width": 1080,
+        "height": 1920,
+        "quality": 85
+    }),
+    "reels": MappingProxyType({
+        "timestamp": 0.0,
+        "width": 1080,
+        "height": 1920,
+        "quality": 85
+    }),
+    "shorts": MappingProxyType({
+        "timestamp": 0.0,
+        "width": 1080,
+        "height": 1920,
+        "quality": 85
+    }),
+    "youtube": MappingProxyType({
+        "timestamp": 0.0,
+        "width": 1280,
+        "height": 720,
+        "quality": 90
+    })
+})
+
+
 def generate_thumbnail(
     video_path: str,
     output_path: str,
@@ -208,33 +238,6 @@ def get_thumbnail_settings(platform: str) -> ThumbnailSettings:
         platform: Platform name (tiktok, reels, shorts, youtube)
 
     Returns:
-        ThumbnailSettings with recommended dimensions
+        Read-only ThumbnailSettings with recommended dimensions
     """
-    settings_map = {
-        "tiktok": {
-            "timestamp": 0.0,
-            "width": 1080,
-            "height": 1920,
-            "quality": 85
-        },
-        "reels": {
-            "timestamp": 0.0,
-            "width": 1080,
-            "height": 1920,
-            "quality": 85
-        },
-        "shorts": {
-            "timestamp": 0.0,
-            "width": 1080,
-            "height": 1920,
-            "quality": 85
-        },
-        "youtube": {
-            "timestamp": 0.0,
-            "width": 1280,
-            "height": 720,
-            "quality": 90
-        }
-    }
-
-    return settings_map.get(platform, settings_map["youtube"])
+    return _THUMBNAIL_SETTINGS.get(platform, _THUMBNAIL_SETTINGS["youtube"])
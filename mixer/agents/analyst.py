@@ -6,7 +6,6 @@ from datetime import datetime
 from typing import Dict, List
 import numpy as np
 import librosa
-import whisper
 
 from mixer.config import get_config
 from mixer.memory import upsert_song
@@ -27,6 +26,10 @@ from mixer.llm.semantic import (
 
 logger = logging.getLogger(__name__)
 
+# Imported on first transcription: whisper loads torch, the slowest import
+# in the package. Module-level so tests can patch `analyst.whisper`.
+whisper = None
+
 
 class AnalysisError(Exception):
     """Base exception for analysis errors."""
@@ -216,7 +219,12 @@ def _transcribe_audio(file_path: str, config) -> Dict:
     Returns:
         Dict with transcript, has_vocals, word_timings
     """
+    global whisper
+
     try:
+        if whisper is None:
+            import whisper
+
         model_size = config.get("models.whisper_size", "base")
         logger.info(f"Loading Whisper model: {model_size}")
 
@@ -270,8 +278,9 @@ def _analyze_sections(
         List of SectionMetadata dicts
     """
     sections = []
-    transcript = transcript_data['transcript']
-    word_timings = transcript_data['word_timings']
+    section_lyrics = _extract_all_section_lyrics(
+        section_boundaries, transcript_data['word_timings']
+    )
 
     for idx, (start, end) in enumerate(section_boundaries):
         # Energy analysis
@@ -285,10 +294,8 @@ def _analyze_sections(
             energy_data['spectral_centroid']
         )
 
-        # Extract lyrics for this section
-        lyrical_content = _extract_section_lyrics(
-            start, end, word_timings, transcript
-        )
+        # Lyrics for this section
+        lyrical_content = section_lyrics[idx]
 
         # Vocal characteristics
         vocal_data = _analyze_section_vocals(y, sr, start, end, lyrical_content)
@@ -348,22 +355,48 @@ def _extract_section_lyrics(
     Returns:
         Lyrics for this section
     """
-    if not word_timings:
-        # Fallback: split transcript into equal chunks
-        return ""
+    return _extract_all_section_lyrics([(start_sec, end_sec)], word_timings)[0]
+
 
-    # Extract words within this section's time range
-    section_words = []
+def _extract_all_section_lyrics(
+    section_boundaries: List[tuple],
+    word_timings: List[Dict]
+) -> List[str]:
+    """
+    Extract lyrics for every section in one pass over the word timings.
 
-    for segment in word_timings:
-        segment_start = segment.get('start', 0)
-        segment_end = segment.get('end', 0)
+    A segment belongs to a section when it overlaps it. Whisper emits
+    segments in time order, so each section's range is found with two
+    binary searches; unordered timings fall back to an overlap mask.
 
-        # Check if segment overlaps with this section
-        if segment_start < end_sec and segment_end > start_sec:
-            section_words.append(segment.get('text', '').strip())
+    Args:
+        section_boundaries: List of (start, end) tuples
+        word_timings: Whisper word timing segments
 
-    return ' '.join(section_words)
+    Returns:
+        Lyrics for each section, in section order
+    """
+    if not word_timings:
+        return ["" for _ in section_boundaries]
+
+    n = len(word_timings)
+    starts = np.fromiter((seg.get('start', 0) for seg in word_timings), dtype=np.float64, count=n)
+    ends = np.fromiter((seg.get('end', 0) for seg in word_timings), dtype=np.float64, count=n)
+    texts = [seg.get('text', '').strip() for seg in word_timings]
+
+    bounds = np.asarray(section_boundaries, dtype=np.float64).reshape(-1, 2)
+
+    if np.all(np.diff(starts) >= 0) and np.all(np.diff(ends) >= 0):
+        # First segment ending after each section start, first starting at/after its end
+        lo = np.searchsorted(ends, bounds[:, 0], side='right')
+        hi = np.searchsorted(starts, bounds[:, 1], side='left')
+        return [' '.join(texts[l:h]) for l, h in zip(lo, hi)]
+
+    lyrics = []
+    for start_sec, end_sec in bounds:
+        overlap = np.flatnonzero((starts < end_sec) & (ends > start_sec))
+        lyrics.append(' '.join(texts[i] for i in overlap))
+    return lyrics
 
 
 def _analyze_section_vocals(
@@ -1,13 +1,28 @@
 """Curator Agent - Intelligent song selection and compatibility ranking."""
 
+import functools
 import logging
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal, TypedDict
+
+import numpy as np
+
 from mixer.types import MatchResult, MashupRecommendation, PairRecommendation, SongMetadata
 from mixer.memory import query_harmonic, query_semantic, query_hybrid, get_song
 from mixer.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Libraries at least this large are scored with the compiled kernel; below
+# it, NumPy broadcasting is faster than paying the one-off JIT compile
+NUMBA_MIN_SONGS = 512
+
+# Rows scored per block when every pair must be scored; caps the staging
+# buffers at about 2 × 8 × PAIR_BLOCK_ROWS × N bytes instead of N×N
+PAIR_BLOCK_ROWS = 256
+
+# Component codes understood by the compiled scoring kernel
+_COMPONENT_IDS = {"bpm": 0, "key": 1, "energy": 2, "genre": 3}
+
 
 class CuratorError(Exception):
     """Base exception for curator errors."""
@@ -87,9 +102,10 @@ def find_match(
             raise CuratorError(f"Invalid criteria: {criteria}. Must be harmonic, semantic, or hybrid")
 
         # Enhance with detailed compatibility scores and reasons
+        weights = _default_weights()
         enhanced_results = []
         for result in results[:max_results]:
-            enhanced = _enhance_match_result(result, target_meta, criteria)
+            enhanced = _enhance_match_result(result, target_meta, criteria, weights)
             enhanced_results.append(enhanced)
 
         logger.info(f"✅ Found {len(enhanced_results)} compatible matches")
@@ -125,16 +141,9 @@ def calculate_compatibility_score(
         - compatibility_score: 0.0-1.0 (higher is better)
         - match_reasons: List of human-readable explanations
     """
-    config = get_config()
-
     # Default weights (can be overridden via config)
     if weights is None:
-        weights = {
-            "bpm": config.get("curator.weight_bpm", 0.35),
-            "key": config.get("curator.weight_key", 0.30),
-            "energy": config.get("curator.weight_energy", 0.20),
-            "genre": config.get("curator.weight_genre", 0.15)
-        }
+        weights = _default_weights()
 
     reasons = []
     scores = {}
@@ -201,6 +210,39 @@ def calculate_compatibility_score(
     return total_score, reasons
 
 
+# Mashup recommendation rules: rule → (mashup type, confidence, reason template)
+_MASHUP_RULES: Dict[str, tuple[str, float, str]] = {
+    "adaptive_harmony": (
+        "ADAPTIVE_HARMONY", 0.9,
+        "Keys are {key_distance} steps apart - pitch-shifting will fix clash"
+    ),
+    "conversational": (
+        "CONVERSATIONAL", 0.85,
+        "Songs have complementary lyrical functions (question→answer or narrative→reflection)"
+    ),
+    "theme_fusion": (
+        "THEME_FUSION", 0.80,
+        "Shared theme: '{theme}' - can create thematic narrative"
+    ),
+    "role_aware": (
+        "ROLE_AWARE", 0.75,
+        "Contrasting vocal densities - can create lead/harmony/texture roles"
+    ),
+    "classic_both_vocals": (
+        "CLASSIC", 0.70,
+        "Both songs have vocals - classic vocal+instrumental mashup works well"
+    ),
+    "classic_one_vocal": (
+        "CLASSIC", 0.60,
+        "One song has vocals - can extract vocal or instrumental as needed"
+    ),
+    "classic_default": (
+        "CLASSIC", 0.50,
+        "Default mashup type (no special characteristics detected)"
+    ),
+}
+
+
 def recommend_mashup_type(
     song_a_meta: SongMetadata,
     song_b_meta: SongMetadata
@@ -242,19 +284,17 @@ def recommend_mashup_type(
     has_vocals_a = song_a_meta.get("has_vocals", True)
     has_vocals_b = song_b_meta.get("has_vocals", True)
 
-    # Decision tree for mashup type recommendation
-    recommendations = []
+    # Rules are checked in descending confidence, so the first match is the
+    # best recommendation and later (more expensive) checks are skipped
+    rule = None
+    theme = None
 
     # 1. Check for key incompatibility → Adaptive Harmony
     if key_distance > 2 and has_vocals_a and has_vocals_b:
-        recommendations.append({
-            "type": "ADAPTIVE_HARMONY",
-            "confidence": 0.9,
-            "reason": f"Keys are {key_distance} steps apart - pitch-shifting will fix clash"
-        })
-
-    # 2. Check for conversational potential (requires sections)
-    if has_sections:
+        rule = "adaptive_harmony"
+
+    # 2. Section-level rules (conversational, theme fusion, role-aware)
+    if rule is None and has_sections:
         sections_a = song_a_meta.get("sections", [])
         sections_b = song_b_meta.get("sections", [])
 
@@ -269,12 +309,9 @@ def recommend_mashup_type(
         has_reflection = "reflection" in funcs_a or "reflection" in funcs_b
 
         if (has_question_a and has_answer_b) or (has_narrative and has_reflection):
-            recommendations.append({
-                "type": "CONVERSATIONAL",
-                "confidence": 0.85,
-                "reason": "Songs have complementary lyrical functions (question→answer or narrative→reflection)"
-            })
+            rule = "conversational"
 
+    if rule is None and has_sections:
         # Check for theme overlap
         themes_a = set()
         themes_b = set()
@@ -286,12 +323,9 @@ def recommend_mashup_type(
         common_themes = themes_a & themes_b
         if common_themes:
             theme = list(common_themes)[0]  # Pick first common theme
-            recommendations.append({
-                "type": "THEME_FUSION",
-                "confidence": 0.80,
-                "reason": f"Shared theme: '{theme}' - can create thematic narrative"
-            })
+            rule = "theme_fusion"
 
+    if rule is None and has_sections:
         # Check for role-aware potential (different vocal densities)
         densities_a = set(s.get("vocal_density", "") for s in sections_a)
         densities_b = set(s.get("vocal_density", "") for s in sections_b)
@@ -300,36 +334,18 @@ def recommend_mashup_type(
         has_sparse = "sparse" in densities_a or "sparse" in densities_b
 
         if has_dense and has_sparse:
-            recommendations.append({
-                "type": "ROLE_AWARE",
-                "confidence": 0.75,
-                "reason": "Contrasting vocal densities - can create lead/harmony/texture roles"
-            })
-
-    # 3. Default to CLASSIC if both have vocals
-    if has_vocals_a and has_vocals_b:
-        recommendations.append({
-            "type": "CLASSIC",
-            "confidence": 0.70,
-            "reason": "Both songs have vocals - classic vocal+instrumental mashup works well"
-        })
-    elif has_vocals_a or has_vocals_b:
-        recommendations.append({
-            "type": "CLASSIC",
-            "confidence": 0.60,
-            "reason": "One song has vocals - can extract vocal or instrumental as needed"
-        })
-
-    # Pick best recommendation (highest confidence)
-    if not recommendations:
-        # Fallback
-        recommendations.append({
-            "type": "CLASSIC",
-            "confidence": 0.50,
-            "reason": "Default mashup type (no special characteristics detected)"
-        })
-
-    best = max(recommendations, key=lambda x: x["confidence"])
+            rule = "role_aware"
+
+    # 3. Default to CLASSIC, graded by how many songs have vocals
+    if rule is None:
+        if has_vocals_a and has_vocals_b:
+            rule = "classic_both_vocals"
+        elif has_vocals_a or has_vocals_b:
+            rule = "classic_one_vocal"
+        else:
+            rule = "classic_default"
+
+    mashup_type, confidence, reason = _MASHUP_RULES[rule]
 
     # Build config suggestion
     config_suggestion = {
@@ -337,18 +353,14 @@ def recommend_mashup_type(
         "song_b_id": song_b_meta.get("artist", "unknown") + "_" + song_b_meta.get("title", "unknown"),
     }
 
-    if best["type"] == "THEME_FUSION" and has_sections:
-        # Add theme suggestion
-        themes_a = set()
-        for section in song_a_meta.get("sections", []):
-            themes_a.update(section.get("themes", []))
-        if themes_a:
-            config_suggestion["theme"] = list(themes_a)[0]
+    if rule == "theme_fusion":
+        # Add theme suggestion (themes_a was collected during section checks)
+        config_suggestion["theme"] = list(themes_a)[0]
 
     return MashupRecommendation(
-        mashup_type=best["type"],
-        confidence=best["confidence"],
-        reasoning=best["reason"],
+        mashup_type=mashup_type,
+        confidence=confidence,
+        reasoning=reason.format(key_distance=key_distance, theme=theme),
         config_suggestion=config_suggestion
     )
 
@@ -400,36 +412,51 @@ def find_all_pairs(
 
         logger.info(f"Analyzing {len(song_ids)} songs...")
 
-        # Generate all unique pairs
-        pairs = []
-        for i in range(len(song_ids)):
-            for j in range(i + 1, len(song_ids)):
-                song_a_id = song_ids[i]
-                song_b_id = song_ids[j]
-                meta_a = song_metas[i]
-                meta_b = song_metas[j]
-
-                # Calculate compatibility
-                score, reasons = calculate_compatibility_score(meta_a, meta_b)
-
-                if score >= min_compatibility:
-                    # Get mashup recommendation
-                    mashup_rec = recommend_mashup_type(meta_a, meta_b)
-
-                    pair = PairRecommendation(
-                        song_a_id=song_a_id,
-                        song_b_id=song_b_id,
-                        compatibility_score=score,
-                        match_reasons=reasons,
-                        recommended_mashup=mashup_rec
-                    )
-                    pairs.append(pair)
-
-        # Sort by compatibility (best first)
-        pairs.sort(key=lambda x: x["compatibility_score"], reverse=True)
-
-        result = pairs[:max_pairs]
-        logger.info(f"✅ Found {len(result)} compatible pairs (from {len(pairs)} candidates)")
+        # Score unique pairs (i < j) and keep those that pass the threshold,
+        # in row-major (i, j) order. When the threshold implies a BPM
+        # tolerance, only pairs inside it are scored; otherwise every pair is
+        # scored, a block of rows at a time.
+        weights = _default_weights()
+        songs = _song_arrays(song_metas)
+        window = _bpm_window(weights, min_compatibility)
+        if window is not None and np.all(songs["bpm"] > 0):
+            rows, cols = _bpm_candidate_pairs(songs["bpm"], window)
+            pair_scores = _score_pairs(songs, rows, cols, weights)
+            passing = pair_scores >= min_compatibility
+            rows, cols, pair_scores = rows[passing], cols[passing], pair_scores[passing]
+        else:
+            rows, cols, pair_scores = _passing_pairs(songs, weights, min_compatibility)
+
+        # Partition out the top max_pairs (keeping ties at the cutoff) so only
+        # those need sorting; the stable sort preserves library order on ties
+        selected = np.arange(len(pair_scores))
+        if 0 < max_pairs < len(pair_scores):
+            kth = len(pair_scores) - max_pairs
+            cutoff = np.partition(pair_scores, kth)[kth]
+            selected = np.flatnonzero(pair_scores >= cutoff)
+        selected = selected[np.argsort(-pair_scores[selected], kind="stable")][:max_pairs]
+
+        # Only surviving pairs get reasons and a mashup recommendation
+        result = []
+        for i, j in zip(rows[selected], cols[selected]):
+            meta_a = song_metas[i]
+            meta_b = song_metas[j]
+
+            score, reasons = calculate_compatibility_score(meta_a, meta_b, weights)
+
+            # Get mashup recommendation
+            mashup_rec = recommend_mashup_type(meta_a, meta_b)
+
+            pair = PairRecommendation(
+                song_a_id=song_ids[i],
+                song_b_id=song_ids[j],
+                compatibility_score=score,
+                match_reasons=reasons,
+                recommended_mashup=mashup_rec
+            )
+            result.append(pair)
+
+        logger.info(f"✅ Found {len(result)} compatible pairs (from {len(pair_scores)} candidates)")
 
         return result
 
@@ -439,10 +466,398 @@ def find_all_pairs(
 
 # Helper functions
 
+def _default_weights() -> Dict[str, float]:
+    """Compatibility component weights from config."""
+    config = get_config()
+    return {
+        "bpm": config.get("curator.weight_bpm", 0.35),
+        "key": config.get("curator.weight_key", 0.30),
+        "energy": config.get("curator.weight_energy", 0.20),
+        "genre": config.get("curator.weight_genre", 0.15)
+    }
+
+
+class SongArrays(TypedDict):
+    """Struct-of-arrays view of the metadata fields used for bulk scoring."""
+    bpm: np.ndarray             # float64 BPM per song
+    energy: np.ndarray          # float64 energy, normalized 0-1
+    genre_idx: np.ndarray       # int code per distinct primary_genre
+    camelot_idx: np.ndarray     # row/column of each song's key in camelot_lut
+    camelot_lut: np.ndarray     # Camelot distance table covering every key present
+
+
+def _song_arrays(song_metas: List[SongMetadata]) -> SongArrays:
+    """
+    Pull the scoring fields out of per-song metadata into flat arrays.
+
+    Applies the same defaults as calculate_compatibility_score.
+
+    Args:
+        song_metas: Metadata for each song
+
+    Returns:
+        SongArrays with one entry per song
+    """
+    camelots = [m.get("camelot", "8B") for m in song_metas]
+    _, genre_idx = np.unique(
+        [m.get("primary_genre", "Unknown") for m in song_metas], return_inverse=True
+    )
+
+    # Non-standard keys (e.g. "Unknown") get extra rows/columns in the
+    # distance table, filled in with the scalar distance
+    index = CAMELOT_INDEX
+    lut = CAMELOT_LUT
+    extra = [c for c in dict.fromkeys(camelots) if c not in CAMELOT_INDEX]
+    if extra:
+        index = {**CAMELOT_INDEX, **{c: len(CAMELOT_INDEX) + n for n, c in enumerate(extra)}}
+        lut = np.pad(CAMELOT_LUT.astype(np.int64), (0, len(extra)))
+        for code_a in extra:
+            for code_b, j in index.items():
+                lut[index[code_a], j] = _calculate_camelot_distance(code_a, code_b)
+                lut[j, index[code_a]] = _calculate_camelot_distance(code_b, code_a)
+
+    return SongArrays(
+        bpm=np.array([m.get("bpm", 120.0) for m in song_metas], dtype=np.float64),
+        energy=np.array([m.get("energy_level", 5) for m in song_metas], dtype=np.float64) / 10.0,
+        genre_idx=genre_idx.reshape(-1),
+        camelot_idx=np.array([index[c] for c in camelots], dtype=np.intp),
+        camelot_lut=lut,
+    )
+
+
+def _score_matrix(
+    songs: SongArrays,
+    weights: Optional[dict] = None
+) -> np.ndarray:
+    """
+    Calculate compatibility scores for every ordered pair of songs.
+
+    Vectorized equivalent of calculate_compatibility_score: entry [i, j]
+    equals calculate_compatibility_score(song_metas[i], song_metas[j])[0]
+    for songs = _song_arrays(song_metas). Scores use float64 so threshold
+    checks agree with the scalar path.
+
+    Args:
+        songs: Struct-of-arrays song fields from _song_arrays
+        weights: Optional weight overrides (default from config)
+
+    Returns:
+        N×N array of compatibility scores (0.0-1.0)
+    """
+    if weights is None:
+        weights = _default_weights()
+
+    n = len(songs["bpm"])
+    return _score_block(songs, weights, 0, n, 0)
+
+
+def _score_block(
+    songs: SongArrays,
+    weights: dict,
+    row_start: int,
+    row_stop: int,
+    col_start: int
+) -> np.ndarray:
+    """
+    Calculate compatibility scores for a rectangular block of ordered pairs.
+
+    Entry [r, c] is the score of songs (row_start + r, col_start + c), with
+    the same arithmetic as _score_matrix.
+
+    Args:
+        songs: Struct-of-arrays song fields from _song_arrays
+        weights: Compatibility component weights
+        row_start: First song of the block's rows
+        row_stop: One past the last song of the block's rows
+        col_start: First song of the block's columns (columns run to N)
+
+    Returns:
+        (row_stop - row_start) × (N - col_start) array of scores (0.0-1.0)
+    """
+    n = len(songs["bpm"])
+    shape = (row_stop - row_start, n - col_start)
+    kernel = _numba_score_kernel() if n >= NUMBA_MIN_SONGS else None
+    if kernel is not None:
+        out = np.empty(shape, dtype=np.float64)
+        kernel(
+            songs["bpm"],
+            songs["energy"],
+            songs["camelot_idx"],
+            np.ascontiguousarray(songs["camelot_lut"], dtype=np.int64),
+            songs["genre_idx"],
+            np.array([_COMPONENT_IDS[k] for k in weights], dtype=np.int64),
+            np.array([weights[k] for k in weights], dtype=np.float64),
+            row_start,
+            col_start,
+            out,
+        )
+        return out
+
+    total = np.zeros(shape, dtype=np.float64)
+    component = np.empty(shape, dtype=np.float64)
+    first = (slice(row_start, row_stop), None)
+    second = (None, slice(col_start, None))
+
+    # One reusable buffer for every component, filled in place with the
+    # same operation order as the scalar path
+    for k in weights.keys():
+        _fill_score_component(k, songs, component, first, second)
+        component *= weights[k]
+        total += component
+
+    return np.clip(total, 0.0, 1.0, out=total)
+
+
+def _passing_pairs(
+    songs: SongArrays,
+    weights: dict,
+    min_compatibility: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score every unique pair (i < j) and keep those that pass the threshold.
+
+    Rows are scored PAIR_BLOCK_ROWS at a time against the columns at or
+    after the block's first row, so memory stays O(PAIR_BLOCK_ROWS × N)
+    rather than O(N²) however large the library is.
+
+    Args:
+        songs: Struct-of-arrays song fields from _song_arrays
+        weights: Compatibility component weights
+        min_compatibility: Minimum compatibility score threshold
+
+    Returns:
+        (rows, cols, scores) of the passing pairs in row-major (i, j) order
+    """
+    n = len(songs["bpm"])
+    found_rows, found_cols, found_scores = [], [], []
+
+    for start in range(0, n, PAIR_BLOCK_ROWS):
+        stop = min(start + PAIR_BLOCK_ROWS, n)
+        block = _score_block(songs, weights, start, stop, start)
+
+        # Column c of the block is song start + c; keep c > r (i.e. j > i)
+        passing = block >= min_compatibility
+        passing &= np.arange(n - start) > np.arange(stop - start)[:, None]
+        r, c = np.nonzero(passing)
+
+        found_rows.append(r + start)
+        found_cols.append(c + start)
+        found_scores.append(block[r, c])
+
+    return (
+        np.concatenate(found_rows).astype(np.intp, copy=False),
+        np.concatenate(found_cols).astype(np.intp, copy=False),
+        np.concatenate(found_scores),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _numba_score_kernel():
+    """
+    Build the compiled scoring kernel on first use.
+
+    numba is imported here rather than at module import: it costs ~0.3s to
+    load and only large libraries need it.
+
+    Returns:
+        The njit-compiled kernel, or None if numba isn't installed
+    """
+    try:
+        import numba
+    except ImportError:  # numba ships with librosa, but scoring works without it
+        return None
+
+    @numba.njit(parallel=True, cache=True)
+    def _score_all_pairs_nb(
+        bpm, energy, camelot_idx, camelot_lut, genre_idx, component_ids, weights,
+        row_start, col_start, out
+    ):
+        """
+        Compiled, fused version of _score_block for large libraries.
+
+        Computes each pair's weighted score in registers instead of staging
+        component matrices; out[r, k] scores songs (row_start + r,
+        col_start + k). Rows run in parallel. The arithmetic mirrors
+        calculate_compatibility_score step by step, so results match exactly.
+        """
+        for r in numba.prange(out.shape[0]):
+            i = row_start + r
+            for k in range(out.shape[1]):
+                j = col_start + k
+                total = 0.0
+                for c in range(component_ids.shape[0]):
+                    component = component_ids[c]
+                    if component == 0:
+                        score = max(0.0, 1.0 - ((abs(bpm[i] - bpm[j]) / bpm[i]) / 0.1))
+                    elif component == 1:
+                        distance = camelot_lut[camelot_idx[i], camelot_idx[j]]
+                        score = max(0.0, 1.0 - (distance / 6.0))
+                    elif component == 2:
+                        score = max(0.0, 1.0 - abs(energy[i] - energy[j]))
+                    else:
+                        score = 1.0 if genre_idx[i] == genre_idx[j] else 0.5
+                    total += score * weights[c]
+                out[r, k] = min(1.0, max(0.0, total))
+
+    return _score_all_pairs_nb
+
+
+def _fill_score_component(
+    name: str,
+    songs: SongArrays,
+    out: np.ndarray,
+    first=(slice(None), None),
+    second=(None, slice(None))
+) -> None:
+    """
+    Write one unweighted compatibility component for a set of pairs into out.
+
+    By default the pairs are all N×N combinations (first/second broadcast
+    songs along rows/columns); passing index arrays instead scores just
+    the pairs (first[k], second[k]).
+
+    Discrete inputs stay narrow until this point: key distances come from
+    the int8 Camelot table and genre matches are a boolean mask.
+
+    Args:
+        name: Component name ("bpm" | "key" | "energy" | "genre")
+        songs: Struct-of-arrays song fields from _song_arrays
+        out: Preallocated float64 buffer shaped like the pairs
+        first: Index selecting the first song of each pair
+        second: Index selecting the second song of each pair
+    """
+    if name == "bpm":
+        # Difference is relative to the first song of the pair
+        bpm = songs["bpm"]
+        np.subtract(bpm[first], bpm[second], out=out)
+        np.abs(out, out=out)
+        np.divide(out, bpm[first], out=out)
+        np.divide(out, 0.1, out=out)
+    elif name == "key":
+        key_idx = songs["camelot_idx"]
+        key_distance = songs["camelot_lut"][key_idx[first], key_idx[second]]
+        np.divide(key_distance, 6.0, out=out)
+    elif name == "energy":
+        energy = songs["energy"]
+        np.subtract(energy[first], energy[second], out=out)
+        np.abs(out, out=out)
+    elif name == "genre":
+        genre_idx = songs["genre_idx"]
+        same_genre = genre_idx[first] == genre_idx[second]
+        np.multiply(same_genre, 0.5, out=out)
+        out += 0.5  # 1.0 for same genre, 0.5 otherwise
+        return
+    else:
+        raise KeyError(name)
+
+    # 1 - normalized difference, floored at 0
+    np.subtract(1.0, out, out=out)
+    np.maximum(out, 0, out=out)
+
+
+def _score_pairs(
+    songs: SongArrays,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    weights: dict
+) -> np.ndarray:
+    """
+    Calculate compatibility scores for the listed pairs only.
+
+    Same arithmetic as _score_matrix, so scores[k] equals
+    _score_matrix(songs, weights)[rows[k], cols[k]].
+
+    Args:
+        songs: Struct-of-arrays song fields from _song_arrays
+        rows: Index of the first song of each pair
+        cols: Index of the second song of each pair
+        weights: Compatibility component weights
+
+    Returns:
+        1-D array of compatibility scores (0.0-1.0)
+    """
+    total = np.zeros(len(rows), dtype=np.float64)
+    component = np.empty(len(rows), dtype=np.float64)
+
+    for k in weights.keys():
+        _fill_score_component(k, songs, component, rows, cols)
+        component *= weights[k]
+        total += component
+
+    return np.clip(total, 0.0, 1.0, out=total)
+
+
+def _bpm_window(weights: dict, min_compatibility: float) -> Optional[float]:
+    """
+    Largest relative BPM difference a pair can have and still pass.
+
+    Every other component contributes at most its weight, so a pair needs
+    bpm_score >= (min_compatibility - other weights) / bpm weight, i.e.
+    |bpm_a - bpm_b| / bpm_a <= 0.1 * (1 - that score).
+
+    Args:
+        weights: Compatibility component weights
+        min_compatibility: Minimum compatibility score threshold
+
+    Returns:
+        Maximum relative BPM difference (negative if no pair can pass), or
+        None when the threshold doesn't rule out any BPM difference
+    """
+    bpm_weight = weights.get("bpm", 0)
+    if bpm_weight <= 0 or any(w < 0 for w in weights.values()):
+        return None
+
+    other_weight = sum(w for k, w in weights.items() if k != "bpm")
+    required_bpm_score = (min_compatibility - other_weight) / bpm_weight
+    if required_bpm_score <= 0:
+        return None
+
+    return 0.1 * (1.0 - required_bpm_score)
+
+
+def _bpm_candidate_pairs(bpm: np.ndarray, window: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    List unique pairs (i < j) whose BPMs are within a relative window.
+
+    Songs are sorted by BPM once and each song's window is found with
+    searchsorted, so only O(N·k) pairs are produced for k neighbours per
+    window. The window is widened by a hair so float rounding never drops a
+    pair; the exact score is still checked afterwards.
+
+    Args:
+        bpm: BPM per song (all positive)
+        window: Maximum |bpm_i - bpm_j| / bpm_i
+
+    Returns:
+        (rows, cols) index arrays in row-major (i, j) order
+    """
+    if window < 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    window = window * (1 + 1e-9) + 1e-12
+    order = np.argsort(bpm, kind="stable")
+    bpm_sorted = bpm[order]
+    lo = np.searchsorted(bpm_sorted, bpm * (1 - window), side="left")
+    hi = np.searchsorted(bpm_sorted, bpm * (1 + window), side="right")
+
+    # Expand each song's [lo, hi) window into explicit (i, j) pairs
+    counts = hi - lo
+    rows = np.repeat(np.arange(len(bpm)), counts)
+    starts = np.repeat(lo - np.cumsum(counts) + counts, counts)
+    cols = order[starts + np.arange(counts.sum())]
+
+    keep = rows < cols
+    rows, cols = rows[keep], cols[keep]
+    sort = np.lexsort((cols, rows))
+    return rows[sort], cols[sort]
+
+
 def _enhance_match_result(
     result: MatchResult,
     target_meta: SongMetadata,
-    criteria: str
+    criteria: str,
+    weights: Optional[dict] = None
 ) -> MatchResult:
     """
     Enhance match result with detailed compatibility info.
@@ -451,12 +866,13 @@ def _enhance_match_result(
         result: Raw match result from query
         target_meta: Target song metadata
         criteria: Matching criteria used
+        weights: Optional weight overrides (default from config)
 
     Returns:
         Enhanced MatchResult with detailed match_reasons
     """
     # Recalculate with detailed reasons
-    score, reasons = calculate_compatibility_score(target_meta, result["metadata"])
+    score, reasons = calculate_compatibility_score(target_meta, result["metadata"], weights)
 
     # Update result
     result["compatibility_score"] = score
@@ -465,6 +881,24 @@ def _enhance_match_result(
     return result
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_camelot(camelot: str) -> Optional[tuple[int, str]]:
+    """
+    Split a Camelot key into wheel number and circle letter.
+
+    Args:
+        camelot: Camelot key (e.g., "8B")
+
+    Returns:
+        (number, letter) tuple, or None if the key is malformed
+    """
+    try:
+        return int(camelot[:-1]), camelot[-1]
+    except (ValueError, IndexError):
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
 def _calculate_camelot_distance(camelot_a: str, camelot_b: str) -> int:
     """
     Calculate distance between two Camelot keys.
@@ -486,15 +920,15 @@ def _calculate_camelot_distance(camelot_a: str, camelot_b: str) -> int:
         return 0
 
     # Parse number and letter
-    try:
-        num_a = int(camelot_a[:-1])
-        letter_a = camelot_a[-1]
-        num_b = int(camelot_b[:-1])
-        letter_b = camelot_b[-1]
-    except (ValueError, IndexError):
+    parsed_a = _parse_camelot(camelot_a)
+    parsed_b = _parse_camelot(camelot_b)
+    if parsed_a is None or parsed_b is None:
         # Invalid format, return max distance
         return 6
 
+    num_a, letter_a = parsed_a
+    num_b, letter_b = parsed_b
+
     # Calculate circular distance on wheel (1-12)
     wheel_dist = min(abs(num_a - num_b), 12 - abs(num_a - num_b))
 
@@ -508,3 +942,15 @@ def _calculate_camelot_distance(camelot_a: str, camelot_b: str) -> int:
 
     # Different circle and different number: combine distances
     return wheel_dist + 1
+
+
+# Camelot code → row/column in CAMELOT_LUT ("1A" → 0, "1B" → 1, ..., "12B" → 23)
+CAMELOT_INDEX: Dict[str, int] = {f"{i // 2 + 1}{'AB'[i % 2]}": i for i in range(24)}
+
+# Pairwise Camelot wheel distances for all 24 keys
+CAMELOT_LUT = np.empty((len(CAMELOT_INDEX), len(CAMELOT_INDEX)), dtype=np.int8)
+for _code_a, _i in CAMELOT_INDEX.items():
+    for _code_b, _j in CAMELOT_INDEX.items():
+        CAMELOT_LUT[_i, _j] = _calculate_camelot_distance(_code_a, _code_b)
+CAMELOT_LUT.flags.writeable = False
+del _code_a, _code_b, _i, _j
@@ -1,5 +1,6 @@
 """Engineer Agent - Creates mashups from analyzed songs."""
 
+import functools
 import logging
 from pathlib import Path
 from typing import Dict, Optional, List
@@ -1310,6 +1311,22 @@ def create_role_aware_mashup(
         raise EngineerError(f"Role-aware mashup creation failed: {e}")
 
 
+@functools.lru_cache(maxsize=8)
+def _silence(n_samples: int) -> np.ndarray:
+    """
+    Zero-filled float32 buffer, shared between calls.
+
+    Args:
+        n_samples: Buffer length in samples
+
+    Returns:
+        Read-only array of silence; concatenate or copy it before mutating
+    """
+    silence = np.zeros(n_samples, dtype=np.float32)
+    silence.setflags(write=False)
+    return silence
+
+
 def _process_vocal_by_role(
     vocal_audio: np.ndarray,
     inst_audio: np.ndarray,
@@ -1349,17 +1366,13 @@ def _process_vocal_by_role(
 
     elif role == "call":
         # Vocal + short silence after (0.3s)
-        silence_samples = int(0.3 * sr)
-        silence = np.zeros(silence_samples, dtype=np.float32)
         mixed = vocal_audio * 1.0 + inst_audio * 0.6
-        mixed = np.concatenate([mixed, silence])
+        mixed = np.concatenate([mixed, _silence(int(0.3 * sr))])
 
     elif role == "response":
         # Short silence before (0.2s) + vocal
-        silence_samples = int(0.2 * sr)
-        silence = np.zeros(silence_samples, dtype=np.float32)
         mixed = vocal_audio * 1.0 + inst_audio * 0.6
-        mixed = np.concatenate([silence, mixed])
+        mixed = np.concatenate([_silence(int(0.2 * sr)), mixed])
 
     elif role == "texture":
         # Heavily attenuated, rhythmic texture
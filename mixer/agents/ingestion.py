@@ -1,11 +1,12 @@
 """Ingestion Agent - Downloads and caches audio files."""
 
+import functools
 import os
 import re
 import shutil
 import logging
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict, Sequence, Union
 from urllib.parse import urlparse
 
 from mixer.config import get_config
@@ -36,6 +37,24 @@ class ValidationError(IngestionError):
     pass
 
 
+@functools.lru_cache(maxsize=512)
+def _is_youtube_url(url: str) -> bool:
+    """
+    Basic YouTube domain check on an http(s) URL.
+
+    Cached per URL string; only URLs go through here, since whether a local
+    path exists can change between calls.
+
+    Args:
+        url: http(s) URL
+
+    Returns:
+        True if the host is a youtube.com or youtu.be domain
+    """
+    netloc = urlparse(url).netloc
+    return 'youtube.com' in netloc or 'youtu.be' in netloc
+
+
 def detect_source_type(input_source: str) -> SourceType:
     """
     Detect if input is a YouTube URL or local file.
@@ -51,9 +70,7 @@ def detect_source_type(input_source: str) -> SourceType:
     """
     # Check if it's a URL
     if input_source.startswith(('http://', 'https://')):
-        parsed = urlparse(input_source)
-        # Basic YouTube domain check
-        if 'youtube.com' in parsed.netloc or 'youtu.be' in parsed.netloc:
+        if _is_youtube_url(input_source):
             return "youtube"
         else:
             raise InvalidInputError(f"URL is not a YouTube link: {input_source}")
@@ -136,32 +153,41 @@ def extract_artist_title_from_youtube_title(video_title: str) -> tuple[str, str]
     return "Unknown", video_title.strip()
 
 
-def check_cache(song_id: str) -> Optional[Dict]:
+def check_cache(song_ids: Union[str, Sequence[str]]) -> Optional[Dict]:
     """
-    Check if song is already in ChromaDB cache.
+    Check if songs are already in ChromaDB cache.
+
+    All IDs are probed with a single collection.get().
 
     Args:
-        song_id: Sanitized song ID
+        song_ids: Sanitized song ID, or several IDs (e.g. collision variants)
 
     Returns:
-        Metadata dict if cached, None otherwise
+        For a single ID: its metadata dict if cached, None otherwise.
+        For a sequence: dict mapping each cached ID to its metadata, or
+        None if none are cached.
     """
+    single = isinstance(song_ids, str)
+    ids = [song_ids] if single else list(song_ids)
+    label = f"'{song_ids}'" if single else ids
+
     try:
         client = get_client()
         collection = client.get_collection()
 
-        result = collection.get(ids=[song_id])
+        result = collection.get(ids=ids)
 
         if result['ids']:
-            logger.info(f"Song '{song_id}' found in cache")
-            metadata = result['metadatas'][0] if result['metadatas'] else {}
-            return metadata
+            logger.info(f"Song {label} found in cache")
+            metadatas = result['metadatas'] or [{}] * len(result['ids'])
+            cached = dict(zip(result['ids'], metadatas))
+            return cached[song_ids] if single else cached
 
-        logger.info(f"Song '{song_id}' not in cache")
+        logger.info(f"Song {label} not in cache")
         return None
 
     except Exception as e:
-        logger.warning(f"Error checking cache for '{song_id}': {e}")
+        logger.warning(f"Error checking cache for {label}: {e}")
         return None
 
 
@@ -345,7 +371,38 @@ def ingest_local_file(file_path: str) -> IngestionResult:
         raise
 
 
-def ingest_youtube_url(url: str) -> IngestionResult:
+def _run_ytdlp(
+    args: list[str],
+    timeout: int,
+    runner: Optional[Callable] = None,
+):
+    """
+    Run yt-dlp with captured text output.
+
+    Args:
+        args: yt-dlp arguments (without the executable)
+        timeout: Seconds before the process is killed
+        runner: subprocess.run-compatible callable; defaults to subprocess.run
+
+    Returns:
+        CompletedProcess (or whatever runner returns)
+    """
+    if runner is None:
+        import subprocess
+        runner = subprocess.run
+
+    return runner(
+        ["yt-dlp", *args],
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+
+
+def ingest_youtube_url(
+    url: str,
+    runner: Optional[Callable] = None,
+) -> IngestionResult:
     """
     Ingest audio from YouTube URL.
 
@@ -359,6 +416,7 @@ def ingest_youtube_url(url: str) -> IngestionResult:
 
     Args:
         url: YouTube URL
+        runner: subprocess.run-compatible callable used for yt-dlp
 
     Returns:
         IngestionResult with id, path, cached status
@@ -378,18 +436,10 @@ def ingest_youtube_url(url: str) -> IngestionResult:
 
     # First, extract metadata without downloading
     try:
-        metadata_cmd = [
-            "yt-dlp",
-            "--dump-json",
-            "--no-playlist",
-            url
-        ]
-
-        result = subprocess.run(
-            metadata_cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
+        result = _run_ytdlp(
+            ["--dump-json", "--no-playlist", url],
+            timeout=30,
+            runner=runner
         )
 
         if result.returncode != 0:
@@ -431,8 +481,7 @@ def ingest_youtube_url(url: str) -> IngestionResult:
     output_template = str(library_cache / output_filename)
 
     try:
-        download_cmd = [
-            "yt-dlp",
+        download_args = [
             "--extract-audio",
             "--audio-format", "wav",
             "--audio-quality", "0",  # Best quality
@@ -442,11 +491,10 @@ def ingest_youtube_url(url: str) -> IngestionResult:
         ]
 
         logger.info("Downloading audio...")
-        result = subprocess.run(
-            download_cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout
+        result = _run_ytdlp(
+            download_args,
+            timeout=600,  # 10 minute timeout
+            runner=runner
         )
 
         if result.returncode != 0:
@@ -548,7 +596,11 @@ def extract_playlist_info(playlist_url: str) -> list[dict]:
         raise DownloadError(f"Unexpected error extracting playlist: {e}")
 
 
-def ingest_song(input_source: str, max_retries: int = 3) -> IngestionResult:
+def ingest_song(
+    input_source: str,
+    max_retries: int = 3,
+    runner: Optional[Callable] = None,
+) -> IngestionResult:
     """
     Ingest audio from YouTube URL or local file.
 
@@ -557,6 +609,8 @@ def ingest_song(input_source: str, max_retries: int = 3) -> IngestionResult:
     Args:
         input_source: YouTube URL or absolute file path
         max_retries: Number of retry attempts for network operations
+        runner: subprocess.run-compatible callable for yt-dlp (tests pass
+            a fake; defaults to subprocess.run)
 
     Returns:
         IngestionResult with keys: id, path, cached, source, metadata
@@ -579,7 +633,7 @@ def ingest_song(input_source: str, max_retries: int = 3) -> IngestionResult:
 
         for attempt in range(1, max_retries + 1):
             try:
-                return ingest_youtube_url(input_source)
+                return ingest_youtube_url(input_source, runner=runner)
 
             except DownloadError as e:
                 last_error = e
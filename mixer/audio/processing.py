@@ -5,7 +5,6 @@ import os
 from pathlib import Path
 from typing import Dict, Tuple
 import numpy as np
-import torch
 import pyrubberband as pyrb
 from pydub import AudioSegment
 from pydub.effects import normalize
@@ -39,6 +38,7 @@ def separate_stems(
         from demucs.pretrained import get_model
         from demucs.apply import apply_model
         from demucs.audio import convert_audio
+        import torch
         import torchaudio
 
         logger.info(f"Loading Demucs model: {model_name}")
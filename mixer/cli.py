@@ -20,7 +20,7 @@ from mixer.agents import (
     EngineerError,
 )
 from mixer.workflow import run_mashup_workflow, WorkflowError
-from mixer.memory import get_client, get_song
+from mixer.memory import get_client, get_song, get_songs
 
 console = Console()
 logger = get_logger(__name__)
@@ -217,6 +217,7 @@ def ingest(ctx: click.Context, input_source: str | None, folder: str | None, pla
 
             analyzed = 0
             analysis_failed = 0
+            songs = get_songs(ingested)
 
             with Progress(
                 SpinnerColumn(),
@@ -231,7 +232,7 @@ def ingest(ctx: click.Context, input_source: str | None, folder: str | None, pla
                     progress.update(task, description=f"Analyzing: {song_id}")
 
                     try:
-                        song_data = get_song(song_id)
+                        song_data = songs.get(song_id)
                         if song_data:
                             profile_audio(song_data['metadata']['path'])
                             analyzed += 1
@@ -349,6 +350,7 @@ def ingest(ctx: click.Context, input_source: str | None, folder: str | None, pla
 
                 analyzed = 0
                 analysis_failed = 0
+                songs = get_songs(ingested)
 
                 with Progress(
                     SpinnerColumn(),
@@ -363,7 +365,7 @@ def ingest(ctx: click.Context, input_source: str | None, folder: str | None, pla
                         progress.update(task, description=f"Analyzing: {song_id}")
 
                         try:
-                            song_data = get_song(song_id)
+                            song_data = songs.get(song_id)
                             if song_data:
                                 profile_audio(song_data['metadata']['path'])
                                 analyzed += 1
@@ -412,9 +414,7 @@ def analyze(ctx: click.Context, batch: bool, song_id: str | None) -> None:
             un_profiled = []
             for song_id_iter, metadata in zip(all_songs["ids"], all_songs["metadatas"]):
                 if not metadata.get("sections"):
-                    song_data = get_song(song_id_iter)
-                    if song_data:
-                        un_profiled.append((song_id_iter, song_data["metadata"]["path"]))
+                    un_profiled.append((song_id_iter, metadata["path"]))
 
             if not un_profiled:
                 console.print("[yellow]No un-profiled songs found![/yellow]")
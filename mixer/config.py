@@ -1,11 +1,142 @@
 """Configuration management for The Mixer."""
 
+import copy
+import functools
+import hashlib
+import json
 import os
 import yaml
 from pathlib import Path
 from typing import Any, Dict
 from mixer.types import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Absolute paths of directories already created by a ConfigManager in this process
+_created_dirs: set[str] = set()
+
+
+# Opt-in on-disk cache of parsed config files: when this environment
+# variable names a directory, each YAML parse is kept there as JSON, which
+# loads several times faster than YAML, even with libyaml
+CONFIG_CACHE_DIR_ENV = "MIXER_CONFIG_CACHE_DIR"
+_SIDECAR_MISS = object()
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _content_hash(data: bytes) -> str:
+    """Short digest identifying a file's exact contents."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _config_sidecar_path(path: str) -> Path | None:
+    """Where the JSON cache for a config file lives, or None if disabled.
+
+    Sidecars go in the directory named by MIXER_CONFIG_CACHE_DIR, never
+    next to the user's config, keyed by a digest of the file's path.
+    """
+    cache_dir = os.environ.get(CONFIG_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / f"{_content_hash(path.encode())}.json"
+
+
+def _read_config_sidecar(sidecar: Path, source_hash: str) -> Any:
+    """Return the cached parse if the sidecar was written for these YAML bytes.
+
+    Returns:
+        Parsed config, or _SIDECAR_MISS if the sidecar is absent, stale or unreadable.
+    """
+    try:
+        payload = _json_loads(sidecar.read_bytes())
+    except (OSError, ValueError):
+        return _SIDECAR_MISS
+
+    if not isinstance(payload, dict) or payload.get("source_hash") != source_hash:
+        return _SIDECAR_MISS
+    return payload.get("config")
+
+
+def _write_config_sidecar(sidecar: Path, source_hash: str, loaded: Any) -> None:
+    """Best-effort write of the JSON sidecar for a freshly parsed YAML file.
+
+    Skipped when the document doesn't survive a JSON round trip unchanged
+    (e.g. dates or non-string keys) or the cache directory isn't writable.
+    """
+    payload = {"source_hash": source_hash, "config": loaded}
+    try:
+        data = _json_dumps(payload)
+        if _json_loads(data) != payload:
+            return
+
+        # Write then rename so concurrent readers never see a partial file
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoized on its path, modification time and size.
+
+    With MIXER_CONFIG_CACHE_DIR set, reads the JSON sidecar instead when it
+    was written for exactly these file contents (compared by hash, so edits
+    that keep the mtime are still seen), and refreshes it after a real parse.
+
+    Args:
+        path: Path to the YAML file.
+        mtime_ns: File modification time; a changed file gets a new cache key.
+        size: File size in bytes; also part of the cache key.
+
+    Returns:
+        Parsed YAML document. Shared between callers, so copy before mutating.
+    """
+    # Whole-file read skips the buffered text layer; PyYAML decodes bytes itself
+    data = Path(path).read_bytes()
+
+    sidecar = _config_sidecar_path(path)
+    if sidecar is None:
+        return yaml.load(data, Loader=_YAML_LOADER)
+
+    source_hash = _content_hash(data)
+    cached = _read_config_sidecar(sidecar, source_hash)
+    if cached is not _SIDECAR_MISS:
+        return cached
+
+    loaded = yaml.load(data, Loader=_YAML_LOADER)
+    _write_config_sidecar(sidecar, source_hash, loaded)
+    return loaded
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key_path(key_path: str) -> tuple[str, ...]:
+    """Split a dot-notation key path, memoized across calls."""
+    return tuple(key_path.split("."))
+
 
 class ConfigError(Exception):
     """Configuration-related errors."""
@@ -78,6 +209,8 @@ class ConfigManager:
         """
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
         self.config = self._load_config()
+        # Bumped by set() so caches keyed on this instance see the change
+        self.version = 0
         self._ensure_directories()
 
     def _load_config(self) -> Config:
@@ -94,8 +227,12 @@ class ConfigManager:
             return self.DEFAULT_CONFIG.copy()
 
         try:
-            with open(self.config_path, 'r') as f:
-                loaded_config = yaml.safe_load(f)
+            stat = self.config_path.stat()
+            loaded_config = copy.deepcopy(_load_yaml_cached(
+                str(self.config_path.resolve()),
+                stat.st_mtime_ns,
+                stat.st_size,
+            ))
 
             if not loaded_config:
                 print(f"Warning: Empty config file at {self.config_path}. Using defaults.")
@@ -121,12 +258,17 @@ class ConfigManager:
             Merged dictionary.
         """
         result = base.copy()
-
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        stack = [(result, override)]
+
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                    # Copy before descending so base's nested dicts stay untouched
+                    dst[key] = dst[key].copy()
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
 
         return result
 
@@ -135,9 +277,10 @@ class ConfigManager:
         paths = self.config["paths"]
 
         for path_key, path_value in paths.items():
-            path = Path(path_value)
-            if not path.exists():
-                path.mkdir(parents=True, exist_ok=True)
+            path = os.path.abspath(path_value)
+            if path not in _created_dirs:
+                os.makedirs(path, exist_ok=True)
+                _created_dirs.add(path)
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation.
@@ -155,7 +298,7 @@ class ConfigManager:
             >>> config.get("llm.anthropic_model")
             'claude-3-5-sonnet-20241022'
         """
-        keys = key_path.split(".")
+        keys = _split_key_path(key_path)
         value = self.config
 
         for key in keys:
@@ -173,7 +316,7 @@ class ConfigManager:
             key_path: Dot-separated path (e.g., "logging.level").
             value: Value to set.
         """
-        keys = key_path.split(".")
+        keys = _split_key_path(key_path)
         config = self.config
 
         for key in keys[:-1]:
@@ -182,6 +325,7 @@ class ConfigManager:
             config = config[key]
 
         config[keys[-1]] = value
+        self.version += 1
 
     def get_path(self, path_key: str) -> Path:
         """Get an absolute path from configuration.
@@ -208,7 +352,13 @@ class ConfigManager:
 
         try:
             with open(save_path, 'w') as f:
-                yaml.safe_dump(self.config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    self.config,
+                    f,
+                    Dumper=_YAML_DUMPER,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
         except Exception as e:
             raise ConfigError(f"Failed to save config: {e}")
 
@@ -238,3 +388,5 @@ def reset_config() -> None:
     """Reset global configuration instance. Useful for testing."""
     global _config_instance
     _config_instance = None
+    _load_yaml_cached.cache_clear()
+    _created_dirs.clear()
@@ -22,7 +22,9 @@ from mixer.memory.schema import (
 from mixer.memory.queries import (
     QueryError,
     upsert_song,
+    upsert_songs_batch,
     get_song,
+    get_songs,
     delete_song,
     query_harmonic,
     query_semantic,
@@ -49,7 +51,9 @@ __all__ = [
     # Queries
     "QueryError",
     "upsert_song",
+    "upsert_songs_batch",
     "get_song",
+    "get_songs",
     "delete_song",
     "query_harmonic",
     "query_semantic",
@@ -1,19 +1,16 @@
 """ChromaDB client initialization and management."""
 
+import functools
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-try:
+from mixer.config import get_config
+
+if TYPE_CHECKING:
     import chromadb
-    from chromadb.config import Settings
     from chromadb.api.models.Collection import Collection
-except ImportError:
-    raise ImportError(
-        "ChromaDB not installed. Run: pip install chromadb==0.4.22"
-    )
-
-from mixer.config import get_config
+    from chromadb.api.types import EmbeddingFunction
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +20,26 @@ class ChromaClientError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _embedding_function(model_name: str) -> "EmbeddingFunction":
+    """Embedding function for a model, shared by every client in the process.
+
+    Chroma's default ONNX MiniLM function loads its model lazily on the
+    first call and keeps it on the instance, so reusing one instance pays
+    the load once instead of once per client.
+
+    Args:
+        model_name: Embedding model identifier (cache key)
+
+    Returns:
+        Chroma embedding function instance
+    """
+    from chromadb.utils import embedding_functions
+
+    logger.debug(f"Creating embedding function for {model_name}")
+    return embedding_functions.DefaultEmbeddingFunction()
+
+
 class ChromaClient:
     """Manages ChromaDB client and collection for The Mixer.
 
@@ -34,23 +51,46 @@ class ChromaClient:
     EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
     EMBEDDING_DIMENSIONS = 384
 
-    def __init__(self, persist_directory: Optional[Path] = None):
+    def __init__(
+        self,
+        persist_directory: Optional[Path] = None,
+        client: Optional["chromadb.Client"] = None,
+        preload_model: bool = False,
+        hnsw_config: Optional[Dict[str, Any]] = None,
+    ):
         """Initialize ChromaDB client.
 
         Args:
             persist_directory: Path to ChromaDB storage. If None, uses config.
+            client: Pre-built ChromaDB client (e.g. an in-memory
+                EphemeralClient for tests). If given, no PersistentClient
+                is created and persist_directory is left as passed.
+            preload_model: Load the embedding model now instead of on the
+                first upsert or query.
+            hnsw_config: "hnsw:*" index settings (e.g. "hnsw:M",
+                "hnsw:construction_ef") applied when the collection is
+                created. None keeps ChromaDB's defaults.
 
         Raises:
             ChromaClientError: If client initialization fails
         """
-        config = get_config()
+        self._client: Optional["chromadb.Client"] = None
+        self._collection: Optional["Collection"] = None
+        self.hnsw_config = dict(hnsw_config or {})
+
+        if preload_model:
+            self.preload_embedding_model()
+
+        if client is not None:
+            self.persist_directory = persist_directory
+            self._client = client
+            logger.info("Using provided ChromaDB client")
+            return
 
         if persist_directory is None:
-            persist_directory = config.get_path("chroma_db")
+            persist_directory = get_config().get_path("chroma_db")
 
         self.persist_directory = persist_directory
-        self._client: Optional[chromadb.Client] = None
-        self._collection: Optional[Collection] = None
 
         logger.info(f"Initializing ChromaDB client at {self.persist_directory}")
         self._initialize_client()
@@ -61,6 +101,16 @@ class ChromaClient:
         Raises:
             ChromaClientError: If initialization fails
         """
+        # chromadb is imported on first client creation; loading it pulls in
+        # fastapi/onnxruntime and dominates `import mixer.memory` otherwise
+        try:
+            import chromadb
+            from chromadb.config import Settings
+        except ImportError:
+            raise ImportError(
+                "ChromaDB not installed. Run: pip install chromadb==0.4.22"
+            )
+
         try:
             # Ensure directory exists
             self.persist_directory.mkdir(parents=True, exist_ok=True)
@@ -70,7 +120,7 @@ class ChromaClient:
                 path=str(self.persist_directory),
                 settings=Settings(
                     anonymized_telemetry=False,
-                    allow_reset=True,
+                    allow_reset=False,  # reset_collection() only drops our collection
                 )
             )
 
@@ -79,7 +129,18 @@ class ChromaClient:
         except Exception as e:
             raise ChromaClientError(f"Failed to initialize ChromaDB client: {e}")
 
-    def get_collection(self) -> Collection:
+    def preload_embedding_model(self) -> None:
+        """Load the shared embedding model by embedding a short string.
+
+        Raises:
+            ChromaClientError: If the model cannot be loaded
+        """
+        try:
+            _embedding_function(self.EMBEDDING_MODEL)(["warmup"])
+        except Exception as e:
+            raise ChromaClientError(f"Failed to load embedding model: {e}")
+
+    def get_collection(self) -> "Collection":
         """Get or create the tiki_library collection.
 
         Returns:
@@ -98,10 +159,12 @@ class ChromaClient:
             # Try to get existing collection
             self._collection = self._client.get_or_create_collection(
                 name=self.COLLECTION_NAME,
+                embedding_function=_embedding_function(self.EMBEDDING_MODEL),
                 metadata={
                     "description": "The Mixer music library",
                     "embedding_model": self.EMBEDDING_MODEL,
                     "embedding_dimensions": self.EMBEDDING_DIMENSIONS,
+                    **self.hnsw_config,
                 }
             )
 
@@ -1,7 +1,7 @@
 """Query operations for ChromaDB music library."""
 
 import logging
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from mixer.types import SongMetadata, MatchResult
 from mixer.memory.client import get_client
 from mixer.memory.schema import (
@@ -15,6 +15,9 @@ from mixer.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Maximum ids per collection.get() call when fetching songs in bulk
+GET_BATCH_SIZE = 256
+
 
 class QueryError(Exception):
     """Query operation errors."""
@@ -43,47 +46,93 @@ def upsert_song(
     Raises:
         QueryError: If upsert operation fails
     """
-    try:
-        # Validate metadata
-        validate_metadata(metadata)
+    return upsert_songs_batch(
+        [(artist, title, metadata, transcript)], force_ids=[force_id]
+    )[0]
 
-        # Generate or use provided ID
-        if force_id:
-            song_id = force_id
-        else:
-            song_id = sanitize_id(artist, title)
 
-        # Check for ID collision
-        client = get_client()
-        collection = client.get_collection()
-        existing = collection.get(ids=[song_id])
+def upsert_songs_batch(
+    items: List[Tuple[str, str, SongMetadata, str]],
+    force_ids: Optional[List[Optional[str]]] = None,
+) -> List[str]:
+    """Insert or update several songs with a single ChromaDB write.
+
+    IDs come from sanitize_id(artist, title) and get a version suffix when
+    already stored or repeated in the batch. All documents are embedded and
+    written in one collection.upsert() call.
+
+    Args:
+        items: (artist, title, metadata, transcript) tuples
+        force_ids: Optional per-item IDs, parallel to items. A non-empty
+            entry is used as-is and overwrites any song stored under it.
+
+    Returns:
+        Song IDs used for storage, in input order
 
-        if existing["ids"] and not force_id:
-            # Handle collision
-            all_ids = collection.get()["ids"]
-            song_id = handle_id_collision(song_id, all_ids)
-            logger.warning(f"ID collision detected. Using {song_id}")
+    Raises:
+        QueryError: If any metadata is invalid or the upsert fails
+    """
+    if not items:
+        return []
 
-        # Add timestamp if not present
-        if "date_added" not in metadata:
-            metadata["date_added"] = generate_timestamp()
+    try:
+        for _, _, metadata, _ in items:
+            validate_metadata(metadata)
 
-        # Create document for embedding
-        mood_summary = metadata.get("mood_summary", "")
-        document = create_document(transcript, mood_summary)
+        client = get_client()
+        collection = client.get_collection()
+
+        forced = force_ids or [None] * len(items)
+        base_ids = [
+            force_id or sanitize_id(artist, title)
+            for force_id, (artist, title, _, _) in zip(forced, items)
+        ]
+        auto_ids = [
+            base_id for base_id, force_id in zip(base_ids, forced) if not force_id
+        ]
+
+        # Forced IDs are claimed up front so no auto ID lands on one
+        taken = {force_id for force_id in forced if force_id}
+        if auto_ids and (
+            len(set(base_ids)) < len(base_ids)
+            or collection.get(ids=list(dict.fromkeys(auto_ids)))["ids"]
+        ):
+            taken.update(collection.get()["ids"])
+
+        song_ids = []
+        documents = []
+        metadatas = []
+        for base_id, force_id, (_, _, metadata, transcript) in zip(
+            base_ids, forced, items
+        ):
+            if force_id:
+                song_id = force_id
+            else:
+                song_id = handle_id_collision(base_id, taken)
+                if song_id != base_id:
+                    logger.warning(f"ID collision detected. Using {song_id}")
+            taken.add(song_id)
+
+            if "date_added" not in metadata:
+                metadata["date_added"] = generate_timestamp()
+
+            song_ids.append(song_id)
+            documents.append(
+                create_document(transcript, metadata.get("mood_summary", ""))
+            )
+            metadatas.append(metadata)
 
-        # Upsert to ChromaDB
         collection.upsert(
-            ids=[song_id],
-            documents=[document],
-            metadatas=[metadata],
+            ids=song_ids,
+            documents=documents,
+            metadatas=metadatas,
         )
 
-        logger.info(f"Song upserted: {song_id} ({artist} - {title})")
-        return song_id
+        logger.info(f"Songs upserted: {len(song_ids)}")
+        return song_ids
 
     except Exception as e:
-        raise QueryError(f"Failed to upsert song: {e}")
+        raise QueryError(f"Failed to upsert songs: {e}")
 
 
 def get_song(song_id: str) -> Optional[dict]:
@@ -120,6 +169,48 @@ def get_song(song_id: str) -> Optional[dict]:
         raise QueryError(f"Failed to get song: {e}")
 
 
+def get_songs(song_ids: List[str]) -> Dict[str, dict]:
+    """Retrieve several songs by ID with batched queries.
+
+    Issues one collection.get() per GET_BATCH_SIZE ids instead of one per
+    song. Missing ids are left out of the result.
+
+    Args:
+        song_ids: Song identifiers
+
+    Returns:
+        Dictionary mapping song ID to a dict with 'id', 'metadata', 'document'
+
+    Raises:
+        QueryError: If query fails
+    """
+    try:
+        client = get_client()
+        collection = client.get_collection()
+
+        songs = {}
+        unique_ids = list(dict.fromkeys(song_ids))
+        for start in range(0, len(unique_ids), GET_BATCH_SIZE):
+            result = collection.get(
+                ids=unique_ids[start:start + GET_BATCH_SIZE],
+                include=["metadatas", "documents"]
+            )
+
+            for song_id, metadata, document in zip(
+                result["ids"], result["metadatas"], result["documents"]
+            ):
+                songs[song_id] = {
+                    "id": song_id,
+                    "metadata": metadata,
+                    "document": document,
+                }
+
+        return songs
+
+    except Exception as e:
+        raise QueryError(f"Failed to get songs: {e}")
+
+
 def delete_song(song_id: str) -> bool:
     """Delete a song from ChromaDB.
 
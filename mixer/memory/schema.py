@@ -1,7 +1,7 @@
 """Schema validation and ID sanitization for ChromaDB."""
 
 import re
-from typing import Optional
+from typing import Collection, Optional
 from datetime import datetime
 from mixer.types import SongMetadata
 
@@ -11,6 +11,40 @@ class SchemaError(Exception):
     pass
 
 
+# validate_metadata lookup tables, built once instead of on every upsert
+_REQUIRED_FIELDS = (
+    "source", "path", "artist", "title", "sample_rate",
+    "duration_sec", "has_vocals", "primary_genre", "genres",
+    "mood_summary", "energy_level", "valence", "irony_score",
+)
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+_VALID_SOURCES = frozenset({"youtube", "local_file"})
+_VALID_SAMPLE_RATES = frozenset({22050, 44100, 48000, 96000})
+_SCORE_FIELDS = ("irony_score", "energy_level", "valence")
+
+# sanitize_id / extract_artist_title_from_filename patterns
+_NON_ID_CHARS = re.compile(r'[^a-z0-9_]')
+_MULTI_UNDERSCORE = re.compile(r'_+')
+_AUDIO_EXTENSION = re.compile(r'\.(mp3|wav|flac|m4a|ogg)$', re.IGNORECASE)
+
+# Camelot wheel <-> traditional key notation
+_CAMELOT_TO_KEY = {
+    "1A": "Abmin", "1B": "Bmaj",
+    "2A": "Ebmin", "2B": "F#maj",
+    "3A": "Bbmin", "3B": "Dbmaj",
+    "4A": "Fmin", "4B": "Abmaj",
+    "5A": "Cmin", "5B": "Ebmaj",
+    "6A": "Gmin", "6B": "Bbmaj",
+    "7A": "Dmin", "7B": "Fmaj",
+    "8A": "Amin", "8B": "Cmaj",
+    "9A": "Emin", "9B": "Gmaj",
+    "10A": "Bmin", "10B": "Dmaj",
+    "11A": "F#min", "11B": "Amaj",
+    "12A": "C#min", "12B": "Emaj",
+}
+_KEY_TO_CAMELOT = {key: camelot for camelot, key in _CAMELOT_TO_KEY.items()}
+
+
 def sanitize_id(artist: str, title: str) -> str:
     """Sanitize artist and title into a valid ChromaDB ID.
 
@@ -38,20 +72,9 @@ def sanitize_id(artist: str, title: str) -> str:
     if not artist or not title:
         raise SchemaError("Artist and title cannot be empty")
 
-    # Combine artist and title
-    combined = f"{artist}_{title}"
-
-    # Lowercase
-    combined = combined.lower()
-
-    # Replace spaces with underscores
-    combined = combined.replace(" ", "_")
-
-    # Remove special characters (keep only a-z, 0-9, _)
-    combined = re.sub(r'[^a-z0-9_]', '', combined)
-
-    # Remove consecutive underscores
-    combined = re.sub(r'_+', '_', combined)
+    # Lowercase, spaces to underscores, keep only a-z, 0-9, _, collapse runs
+    combined = f"{artist}_{title}".lower().replace(" ", "_")
+    combined = _MULTI_UNDERSCORE.sub("_", _NON_ID_CHARS.sub("", combined))
 
     # Remove leading/trailing underscores
     combined = combined.strip("_")
@@ -76,33 +99,20 @@ def validate_metadata(metadata: SongMetadata) -> None:
     Raises:
         SchemaError: If metadata is invalid
     """
-    required_fields = [
-        "source", "path", "artist", "title", "sample_rate",
-        "duration_sec", "has_vocals", "primary_genre", "genres",
-        "mood_summary", "energy_level", "valence", "irony_score"
-    ]
-
-    # Check required fields
-    for field in required_fields:
-        if field not in metadata:
-            raise SchemaError(f"Missing required field: {field}")
+    # Check required fields (one C-level subset test on the common path)
+    if not metadata.keys() >= _REQUIRED_FIELD_SET:
+        missing = next(f for f in _REQUIRED_FIELDS if f not in metadata)
+        raise SchemaError(f"Missing required field: {missing}")
 
     # Validate source type
-    if metadata["source"] not in ["youtube", "local_file"]:
+    if metadata["source"] not in _VALID_SOURCES:
         raise SchemaError(f"Invalid source: {metadata['source']}. Must be 'youtube' or 'local_file'")
 
     # Validate numeric ranges
-    if metadata.get("irony_score") is not None:
-        if not (0 <= metadata["irony_score"] <= 10):
-            raise SchemaError(f"irony_score must be 0-10, got {metadata['irony_score']}")
-
-    if metadata.get("energy_level") is not None:
-        if not (0 <= metadata["energy_level"] <= 10):
-            raise SchemaError(f"energy_level must be 0-10, got {metadata['energy_level']}")
-
-    if metadata.get("valence") is not None:
-        if not (0 <= metadata["valence"] <= 10):
-            raise SchemaError(f"valence must be 0-10, got {metadata['valence']}")
+    for field in _SCORE_FIELDS:
+        value = metadata[field]
+        if value is not None and not (0 <= value <= 10):
+            raise SchemaError(f"{field} must be 0-10, got {value}")
 
     # Validate BPM range (if present)
     if metadata.get("bpm") is not None:
@@ -110,10 +120,9 @@ def validate_metadata(metadata: SongMetadata) -> None:
             raise SchemaError(f"bpm must be 20-300, got {metadata['bpm']}")
 
     # Validate sample rate
-    valid_sample_rates = [22050, 44100, 48000, 96000]
-    if metadata["sample_rate"] not in valid_sample_rates:
+    if metadata["sample_rate"] not in _VALID_SAMPLE_RATES:
         raise SchemaError(
-            f"sample_rate must be one of {valid_sample_rates}, got {metadata['sample_rate']}"
+            f"sample_rate must be one of {sorted(_VALID_SAMPLE_RATES)}, got {metadata['sample_rate']}"
         )
 
     # Validate duration
@@ -159,12 +168,13 @@ def generate_timestamp() -> str:
     return datetime.utcnow().isoformat() + "Z"
 
 
-def handle_id_collision(base_id: str, existing_ids: list[str]) -> str:
+def handle_id_collision(base_id: str, existing_ids: Collection[str]) -> str:
     """Handle ID collision by appending version suffix.
 
     Args:
         base_id: Base sanitized ID
-        existing_ids: List of existing IDs in ChromaDB
+        existing_ids: Existing IDs in ChromaDB. Anything other than a set
+            is copied into one, so each version probe is O(1).
 
     Returns:
         Unique ID with version suffix if needed
@@ -175,6 +185,9 @@ def handle_id_collision(base_id: str, existing_ids: list[str]) -> str:
         >>> handle_id_collision("artist_song", ["artist_song", "artist_song_v2"])
         'artist_song_v3'
     """
+    if not isinstance(existing_ids, (set, frozenset)):
+        existing_ids = set(existing_ids)
+
     if base_id not in existing_ids:
         return base_id
 
@@ -212,7 +225,7 @@ def extract_artist_title_from_filename(filename: str) -> tuple[str, str]:
         ('Unknown', 'unknown_song')
     """
     # Remove file extension
-    name_without_ext = re.sub(r'\.(mp3|wav|flac|m4a|ogg)$', '', filename, flags=re.IGNORECASE)
+    name_without_ext = _AUDIO_EXTENSION.sub('', filename)
 
     # Try "Artist - Title" format
     if " - " in name_without_ext:
@@ -240,26 +253,11 @@ def camelot_to_key(camelot: str) -> str:
     Raises:
         SchemaError: If camelot notation is invalid
     """
-    camelot_map = {
-        "1A": "Abmin", "1B": "Bmaj",
-        "2A": "Ebmin", "2B": "F#maj",
-        "3A": "Bbmin", "3B": "Dbmaj",
-        "4A": "Fmin", "4B": "Abmaj",
-        "5A": "Cmin", "5B": "Ebmaj",
-        "6A": "Gmin", "6B": "Bbmaj",
-        "7A": "Dmin", "7B": "Fmaj",
-        "8A": "Amin", "8B": "Cmaj",
-        "9A": "Emin", "9B": "Gmaj",
-        "10A": "Bmin", "10B": "Dmaj",
-        "11A": "F#min", "11B": "Amaj",
-        "12A": "C#min", "12B": "Emaj",
-    }
-
-    if camelot not in camelot_map:
+    try:
+        return _CAMELOT_TO_KEY[camelot]
+    except KeyError:
         raise SchemaError(f"Invalid Camelot notation: {camelot}")
 
-    return camelot_map[camelot]
-
 
 def key_to_camelot(key: str) -> str:
     """Convert traditional key notation to Camelot notation.
@@ -273,22 +271,7 @@ def key_to_camelot(key: str) -> str:
     Raises:
         SchemaError: If key notation is invalid
     """
-    key_map = {
-        "Abmin": "1A", "Bmaj": "1B",
-        "Ebmin": "2A", "F#maj": "2B",
-        "Bbmin": "3A", "Dbmaj": "3B",
-        "Fmin": "4A", "Abmaj": "4B",
-        "Cmin": "5A", "Ebmaj": "5B",
-        "Gmin": "6A", "Bbmaj": "6B",
-        "Dmin": "7A", "Fmaj": "7B",
-        "Amin": "8A", "Cmaj": "8B",
-        "Emin": "9A", "Gmaj": "9B",
-        "Bmin": "10A", "Dmaj": "10B",
-        "F#min": "11A", "Amaj": "11B",
-        "C#min": "12A", "Emaj": "12B",
-    }
-
-    if key not in key_map:
+    try:
+        return _KEY_TO_CAMELOT[key]
+    except KeyError:
         raise SchemaError(f"Invalid key notation: {key}")
-
-    return key_map[key]
@@ -1,6 +1,5 @@
 """LangGraph Workflow Orchestration - Phase 5."""
 
-from mixer.workflow.graph import create_mashup_workflow, run_mashup_workflow, WorkflowError
 from mixer.workflow.state import MashupState, WorkflowStatus
 
 __all__ = [
@@ -10,3 +9,15 @@ __all__ = [
     "MashupState",
     "WorkflowStatus",
 ]
+
+# Graph exports are resolved on first access so that importing the state,
+# nodes or conditions submodules does not load LangGraph.
+_GRAPH_EXPORTS = frozenset({"create_mashup_workflow", "run_mashup_workflow", "WorkflowError"})
+
+
+def __getattr__(name):
+    if name in _GRAPH_EXPORTS:
+        from mixer.workflow import graph
+
+        return getattr(graph, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
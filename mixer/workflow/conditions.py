@@ -0,0 +1,38 @@
+"""Conditional edge functions for the mashup workflow graph.
+
+Kept apart from ``graph`` so they can be imported (and tested) without
+loading LangGraph.
+"""
+
+from typing import Literal
+from mixer.workflow.state import MashupState
+
+
+def should_continue_after_error(state: MashupState) -> Literal["retry", "end"]:
+    """Conditional edge: determine if workflow should retry or end after error."""
+    if state.get("error") is None:
+        # Error was cleared by error handler, retry from current step
+        return "retry"
+    else:
+        # Max retries exceeded, end workflow
+        return "end"
+
+
+def should_find_matches(state: MashupState) -> Literal["find_matches", "recommend_type"]:
+    """Conditional edge: determine if we need to find matches or proceed to recommendation."""
+    if state.get("song_b_id"):
+        # Song B provided, skip curation
+        return "recommend_type"
+    else:
+        # Need to find matches for song A
+        return "find_matches"
+
+
+def has_match_selected(state: MashupState) -> Literal["await_selection", "recommend_type"]:
+    """Conditional edge: check if a match has been selected."""
+    if state.get("song_b_id"):
+        # Match selected (either auto-selected or by user)
+        return "recommend_type"
+    else:
+        # Still waiting for user selection
+        return "await_selection"
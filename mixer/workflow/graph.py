@@ -1,9 +1,14 @@
 """LangGraph workflow definition for mashup creation pipeline."""
 
 import logging
-from typing import Dict, Any, Literal
+from typing import Dict, Any
 from langgraph.graph import StateGraph, END
 from mixer.workflow.state import MashupState, WorkflowStatus
+from mixer.workflow.conditions import (
+    should_continue_after_error,
+    should_find_matches,
+    has_match_selected,
+)
 from mixer.workflow.nodes import (
     ingest_song_a_node,
     analyze_song_a_node,
@@ -17,37 +22,17 @@ from mixer.workflow.nodes import (
     error_handler_node,
 )
 
-logger = logging.getLogger(__name__)
-
+__all__ = [
+    "create_mashup_workflow",
+    "run_mashup_workflow",
+    "WorkflowError",
+    # Edge functions, re-exported from conditions for existing importers
+    "should_continue_after_error",
+    "should_find_matches",
+    "has_match_selected",
+]
 
-def should_continue_after_error(state: MashupState) -> Literal["retry", "end"]:
-    """Conditional edge: determine if workflow should retry or end after error."""
-    if state.get("error") is None:
-        # Error was cleared by error handler, retry from current step
-        return "retry"
-    else:
-        # Max retries exceeded, end workflow
-        return "end"
-
-
-def should_find_matches(state: MashupState) -> Literal["find_matches", "recommend_type"]:
-    """Conditional edge: determine if we need to find matches or proceed to recommendation."""
-    if state.get("song_b_id"):
-        # Song B provided, skip curation
-        return "recommend_type"
-    else:
-        # Need to find matches for song A
-        return "find_matches"
-
-
-def has_match_selected(state: MashupState) -> Literal["await_selection", "recommend_type"]:
-    """Conditional edge: check if a match has been selected."""
-    if state.get("song_b_id"):
-        # Match selected (either auto-selected or by user)
-        return "recommend_type"
-    else:
-        # Still waiting for user selection
-        return "await_selection"
+logger = logging.getLogger(__name__)
 
 
 def create_mashup_workflow() -> StateGraph:
@@ -10,10 +10,8 @@ from mixer.agents import (
     recommend_mashup_type,
     calculate_compatibility_score,
     create_classic_mashup,
-    create_stem_swap_mashup,
     create_energy_matched_mashup,
     create_adaptive_harmony_mashup,
-    create_theme_fusion_mashup,
     create_semantic_aligned_mashup,
     create_role_aware_mashup,
     create_conversational_mashup,
@@ -364,13 +362,22 @@ def create_mashup_node(state: MashupState) -> Dict[str, Any]:
         song_a_id = state["song_a_id"]
         song_b_id = state["song_b_id"]
 
+        # Types whose engineer functions need more than two song IDs
+        unsupported_types = {
+            "STEM_SWAP": "needs a per-stem song mapping (3+ songs)",
+            "THEME_FUSION": "needs a target theme",
+        }
+        if mashup_type in unsupported_types:
+            raise EngineerError(
+                f"{mashup_type} mashups are not supported by the workflow: "
+                f"{unsupported_types[mashup_type]}"
+            )
+
         # Map mashup type to engineer function
         mashup_functions = {
             "CLASSIC": create_classic_mashup,
-            "STEM_SWAP": create_stem_swap_mashup,  # Note: requires 3+ songs
             "ENERGY_MATCHED": create_energy_matched_mashup,
             "ADAPTIVE_HARMONY": create_adaptive_harmony_mashup,
-            "THEME_FUSION": create_theme_fusion_mashup,
             "SEMANTIC_ALIGNED": create_semantic_aligned_mashup,
             "ROLE_AWARE": create_role_aware_mashup,
             "CONVERSATIONAL": create_conversational_mashup,
@@ -380,10 +387,11 @@ def create_mashup_node(state: MashupState) -> Dict[str, Any]:
         if not mashup_fn:
             raise EngineerError(f"Unknown mashup type: {mashup_type}")
 
-        # Create mashup
+        # Create mashup. Song IDs go positionally: create_classic_mashup
+        # names them (vocal_id, inst_id), the others (song_a_id, song_b_id)
         output_path = mashup_fn(
-            song_a_id=song_a_id,
-            song_b_id=song_b_id,
+            song_a_id,
+            song_b_id,
             quality="high",
             output_format="mp3"
         )
@@ -15,27 +15,35 @@ def get_assets_dir() -> Path:
     return Path(__file__).parent / "assets"
 
 
+# Required asset files, relative to the assets directory
+REQUIRED_ASSETS = (
+    "avatar_base.blend",
+    "studio_default.blend",
+    "actions/idle_bob.blend",
+    "actions/deck_scratch_L.blend",
+    "actions/deck_scratch_R.blend",
+    "actions/crossfader_hit.blend",
+    "actions/drop_reaction.blend",
+    "actions/spotlight_present.blend",
+)
+
+
 def list_required_assets() -> List[str]:
     """List all required asset files for rendering.
 
     Returns:
         List of required asset filenames
     """
-    return [
-        "avatar_base.blend",
-        "studio_default.blend",
-        "actions/idle_bob.blend",
-        "actions/deck_scratch_L.blend",
-        "actions/deck_scratch_R.blend",
-        "actions/crossfader_hit.blend",
-        "actions/drop_reaction.blend",
-        "actions/spotlight_present.blend",
-    ]
+    return list(REQUIRED_ASSETS)
 
 
 def validate_assets() -> tuple[bool, List[str]]:
     """Validate that all required assets exist.
 
+    Each required entry is checked with Path.exists(), so symlinked
+    directories are followed and case-insensitive filesystems match names
+    the way Blender will open them.
+
     Returns:
         (is_valid, missing_files) tuple
 
@@ -43,13 +51,7 @@ def validate_assets() -> tuple[bool, List[str]]:
         AssetError: If critical assets are missing and strict mode enabled
     """
     assets_dir = get_assets_dir()
-    required = list_required_assets()
-    missing = []
-
-    for asset in required:
-        asset_path = assets_dir / asset
-        if not asset_path.exists():
-            missing.append(asset)
+    missing = [asset for asset in REQUIRED_ASSETS if not (assets_dir / asset).exists()]
 
     is_valid = len(missing) == 0
     return (is_valid, missing)
@@ -130,12 +132,15 @@ def check_asset_integrity(asset_path: Path) -> bool:
     Returns:
         True if file appears valid, False otherwise
     """
-    if not asset_path.exists():
+    # One stat covers both existence and size
+    try:
+        st = asset_path.stat()
+    except OSError:
         return False
 
     # Basic check: .blend files should be >100KB
     # (Blender's minimum file size is typically around 500KB)
-    if asset_path.stat().st_size < 100 * 1024:
+    if st.st_size < 100 * 1024:
         return False
 
     # Check magic bytes (Blender files start with "BLENDER")
@@ -156,11 +161,7 @@ def validate_all_asset_integrity() -> Dict[str, bool]:
     results = {}
     assets_dir = get_assets_dir()
 
-    for asset_name in list_required_assets():
-        asset_path = assets_dir / asset_name
-        if asset_path.exists():
-            results[asset_name] = check_asset_integrity(asset_path)
-        else:
-            results[asset_name] = False
+    for asset_name in REQUIRED_ASSETS:
+        results[asset_name] = check_asset_integrity(assets_dir / asset_name)
 
     return results
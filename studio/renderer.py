@@ -1,24 +1,31 @@
 """Blender subprocess rendering orchestration."""
 
+import functools
 import subprocess
 import json
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 import shutil
 
 from studio.errors import RenderError, BlenderNotFoundError, TimeoutError
 from studio.types import RenderSettings, BlenderConfig
 from studio.asset_loader import validate_assets_strict
+from mixer.config import get_config
 
 
+@functools.lru_cache(maxsize=1)
 def find_blender_executable() -> Optional[str]:
     """Find Blender executable on system PATH.
 
+    The PATH scan runs once per process; call
+    ``find_blender_executable.cache_clear()`` after changing PATH.
+
     Returns:
         Path to blender executable, or None if not found
     """
-    # Try common names
-    for name in ["blender", "blender.exe", "Blender"]:
+    # Try common names (shutil.which applies PATHEXT on Windows)
+    for name in ["blender", "Blender"]:
         exe_path = shutil.which(name)
         if exe_path:
             return exe_path
@@ -32,8 +39,6 @@ def get_blender_config() -> BlenderConfig:
     Returns:
         BlenderConfig with executable path and settings
     """
-    from mixer.config import get_config
-
     config = get_config()
 
     # Get blender executable from config or find on PATH
@@ -59,26 +64,37 @@ def get_blender_config() -> BlenderConfig:
 def get_render_settings(format_type: str = "short") -> RenderSettings:
     """Get render settings from config.yaml.
 
+    Results are cached per configuration instance and version, so a new
+    config from reset_config() or a ``config.set`` call is picked up.
+
     Args:
         format_type: "short" (9:16) or "long" (16:9)
 
     Returns:
-        RenderSettings with resolution, FPS, quality settings
+        Read-only RenderSettings with resolution, FPS, quality settings
     """
-    from mixer.config import get_config
-
     config = get_config()
+    return _render_settings_for(config, config.version, format_type)
+
 
+@functools.lru_cache(maxsize=8)
+def _render_settings_for(config, version: int, format_type: str) -> RenderSettings:
+    """Build render settings for a config instance at a version (cached)."""
     resolution = config.get(f"studio.resolution.{format_type}", [1080, 1920])
 
-    return {
+    return MappingProxyType({
         "fps": config.get("studio.fps", 30),
         "resolution": tuple(resolution),
         "samples": config.get("studio.quality.samples", 64),
         "render_engine": config.get("studio.render_engine", "EEVEE"),
         "shadow_quality": config.get("studio.quality.shadow_quality", "medium"),
         "output_format": "MP4"
-    }
+    })
+
+
+def clear_render_settings_cache() -> None:
+    """Forget cached render settings so the next call re-reads the config."""
+    _render_settings_for.cache_clear()
 
 
 def render_video(
@@ -8,6 +8,63 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+def pytest_collection_finish(session):
+    """Block audio imports when only ``no_audio`` tests are selected.
+
+    Runs after ``-m``/``-k`` deselection, so session.items is the final
+    selection, and before any test is set up. A ``None`` entry in
+    sys.modules makes ``import librosa`` raise ImportError, so a test whose
+    code path reaches librosa fails loudly instead of silently paying for
+    the audio stack. Test modules imported during collection are not
+    affected: restrict the paths (e.g. ``pytest tests/studio -m no_audio``)
+    to keep collection itself audio-free.
+    """
+    items = session.items
+    if items and all(item.get_closest_marker("no_audio") for item in items):
+        sys.modules["librosa"] = None
+
+
+@pytest.fixture(scope="session")
+def ephemeral_chroma():
+    """In-memory ChromaDB shared by every test module in the session.
+
+    Chroma keeps one process-wide system per settings, and a second
+    EphemeralClient with different Settings raises ValueError, so all
+    suites must take their client from here. Tests empty it by deleting
+    the library collection, never with client.reset().
+    """
+    chromadb = pytest.importorskip("chromadb")
+    from chromadb.config import Settings
+
+    return chromadb.EphemeralClient(
+        settings=Settings(anonymized_telemetry=False)
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Session-wide scratch directory for tests that write static files.
+
+    Tests sharing it must use filenames unique to the test.
+    """
+    return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture(scope="session")
+def sparse_file():
+    """Writer for large test files that takes no disk space for the body.
+
+    ``sparse_file(path, magic, size)`` writes the magic header bytes and
+    extends the file to size bytes without materializing the rest.
+    """
+    def _write(path: Path, magic: bytes, size: int) -> None:
+        path.write_bytes(magic)
+        with path.open("r+b") as f:
+            f.truncate(size)
+
+    return _write
+
+
 @pytest.fixture
 def test_config_path(tmp_path):
     """Create a temporary config file for testing."""
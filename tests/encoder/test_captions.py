@@ -11,6 +11,8 @@ from encoder.captions import (
 )
 from encoder.errors import CaptionError
 
+pytestmark = pytest.mark.no_audio
+
 
 def test_load_caption_styles():
     """Test loading caption styles from config."""
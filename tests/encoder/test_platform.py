@@ -1,14 +1,18 @@
 """Tests for encoder.platform module."""
 
 import pytest
+from unittest.mock import patch, MagicMock
 from encoder.platform import (
     PLATFORM_SETTINGS,
     find_ffmpeg_executable,
     check_codec_support,
+    clear_codec_support_cache,
     get_video_info
 )
 from encoder.errors import PlatformError
 
+pytestmark = pytest.mark.no_audio
+
 
 def test_platform_settings_structure():
     """Test that all platforms have required settings."""
@@ -38,6 +42,15 @@ def test_platform_settings_youtube():
     assert settings["max_duration"] is None  # Unlimited
 
 
+def test_platform_settings_read_only():
+    """Test shared platform settings cannot be mutated by callers."""
+    with pytest.raises(TypeError):
+        PLATFORM_SETTINGS["tiktok"]["fps"] = 60
+
+    with pytest.raises(TypeError):
+        PLATFORM_SETTINGS["vimeo"] = PLATFORM_SETTINGS["youtube"]
+
+
 def test_find_ffmpeg_executable():
     """Test finding FFmpeg executable."""
     # May or may not find it depending on system
@@ -48,6 +61,18 @@ def test_find_ffmpeg_executable():
         assert "ffmpeg" in exe.lower()
 
 
+def test_find_ffmpeg_executable_cached():
+    """Test PATH is scanned once until the cache is cleared."""
+    find_ffmpeg_executable.cache_clear()
+
+    with patch("encoder.platform.shutil.which", return_value="/usr/bin/ffmpeg") as mock_which:
+        assert find_ffmpeg_executable() == "/usr/bin/ffmpeg"
+        assert find_ffmpeg_executable() == "/usr/bin/ffmpeg"
+
+    mock_which.assert_called_once_with("ffmpeg")
+    find_ffmpeg_executable.cache_clear()
+
+
 def test_check_codec_support():
     """Test codec support checking."""
     codecs = check_codec_support()
@@ -58,6 +83,23 @@ def test_check_codec_support():
     assert isinstance(codecs["h264"], bool)
 
 
+def test_check_codec_support_cached():
+    """Test codec probe runs once per ffmpeg binary."""
+    clear_codec_support_cache()
+    probe = MagicMock(returncode=0, stdout="libx264 aac", stderr="")
+
+    with patch("encoder.platform.find_ffmpeg_executable", return_value="/usr/bin/ffmpeg"), \
+            patch("encoder.platform.subprocess.run", return_value=probe) as mock_run:
+        first = check_codec_support()
+        second = check_codec_support()
+
+    assert first == {"h264": True, "aac": True, "vp9": False}
+    assert second == first
+    assert second is not first  # callers get their own dict
+    mock_run.assert_called_once()
+    clear_codec_support_cache()
+
+
 def test_get_video_info_missing():
     """Test video info on missing file."""
     info = get_video_info("/nonexistent/video.mp4")
@@ -67,9 +109,9 @@ def test_get_video_info_missing():
     assert info["size_mb"] == 0.0
 
 
-def test_get_video_info_invalid(tmp_path):
+def test_get_video_info_invalid(shared_tmp):
     """Test video info on non-video file."""
-    fake_video = tmp_path / "fake.mp4"
+    fake_video = shared_tmp / "video_info_invalid.mp4"
     fake_video.write_bytes(b"not a video")
 
     info = get_video_info(str(fake_video))
@@ -78,3 +120,18 @@ def test_get_video_info_invalid(tmp_path):
     assert "exists" in info
     assert "size_mb" in info
     assert "duration" in info
+
+
+def test_get_video_info_cached(shared_tmp):
+    """Test ffprobe runs once per unchanged file."""
+    video = shared_tmp / "video_info_cached.mp4"
+    video.write_bytes(b"not a video")
+    probe = MagicMock(returncode=0, stdout="12.5", stderr="")
+
+    with patch("encoder.platform.subprocess.run", return_value=probe) as mock_run:
+        first = get_video_info(str(video))
+        second = get_video_info(str(video))
+
+    assert first == second
+    assert first["exists"] is True
+    assert mock_run.call_count == 3  # duration, resolution, codec probes
@@ -3,6 +3,8 @@
 import pytest
 from encoder.thumbnail import get_thumbnail_settings
 
+pytestmark = pytest.mark.no_audio
+
 
 def test_get_thumbnail_settings_tiktok():
     """Test TikTok thumbnail settings."""
@@ -0,0 +1,8 @@
+"""Helpers shared by test modules and conftest files."""
+
+from types import MappingProxyType
+
+
+def frozen_sections(sections):
+    """Freeze section dicts so shared test data can't be mutated."""
+    return tuple(MappingProxyType(section) for section in sections)
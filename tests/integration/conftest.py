@@ -0,0 +1,17 @@
+"""Shared fixtures for integration tests."""
+
+import pytest
+
+from mixer.memory import ChromaClient
+
+
+@pytest.fixture(scope="session")
+def worker_chroma(tmp_path_factory):
+    """Persistent ChromaDB client private to this test process.
+
+    Under pytest-xdist each worker gets its own basetemp, so every worker
+    writes to a separate SQLite store and never contends for its lock.
+    """
+    client = ChromaClient(persist_directory=tmp_path_factory.mktemp("chroma"))
+    yield client
+    client.close()
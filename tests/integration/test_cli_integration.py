@@ -1,66 +1,117 @@
-"""Integration tests for CLI commands."""
+"""Integration tests for CLI commands.
+
+The CLI, ChromaDB and mixer.memory are imported inside fixtures so that
+collecting (or skipping) these tests doesn't load the whole CLI graph.
+"""
+
+import contextlib
+import io
 
 import pytest
-from click.testing import CliRunner
-from mixer.cli import main
-from mixer.memory import reset_client
 
 
-@pytest.fixture
+def fast_invoke(main, args):
+    """Run an eager, output-only CLI option without CliRunner isolation.
+
+    Suitable for --help/--version, which print via click.echo and exit
+    before any command runs. Returns (output, exit_code).
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), pytest.raises(SystemExit) as exc:
+        main.main(args, standalone_mode=True, prog_name="mixer")
+    return buf.getvalue(), exc.value.code
+
+
+@pytest.fixture(scope="session")
+def cli_main():
+    """The Click entry point, imported on first use."""
+    from mixer.cli import main
+    return main
+
+
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Create Click CLI test runner."""
+    """Create Click CLI test runner.
+
+    CliRunner keeps no state between invoke() calls; per-call input and
+    env are passed to invoke(), so one runner serves the whole session.
+    """
+    from click.testing import CliRunner
     return CliRunner()
 
 
 @pytest.fixture(autouse=True)
-def reset_db():
-    """Reset ChromaDB between tests."""
-    reset_client()
+def tmp_log_file(tmp_path, monkeypatch):
+    """Point the CLI's log file at tmp_path instead of ./mixer.log."""
+    from mixer.config import get_config
+
+    log_file = tmp_path / "mixer.log"
+    monkeypatch.setitem(get_config().config["logging"], "file", str(log_file))
+    return log_file
+
+
+@pytest.fixture(autouse=True)
+def reset_db(ephemeral_chroma, monkeypatch):
+    """Install an empty library on the session's in-memory ChromaDB.
+
+    Teardown drops only the library collection; the shared client comes
+    from tests/conftest.py and must not be reset.
+    """
+    from mixer.memory import ChromaClient
+
+    monkeypatch.setattr(
+        "mixer.memory.client._client_instance",
+        ChromaClient(client=ephemeral_chroma),
+    )
     yield
-    reset_client()
+    if any(
+        collection.name == ChromaClient.COLLECTION_NAME
+        for collection in ephemeral_chroma.list_collections()
+    ):
+        ephemeral_chroma.delete_collection(ChromaClient.COLLECTION_NAME)
 
 
 @pytest.mark.integration
-def test_cli_help(cli_runner):
+def test_cli_help(cli_main):
     """Test CLI help command."""
-    result = cli_runner.invoke(main, ['--help'])
-    assert result.exit_code == 0
-    assert "The Mixer" in result.output
-    assert "ingest" in result.output
-    assert "mashup" in result.output
+    output, exit_code = fast_invoke(cli_main, ['--help'])
+    assert exit_code == 0
+    assert "The Mixer" in output
+    assert "ingest" in output
+    assert "mashup" in output
 
 
 @pytest.mark.integration
-def test_cli_version(cli_runner):
+def test_cli_version(cli_main):
     """Test CLI version command."""
-    result = cli_runner.invoke(main, ['--version'])
-    assert result.exit_code == 0
-    assert "0.1.0" in result.output
+    output, exit_code = fast_invoke(cli_main, ['--version'])
+    assert exit_code == 0
+    assert "0.1.0" in output
 
 
 @pytest.mark.integration
-def test_library_list_empty(cli_runner):
+def test_library_list_empty(cli_runner, cli_main):
     """Test library list with empty library."""
-    result = cli_runner.invoke(main, ['library', 'list'])
+    result = cli_runner.invoke(cli_main, ['library', 'list'])
     assert result.exit_code == 0
     assert "Library is empty" in result.output
 
 
 @pytest.mark.integration
-def test_library_stats_empty(cli_runner):
+def test_library_stats_empty(cli_runner, cli_main):
     """Test library stats with empty library."""
-    result = cli_runner.invoke(main, ['library', 'stats'])
+    result = cli_runner.invoke(cli_main, ['library', 'stats'])
     assert result.exit_code == 0
     assert "Library is empty" in result.output
 
 
 @pytest.mark.integration
 @pytest.mark.skip(reason="Requires real audio file")
-def test_cli_ingest_local_file(cli_runner):
+def test_cli_ingest_local_file(cli_runner, cli_main):
     """Test ingesting a local audio file via CLI."""
     test_file = "path/to/test_audio.mp3"
 
-    result = cli_runner.invoke(main, ['ingest', test_file])
+    result = cli_runner.invoke(cli_main, ['ingest', test_file])
 
     assert result.exit_code == 0
     assert "Successfully ingested" in result.output or "already in library" in result.output
@@ -68,14 +119,14 @@ def test_cli_ingest_local_file(cli_runner):
 
 @pytest.mark.integration
 @pytest.mark.skip(reason="Requires real audio files")
-def test_cli_analyze_song(cli_runner):
+def test_cli_analyze_song(cli_runner, cli_main):
     """Test analyzing a song via CLI."""
     # First ingest
     test_file = "path/to/test_audio.mp3"
-    cli_runner.invoke(main, ['ingest', test_file])
+    cli_runner.invoke(cli_main, ['ingest', test_file])
 
     # Then analyze
-    result = cli_runner.invoke(main, ['analyze', 'test_song_id'])
+    result = cli_runner.invoke(cli_main, ['analyze', 'test_song_id'])
 
     assert result.exit_code == 0
     assert "Analysis complete" in result.output
@@ -83,9 +134,9 @@ def test_cli_analyze_song(cli_runner):
 
 @pytest.mark.integration
 @pytest.mark.skip(reason="Requires real audio files")
-def test_cli_match_command(cli_runner):
+def test_cli_match_command(cli_runner, cli_main):
     """Test match command via CLI."""
-    result = cli_runner.invoke(main, ['match', 'test_song_id'])
+    result = cli_runner.invoke(cli_main, ['match', 'test_song_id'])
 
     # Should either find matches or report error
     assert result.exit_code in [0, 1]
@@ -93,30 +144,30 @@ def test_cli_match_command(cli_runner):
 
 @pytest.mark.integration
 @pytest.mark.skip(reason="Requires real audio files")
-def test_cli_mashup_workflow(cli_runner):
+def test_cli_mashup_workflow(cli_runner, cli_main):
     """Test full mashup creation via CLI."""
     song_a = "path/to/song_a.mp3"
     song_b = "path/to/song_b.mp3"
 
-    result = cli_runner.invoke(main, ['mashup', song_a, song_b, '--type', 'classic'])
+    result = cli_runner.invoke(cli_main, ['mashup', song_a, song_b, '--type', 'classic'])
 
     assert result.exit_code == 0
     assert "Mashup created successfully" in result.output
 
 
 @pytest.mark.integration
-def test_cli_invalid_command(cli_runner):
+def test_cli_invalid_command(cli_runner, cli_main):
     """Test CLI with invalid command."""
-    result = cli_runner.invoke(main, ['invalid_command'])
+    result = cli_runner.invoke(cli_main, ['invalid_command'])
 
     assert result.exit_code != 0
     assert "Error" in result.output or "Usage" in result.output
 
 
 @pytest.mark.integration
-def test_analyze_without_args(cli_runner):
+def test_analyze_without_args(cli_runner, cli_main):
     """Test analyze command without required arguments."""
-    result = cli_runner.invoke(main, ['analyze'])
+    result = cli_runner.invoke(cli_main, ['analyze'])
 
     assert result.exit_code == 1
     assert "Error" in result.output
@@ -3,24 +3,17 @@
 import pytest
 from pathlib import Path
 from mixer.workflow import run_mashup_workflow, WorkflowError
-from mixer.memory import get_client, reset_client
+from mixer.memory import get_client
 from mixer.agents import ingest_song, profile_audio
 
 
-@pytest.fixture(scope="module")
-def temp_chroma_dir(tmp_path_factory):
-    """Create temporary ChromaDB directory for integration tests."""
-    return tmp_path_factory.mktemp("chroma_integration")
-
-
 @pytest.fixture(scope="module", autouse=True)
-def setup_test_env(temp_chroma_dir, monkeypatch):
+def setup_test_env(worker_chroma):
     """Setup isolated test environment."""
-    # Use temporary ChromaDB
-    monkeypatch.setenv("CHROMA_PERSIST_DIRECTORY", str(temp_chroma_dir))
-    reset_client()
-    yield
-    reset_client()
+    # Route the global client to this worker's temporary ChromaDB
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("mixer.memory.client._client_instance", worker_chroma)
+        yield
 
 
 @pytest.mark.integration
@@ -113,9 +106,12 @@ def test_workflow_state_persistence():
 
 @pytest.mark.integration
 @pytest.mark.skip(reason="Performance test - run manually")
-def test_workflow_performance_benchmark():
+def test_workflow_performance_benchmark(benchmark):
     """Benchmark full workflow execution time.
 
+    Timed by pytest-benchmark (perf_counter based) over 3 rounds; the
+    median must stay under 5 minutes.
+
     Expected timings (rough estimates):
     - Ingestion: 5-30s (depends on download speed)
     - Analysis: 30-60s per song (Whisper + Demucs + section detection)
@@ -124,26 +120,20 @@ def test_workflow_performance_benchmark():
     - Total: ~2-3 minutes for classic mashup
 
     """
-    import time
-
     song_a_path = "path/to/test_song_a.mp3"
     song_b_path = "path/to/test_song_b.mp3"
 
-    start_time = time.time()
-
-    final_state = run_mashup_workflow(
-        input_source_a=song_a_path,
-        input_source_b=song_b_path,
-        mashup_type="CLASSIC",
-        stream=False
+    final_state = benchmark.pedantic(
+        run_mashup_workflow,
+        kwargs={
+            "input_source_a": song_a_path,
+            "input_source_b": song_b_path,
+            "mashup_type": "CLASSIC",
+            "stream": False,
+        },
+        iterations=1,
+        rounds=3,
     )
 
-    end_time = time.time()
-    duration = end_time - start_time
-
     assert final_state["status"] == "completed"
-    assert duration < 300  # Should complete in under 5 minutes
-
-    print(f"\n=== Performance Benchmark ===")
-    print(f"Total duration: {duration:.1f}s")
-    print(f"Average per-song processing: {duration/2:.1f}s")
+    assert benchmark.stats.stats.median < 300  # Should complete in under 5 minutes
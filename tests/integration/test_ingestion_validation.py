@@ -0,0 +1,34 @@
+"""Ingestion validation against real audio decoding.
+
+Unit tests replace librosa with a stub when checking validate_audio_file;
+this file exercises the real duration check on a generated WAV.
+"""
+
+import wave
+
+import pytest
+
+from mixer.agents.ingestion import ValidationError, validate_audio_file
+
+
+def _write_silent_wav(path, seconds, sr=8000):
+    """Write a mono 16-bit silent WAV of the given length."""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sr)
+        wav.writeframes(bytes(2 * int(seconds * sr)))
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_validate_real_duration(tmp_path):
+    """Real librosa accepts 31 s of audio and rejects 10 s above 100KB."""
+    long_wav = tmp_path / "long.wav"
+    _write_silent_wav(long_wav, 31)
+    validate_audio_file(str(long_wav))
+
+    short_wav = tmp_path / "short.wav"
+    _write_silent_wav(short_wav, 10, sr=22050)
+    with pytest.raises(ValidationError, match="Audio too short"):
+        validate_audio_file(str(short_wav))
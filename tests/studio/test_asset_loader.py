@@ -11,6 +11,8 @@ from studio.asset_loader import (
 )
 from studio.errors import AssetError
 
+pytestmark = pytest.mark.no_audio
+
 
 def test_get_assets_dir():
     """Test getting assets directory path."""
@@ -45,6 +47,24 @@ def test_validate_assets():
         assert len(missing) > 0
 
 
+def test_validate_assets_follows_symlinked_dirs(tmp_path, monkeypatch):
+    """Test assets under a symlinked actions/ directory count as present."""
+    assets_dir = tmp_path / "assets"
+    shared_actions = tmp_path / "shared_actions"
+    assets_dir.mkdir()
+    shared_actions.mkdir()
+    for asset in list_required_assets():
+        target = shared_actions / asset.split("/", 1)[1] if "/" in asset else assets_dir / asset
+        target.touch()
+    try:
+        (assets_dir / "actions").symlink_to(shared_actions, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not supported here")
+    monkeypatch.setattr("studio.asset_loader.get_assets_dir", lambda: assets_dir)
+
+    assert validate_assets() == (True, [])
+
+
 def test_get_asset_path_missing():
     """Test getting path to non-existent asset raises error."""
     # This will likely fail since assets aren't committed
@@ -58,26 +78,26 @@ def test_check_asset_integrity_missing():
     assert check_asset_integrity(fake_path) is False
 
 
-def test_check_asset_integrity_too_small(tmp_path):
+def test_check_asset_integrity_too_small(shared_tmp):
     """Test integrity check fails for file too small."""
-    small_file = tmp_path / "small.blend"
-    small_file.write_bytes(b"BLENDER" + b"x" * 100)  # Only 107 bytes
+    small_file = shared_tmp / "integrity_too_small.blend"
+    small_file.write_bytes(b"BLENDER" + bytes(100))  # Only 107 bytes
 
     assert check_asset_integrity(small_file) is False
 
 
-def test_check_asset_integrity_wrong_header(tmp_path):
+def test_check_asset_integrity_wrong_header(shared_tmp, sparse_file):
     """Test integrity check fails for wrong magic bytes."""
-    wrong_file = tmp_path / "wrong.blend"
-    wrong_file.write_bytes(b"NOTBLEND" + b"x" * 200000)
+    wrong_file = shared_tmp / "integrity_wrong_header.blend"
+    sparse_file(wrong_file, b"NOTBLEND", 200008)
 
     assert check_asset_integrity(wrong_file) is False
 
 
-def test_check_asset_integrity_valid(tmp_path):
+def test_check_asset_integrity_valid(shared_tmp, sparse_file):
     """Test integrity check passes for valid-looking file."""
-    valid_file = tmp_path / "valid.blend"
+    valid_file = shared_tmp / "integrity_valid.blend"
     # Create file with BLENDER header and >100KB size
-    valid_file.write_bytes(b"BLENDER" + b"x" * 150000)
+    sparse_file(valid_file, b"BLENDER", 150007)
 
     assert check_asset_integrity(valid_file) is True
@@ -6,10 +6,14 @@ from pathlib import Path
 from studio.renderer import (
     find_blender_executable,
     get_render_settings,
+    clear_render_settings_cache,
     estimate_render_time,
     check_render_health
 )
 from studio.errors import BlenderNotFoundError
+from mixer.config import ConfigManager
+
+pytestmark = pytest.mark.no_audio
 
 
 def test_find_blender_executable():
@@ -22,6 +26,18 @@ def test_find_blender_executable():
         assert "blender" in exe.lower()
 
 
+def test_find_blender_executable_cached():
+    """Test PATH is scanned once until the cache is cleared."""
+    find_blender_executable.cache_clear()
+
+    with patch("studio.renderer.shutil.which", return_value="/usr/bin/blender") as mock_which:
+        assert find_blender_executable() == "/usr/bin/blender"
+        assert find_blender_executable() == "/usr/bin/blender"
+
+    mock_which.assert_called_once_with("blender")
+    find_blender_executable.cache_clear()
+
+
 def test_get_render_settings_short():
     """Test getting render settings for short format."""
     settings = get_render_settings("short")
@@ -41,6 +57,21 @@ def test_get_render_settings_long():
     assert settings["output_format"] == "MP4"
 
 
+def test_get_render_settings_refreshed_by_config_set(test_config_path):
+    """Test config.set() invalidates cached settings for the same config object."""
+    config = ConfigManager(test_config_path)
+
+    with patch("studio.renderer.get_config", return_value=config):
+        assert get_render_settings("short")["fps"] == 30
+        assert get_render_settings("short") is get_render_settings("short")
+
+        config.set("studio.fps", 60)
+
+        assert get_render_settings("short")["fps"] == 60
+
+    clear_render_settings_cache()
+
+
 def test_estimate_render_time_short():
     """Test render time estimation for short format."""
     duration = 30.0
@@ -68,11 +99,11 @@ def test_check_render_health_missing():
     assert health["is_video"] is False
 
 
-def test_check_render_health_valid(tmp_path):
+def test_check_render_health_valid(shared_tmp, sparse_file):
     """Test health check on valid-looking video file."""
-    video_file = tmp_path / "test.mp4"
+    video_file = shared_tmp / "render_health_valid.mp4"
     # Create file >500KB
-    video_file.write_bytes(b"x" * (600 * 1024))
+    sparse_file(video_file, b"", 600 * 1024)
 
     health = check_render_health(str(video_file))
 
@@ -84,7 +115,7 @@ def test_check_render_health_valid(tmp_path):
 @patch('studio.renderer.subprocess.run')
 @patch('studio.renderer.validate_assets_strict')
 @patch('studio.renderer.get_blender_config')
-def test_render_video_placeholder_mode(mock_blender_config, mock_validate, mock_run, tmp_path):
+def test_render_video_placeholder_mode(mock_blender_config, mock_validate, mock_run, shared_tmp, sparse_file):
     """Test rendering in placeholder mode (skips asset validation)."""
     from studio.renderer import render_video
 
@@ -96,8 +127,8 @@ def test_render_video_placeholder_mode(mock_blender_config, mock_validate, mock_
     }
 
     # Mock successful render
-    output_file = tmp_path / "test.mp4"
-    output_file.write_bytes(b"x" * (1024 * 1024))  # 1MB file
+    output_file = shared_tmp / "render_placeholder.mp4"
+    sparse_file(output_file, b"", 1024 * 1024)  # 1MB file
 
     mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
@@ -0,0 +1,279 @@
+"""Shared fixtures for unit tests.
+
+Unit tests never run real transcription: ``whisper`` (and the torch graph
+behind it) is replaced with a stub before any ``mixer.agents`` import, so
+tests must patch ``whisper.load_model`` rather than rely on a real model.
+"""
+
+import hashlib
+import re
+import sys
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
+
+# Must run before mixer.agents.analyst is imported by any test module.
+sys.modules.setdefault("whisper", MagicMock(name="whisper"))
+
+import numpy as np
+import pytest
+
+from mixer.types import SongMetadata
+from tests.helpers import frozen_sections
+
+# Stem values are never asserted on; a seeded Generator keeps them cheap
+# (native float32 draws) and reproducible.
+_RNG = np.random.default_rng(0)
+
+# Every DSP call on the engineer fixture audio is mocked or length-agnostic,
+# so a 32-sample stub at a low rate exercises the same code paths as seconds
+# of full-rate audio.
+_TINY_SR = 8000
+_TINY_DURATION = 0.004
+_TINY_SAMPLES = int(_TINY_SR * _TINY_DURATION)
+
+# 440 Hz sine, computed once in float32 with a single fused phase multiply
+_SINE_440 = np.sin(np.multiply(
+    np.arange(_TINY_SAMPLES, dtype=np.float32),
+    2 * np.pi * 440 / _TINY_SR,
+    dtype=np.float32,
+))
+_SINE_440.setflags(write=False)
+
+
+@pytest.fixture(scope="class")
+def analyst_stubs():
+    """Whisper, librosa and LLM stubs for the Analyst pipeline.
+
+    Patches are entered once per test class through ``patch.multiple``;
+    tests tweak ``return_value`` on the shared mocks instead of stacking
+    ``@patch`` decorators.
+    """
+    with patch.multiple(
+        "mixer.agents.analyst",
+        whisper=DEFAULT,
+        upsert_song=DEFAULT,
+        analyze_song_semantics=DEFAULT,
+        analyze_section_semantics=DEFAULT,
+    ) as analyst, patch.multiple(
+        "librosa", load=DEFAULT, get_duration=DEFAULT
+    ) as audio, patch("librosa.beat.beat_track") as beat_track, patch(
+        "librosa.feature.chroma_cqt"
+    ) as chroma_cqt:
+        stubs = SimpleNamespace(
+            load=audio["load"],
+            get_duration=audio["get_duration"],
+            beat_track=beat_track,
+            chroma_cqt=chroma_cqt,
+            whisper=analyst["whisper"],
+            upsert_song=analyst["upsert_song"],
+            song_semantics=analyst["analyze_song_semantics"],
+            section_semantics=analyst["analyze_section_semantics"],
+        )
+
+        stubs.load.return_value = (
+            np.random.default_rng(0).random(44100 * 60, dtype=np.float32),
+            44100,
+        )
+        stubs.get_duration.return_value = 60.0
+        stubs.beat_track.return_value = (120.0, np.array([0, 100, 200]))
+        chroma = np.zeros((12, 100), dtype=np.float32)
+        chroma[[0, 4, 7], :] = 1.0  # C major triad
+        chroma.flags.writeable = False
+        stubs.chroma_cqt.return_value = chroma
+
+        whisper_model = Mock()
+        whisper_model.transcribe.return_value = {
+            "text": "test lyrics " * 20,
+            "segments": []
+        }
+        stubs.whisper.load_model.return_value = whisper_model
+
+        stubs.song_semantics.return_value = {
+            "genres": ["Pop"],
+            "primary_genre": "Pop",
+            "irony_score": 0,
+            "mood_summary": "Upbeat and happy",
+            "valence": 8
+        }
+        stubs.section_semantics.return_value = {
+            "emotional_tone": "happy",
+            "lyrical_function": "hook",
+            "themes": ["love"]
+        }
+
+        yield stubs
+
+
+@pytest.fixture
+def analyst_mocks(analyst_stubs):
+    """Class-scoped Analyst stubs with call history cleared for this test."""
+    for stub in vars(analyst_stubs).values():
+        stub.reset_mock()
+    return analyst_stubs
+
+
+@pytest.fixture(scope="session")
+def mock_audio_data():
+    """Mock audio data for engineer tests (shared, read-only)."""
+    return _SINE_440, _TINY_SR
+
+
+@pytest.fixture(scope="session")
+def mock_song_metadata():
+    """Mock song metadata (shared, read-only; derive variants with dict(...))."""
+    return MappingProxyType(SongMetadata(
+        path="/fake/path/song.wav",
+        bpm=120.0,
+        key="Cmaj",
+        camelot="8B",
+        first_downbeat_sec=0.5,
+        sample_rate=_TINY_SR,
+        duration_sec=180.0,
+        has_vocals=True,
+        artist="Test Artist",
+        title="Test Song",
+    ))
+
+
+@pytest.fixture(scope="session")
+def mock_stems():
+    """Mock separated stems (shared, read-only rows of one buffer)."""
+    stems = _RNG.standard_normal((4, _TINY_SAMPLES), dtype=np.float32)
+    stems *= 0.1
+    stems.setflags(write=False)
+
+    vocals, drums, bass, other = stems
+    return {
+        "vocals": vocals,
+        "drums": drums,
+        "bass": bass,
+        "other": other,
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_role_aware_sections():
+    """Sections with vocal characteristics for role assignment."""
+    sections_a = frozen_sections([
+        {
+            "section_type": "verse",
+            "start_sec": 0.0,
+            "end_sec": 20.0,
+            "vocal_density": "dense",
+            "vocal_intensity": 0.8,
+            "lyrical_function": "narrative",
+            "emotional_tone": "descriptive"
+        },
+        {
+            "section_type": "chorus",
+            "start_sec": 20.0,
+            "end_sec": 40.0,
+            "vocal_density": "medium",
+            "vocal_intensity": 0.6,
+            "lyrical_function": "hook",
+            "emotional_tone": "intense"
+        },
+    ])
+    sections_b = frozen_sections([
+        {
+            "section_type": "verse",
+            "start_sec": 0.0,
+            "end_sec": 18.0,
+            "vocal_density": "sparse",
+            "vocal_intensity": 0.3,
+            "lyrical_function": "question",
+            "emotional_tone": "curious"
+        },
+        {
+            "section_type": "bridge",
+            "start_sec": 18.0,
+            "end_sec": 30.0,
+            "vocal_density": "dense",
+            "vocal_intensity": 0.5,
+            "lyrical_function": "answer",
+            "emotional_tone": "resolute"
+        },
+    ])
+    return sections_a, sections_b
+
+
+@pytest.fixture(scope="session")
+def mock_conversational_sections():
+    """Sections with lyrical functions for conversational pairing."""
+    sections_a = frozen_sections([
+        {
+            "section_type": "verse",
+            "start_sec": 0.0,
+            "end_sec": 20.0,
+            "lyrical_function": "question",
+            "emotional_tone": "curious"
+        },
+        {
+            "section_type": "verse",
+            "start_sec": 20.0,
+            "end_sec": 40.0,
+            "lyrical_function": "narrative",
+            "emotional_tone": "descriptive"
+        },
+        {
+            "section_type": "chorus",
+            "start_sec": 40.0,
+            "end_sec": 60.0,
+            "lyrical_function": "hook",
+            "emotional_tone": "intense"
+        },
+    ])
+    sections_b = frozen_sections([
+        {
+            "section_type": "verse",
+            "start_sec": 0.0,
+            "end_sec": 18.0,
+            "lyrical_function": "answer",
+            "emotional_tone": "resolute"
+        },
+        {
+            "section_type": "bridge",
+            "start_sec": 18.0,
+            "end_sec": 35.0,
+            "lyrical_function": "reflection",
+            "emotional_tone": "contemplative"
+        },
+        {
+            "section_type": "chorus",
+            "start_sec": 35.0,
+            "end_sec": 50.0,
+            "lyrical_function": "response",
+            "emotional_tone": "powerful"
+        },
+    ])
+    return sections_a, sections_b
+
+
+class StubEmbeddingFunction:
+    """Deterministic stand-in for the ONNX MiniLM embedding model.
+
+    Each word is hashed into one of ``DIM`` buckets (a normalized bag of
+    words), so documents sharing words with a query still rank closer to
+    it, without loading or running a transformer.
+    """
+
+    DIM = 64
+
+    def __call__(self, input):
+        vectors = np.zeros((len(input), self.DIM), dtype=np.float32)
+        for row, text in zip(vectors, input):
+            for word in re.findall(r"\w+", text.lower()):
+                digest = hashlib.blake2b(word.encode(), digest_size=4).digest()
+                row[int.from_bytes(digest, "little") % self.DIM] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return (vectors / np.maximum(norms, 1e-12)).tolist()
+
+
+@pytest.fixture
+def stub_embeddings(monkeypatch):
+    """Route every ChromaClient collection through StubEmbeddingFunction."""
+    stub = StubEmbeddingFunction()
+    monkeypatch.setattr(
+        "mixer.memory.client._embedding_function", lambda model_name: stub
+    )
+    return stub
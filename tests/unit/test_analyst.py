@@ -2,13 +2,14 @@
 
 import pytest
 import numpy as np
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 
 from mixer.agents.analyst import (
     profile_audio,
     _analyze_signal,
     _analyze_sections,
     _extract_section_lyrics,
+    _extract_all_section_lyrics,
     _analyze_section_vocals,
     AnalysisError,
 )
@@ -20,17 +21,36 @@ from mixer.audio.analysis import (
     key_to_camelot,
 )
 
+SR = 44100
+
+# Dummy audio shared by every test; the librosa calls that consume it are
+# mocked or only reduce it, so sample values and precision don't matter.
+_Y_180S = np.random.default_rng(0).random(SR * 180, dtype=np.float32)
+_Y_3S = _Y_180S[:SR * 3]
+_Y_10S = _Y_180S[:SR * 10]
+
+
+def _frozen(arr: np.ndarray) -> np.ndarray:
+    """Mark a shared mock return value read-only."""
+    arr.flags.writeable = False
+    return arr
+
+
+# C major triad (C, E, G) chroma; deterministic input for key estimation
+_CHROMA_100 = np.zeros((12, 100), dtype=np.float32)
+_CHROMA_100[[0, 4, 7], :] = 1.0
+_frozen(_CHROMA_100)
+
+# Segmentation is mocked downstream, so the values are never read
+_CHROMA_1000 = _frozen(np.zeros((12, 1000), dtype=np.float32))
+
 
 class TestSignalAnalysis:
     """Test basic signal analysis functions."""
 
     def test_key_estimation(self):
         """Should estimate musical key from chroma features."""
-        # Create a simple C major chroma
-        chroma = np.zeros((12, 100))
-        chroma[[0, 4, 7], :] = 1.0  # C, E, G (C major triad)
-
-        key = estimate_key(chroma)
+        key = estimate_key(_CHROMA_100)
 
         # Should detect C major or a related key
         assert "maj" in key or "min" in key
@@ -56,13 +76,12 @@ class TestSignalAnalysis:
         """Should successfully analyze audio signal."""
         # Setup mocks
         mock_beat_track.return_value = (128.0, np.array([0, 100, 200]))
-        mock_chroma.return_value = np.random.rand(12, 100)
+        mock_chroma.return_value = _CHROMA_100
         mock_rms.return_value = np.array([[0.5]])
         mock_duration.return_value = 180.0
 
-        # Create dummy audio
-        y = np.random.rand(44100 * 3)  # 3 seconds
-        sr = 44100
+        y = _Y_3S
+        sr = SR
 
         result = _analyze_signal(y, sr)
 
@@ -91,13 +110,12 @@ class TestSectionDetection:
         """Should detect section boundaries."""
         # Setup mocks
         mock_duration.return_value = 180.0  # 3 minutes
-        mock_chroma.return_value = np.random.rand(12, 1000)
+        mock_chroma.return_value = _CHROMA_1000
         mock_agglomerative.return_value = np.array([0, 250, 500, 750, 1000])
         mock_frames_to_time.return_value = np.array([0.0, 30.0, 60.0, 90.0, 120.0])
 
-        # Create dummy audio
-        y = np.random.rand(44100 * 180)
-        sr = 44100
+        y = _Y_180S
+        sr = SR
 
         sections = detect_sections(y, sr)
 
@@ -138,9 +156,8 @@ class TestSectionDetection:
         mock_centroid.return_value = np.array([[2500.0, 2500.0]])
         mock_beat_track.return_value = (120.0, np.array([0, 10, 20, 30]))
 
-        # Create dummy audio
-        y = np.random.rand(44100 * 10)  # 10 seconds
-        sr = 44100
+        y = _Y_10S
+        sr = SR
 
         result = analyze_section_energy(y, sr, 0.0, 10.0)
 
@@ -172,6 +189,21 @@ class TestLyricExtraction:
         assert "goodbye" in lyrics
         assert "Hello" not in lyrics
 
+    def test_extract_all_section_lyrics(self):
+        """Should match per-section overlap for ordered and unordered timings."""
+        word_timings = [
+            {"start": 0.0, "end": 2.0, "text": "Hello"},
+            {"start": 2.0, "end": 6.0, "text": "world"},
+            {"start": 10.0, "end": 12.0, "text": "goodbye"},
+        ]
+        boundaries = [(0.0, 5.0), (5.0, 10.0), (10.0, 15.0), (20.0, 30.0)]
+
+        expected = ["Hello world", "world", "goodbye", ""]
+        assert _extract_all_section_lyrics(boundaries, word_timings) == expected
+        assert _extract_all_section_lyrics(boundaries, word_timings[::-1]) == [
+            "world Hello", "world", "goodbye", ""
+        ]
+
     def test_extract_section_lyrics_no_timings(self):
         """Should return empty string when no timings available."""
         lyrics = _extract_section_lyrics(0.0, 10.0, [], "full transcript")
@@ -186,8 +218,8 @@ class TestVocalAnalysis:
         """Should analyze vocal characteristics."""
         mock_rms.return_value = np.array([[0.7]])
 
-        y = np.random.rand(44100 * 10)
-        sr = 44100
+        y = _Y_10S
+        sr = SR
 
         # Dense lyrics (high word count)
         result = _analyze_section_vocals(y, sr, 0.0, 10.0, "lots of words " * 50)
@@ -206,60 +238,12 @@ class TestVocalAnalysis:
 class TestIntegration:
     """Integration tests for full pipeline."""
 
-    @patch('mixer.agents.analyst.whisper.load_model')
-    @patch('mixer.agents.analyst.upsert_song')
-    @patch('mixer.agents.analyst.analyze_song_semantics')
-    @patch('mixer.agents.analyst.analyze_section_semantics')
-    @patch('librosa.load')
-    @patch('librosa.beat.beat_track')
-    @patch('librosa.feature.chroma_cqt')
-    @patch('librosa.get_duration')
-    def test_profile_audio_success(
-        self,
-        mock_duration,
-        mock_chroma,
-        mock_beat_track,
-        mock_load,
-        mock_section_semantics,
-        mock_song_semantics,
-        mock_upsert,
-        mock_whisper,
-        tmp_path
-    ):
+    def test_profile_audio_success(self, analyst_mocks, tmp_path):
         """Should successfully profile an audio file."""
         # Create a test file
         test_file = tmp_path / "test.wav"
         test_file.touch()
 
-        # Setup mocks
-        mock_load.return_value = (np.random.rand(44100 * 60), 44100)
-        mock_duration.return_value = 60.0
-        mock_beat_track.return_value = (120.0, np.array([0, 100, 200]))
-        mock_chroma.return_value = np.random.rand(12, 100)
-
-        # Mock Whisper
-        mock_model = Mock()
-        mock_model.transcribe.return_value = {
-            "text": "test lyrics " * 20,
-            "segments": []
-        }
-        mock_whisper.return_value = mock_model
-
-        # Mock semantic analysis
-        mock_song_semantics.return_value = {
-            "genres": ["Pop"],
-            "primary_genre": "Pop",
-            "irony_score": 0,
-            "mood_summary": "Upbeat and happy",
-            "valence": 8
-        }
-
-        mock_section_semantics.return_value = {
-            "emotional_tone": "happy",
-            "lyrical_function": "hook",
-            "themes": ["love"]
-        }
-
         # Call profile_audio
         result = profile_audio(
             str(test_file),
@@ -274,4 +258,4 @@ class TestIntegration:
         assert 'metadata' in result
 
         # Verify upsert was called
-        mock_upsert.assert_called_once()
+        analyst_mocks.upsert_song.assert_called_once()
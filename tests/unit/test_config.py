@@ -1,5 +1,8 @@
 """Tests for configuration management."""
 
+import os
+from unittest.mock import Mock
+
 import pytest
 from pathlib import Path
 from mixer.config import ConfigManager, ConfigError, reset_config
@@ -41,6 +44,16 @@ def test_config_set_value(test_config_path):
     assert config.get("logging.level") == "DEBUG"
 
 
+def test_config_set_bumps_version(test_config_path):
+    """Test set() advances the version that derived caches key on."""
+    config = ConfigManager(test_config_path)
+    version = config.version
+
+    config.set("logging.level", "DEBUG")
+
+    assert config.version == version + 1
+
+
 def test_config_get_path(test_config_path):
     """Test getting absolute paths."""
     config = ConfigManager(test_config_path)
@@ -99,3 +112,90 @@ def test_config_deep_merge(test_config_path):
     # Partial override should preserve other values
     assert config.get("llm.primary_provider") == "anthropic"
     assert config.get("llm.timeout") == 30  # Should have default even if not in file
+
+
+def test_config_cached_load_isolated(test_config_path):
+    """Test that managers sharing a cached parse don't share mutations."""
+    first = ConfigManager(test_config_path)
+    first.set("logging.level", "DEBUG")
+
+    second = ConfigManager(test_config_path)
+    assert second.get("logging.level") != "DEBUG"
+
+
+def test_config_reloads_modified_file(tmp_path):
+    """Test that a rewritten config file is parsed again."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("audio:\n  sample_rate: 22050\n")
+    assert ConfigManager(config_file).get("audio.sample_rate") == 22050
+
+    config_file.write_text("audio:\n  sample_rate: 48000\n")
+    os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+    assert ConfigManager(config_file).get("audio.sample_rate") == 48000
+
+
+def test_deep_merge_leaves_base_untouched(tmp_path):
+    """Test that merging nested overrides doesn't mutate the defaults."""
+    config = ConfigManager(tmp_path / "missing.yaml")
+    base = {"a": {"b": {"c": 1, "d": 2}}, "e": 3}
+
+    merged = config._deep_merge(base, {"a": {"b": {"c": 10}}, "f": 4})
+
+    assert merged == {"a": {"b": {"c": 10, "d": 2}}, "e": 3, "f": 4}
+    assert base == {"a": {"b": {"c": 1, "d": 2}}, "e": 3}
+
+
+def test_config_creates_directories_once(tmp_path, monkeypatch):
+    """Test that repeat constructions skip directories already created."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(f"paths:\n  library_cache: {tmp_path / 'cache'}\n")
+    ConfigManager(config_file)
+
+    made = []
+    monkeypatch.setattr("mixer.config.os.makedirs", lambda *a, **kw: made.append(a[0]))
+    ConfigManager(config_file)
+    assert str(tmp_path / "cache") not in made
+
+    reset_config()
+    ConfigManager(config_file)
+    assert str(tmp_path / "cache") in made
+
+
+def test_config_sidecar_is_opt_in(tmp_path, monkeypatch):
+    """Test no JSON cache is written anywhere unless a cache dir is configured."""
+    monkeypatch.delenv("MIXER_CONFIG_CACHE_DIR", raising=False)
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("audio:\n  sample_rate: 22050\n")
+
+    ConfigManager(config_file)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+
+
+def test_config_reads_json_sidecar(tmp_path, monkeypatch):
+    """Test that a fresh process reuses the JSON sidecar instead of YAML."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("MIXER_CONFIG_CACHE_DIR", str(cache_dir))
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("audio:\n  sample_rate: 22050\n")
+    ConfigManager(config_file)
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    reset_config()
+    monkeypatch.setattr("mixer.config.yaml.load", Mock(side_effect=AssertionError))
+    assert ConfigManager(config_file).get("audio.sample_rate") == 22050
+
+
+def test_config_sidecar_detects_edit_with_same_mtime(tmp_path, monkeypatch):
+    """Test an edit that keeps the file's mtime (e.g. cp -p) isn't served stale."""
+    monkeypatch.setenv("MIXER_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("audio:\n  sample_rate: 22050\n")
+    ConfigManager(config_file)
+    stat = config_file.stat()
+
+    config_file.write_text("audio:\n  sample_rate: 48000\n")
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    reset_config()
+
+    assert ConfigManager(config_file).get("audio.sample_rate") == 48000
@@ -1,22 +1,31 @@
 """Unit tests for Curator Agent (Phase 4)."""
 
+from types import MappingProxyType
+from unittest.mock import patch
+
+import numpy as np
 import pytest
-from unittest.mock import patch, MagicMock
 from mixer.agents.curator import (
     find_match,
     calculate_compatibility_score,
     recommend_mashup_type,
     find_all_pairs,
     CuratorError,
+    _score_matrix,
+    _song_arrays,
+    _bpm_candidate_pairs,
+    _passing_pairs,
+    _calculate_camelot_distance,
 )
 from mixer.types import SongMetadata, MatchResult
 
 
-# Test fixtures for sample song metadata
-@pytest.fixture
+# Test fixtures for sample song metadata (module-scoped and read-only; tests
+# that need variations build modified copies with dict(meta, key=value))
+@pytest.fixture(scope="module")
 def song_a_meta():
     """Sample song A metadata."""
-    return SongMetadata(
+    return MappingProxyType(SongMetadata(
         source="local_file",
         path="/path/to/song_a.wav",
         bpm=120.0,
@@ -54,13 +63,13 @@ def song_a_meta():
         ],
         emotional_arc="intro:hopeful → verse:doubt → chorus:defiant",
         word_timings=[],
-    )
+    ))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def song_b_meta():
     """Sample song B metadata - compatible with song A."""
-    return SongMetadata(
+    return MappingProxyType(SongMetadata(
         source="youtube",
         path="/path/to/song_b.wav",
         bpm=125.0,  # Within 5% of 120 (120 * 1.05 = 126)
@@ -98,13 +107,13 @@ def song_b_meta():
         ],
         emotional_arc="intro:calm → verse:building → chorus:explosive",
         word_timings=[],
-    )
+    ))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def song_c_meta():
     """Sample song C metadata - incompatible with song A."""
-    return SongMetadata(
+    return MappingProxyType(SongMetadata(
         source="local_file",
         path="/path/to/song_c.wav",
         bpm=80.0,  # Far from 120
@@ -126,7 +135,7 @@ def song_c_meta():
         sections=[],
         emotional_arc="intro:sad → verse:reflective → chorus:resigned",
         word_timings=[],
-    )
+    ))
 
 
 # Tests for calculate_compatibility_score
@@ -176,14 +185,105 @@ def test_calculate_compatibility_score_default_bpm(song_a_meta, song_b_meta):
     assert 0.0 <= score <= 1.0, "Score must be between 0 and 1"
 
 
+def test_score_matrix_matches_pairwise_score(song_a_meta, song_b_meta, song_c_meta):
+    """Test vectorized scoring agrees with the scalar score for every pair."""
+    metas = [
+        song_a_meta,
+        song_b_meta,
+        song_c_meta,
+        SongMetadata(camelot="Unknown"),
+        SongMetadata(camelot="Unknown"),
+        SongMetadata(camelot="13C"),
+    ]
+
+    scores = _score_matrix(_song_arrays(metas))
+
+    assert scores.shape == (6, 6)
+    for i, meta_a in enumerate(metas):
+        for j, meta_b in enumerate(metas):
+            expected, _ = calculate_compatibility_score(meta_a, meta_b)
+            assert scores[i, j] == expected
+
+
+def test_score_matrix_compiled_kernel_matches(monkeypatch, song_a_meta, song_b_meta, song_c_meta):
+    """Test the numba scoring kernel agrees with the NumPy path."""
+    pytest.importorskip("numba")
+    metas = [song_a_meta, song_b_meta, song_c_meta, SongMetadata(camelot="Unknown")]
+    weights = {"genre": 0.1, "bpm": 0.5, "key": 0.4}
+    songs = _song_arrays(metas)
+    expected = _score_matrix(songs, weights)
+
+    monkeypatch.setattr("mixer.agents.curator.NUMBA_MIN_SONGS", 0)
+
+    assert np.array_equal(_score_matrix(songs, weights), expected)
+
+
+def test_bpm_candidate_pairs_matches_brute_force():
+    """Test the BPM window enumerates exactly the in-tolerance pairs, in order."""
+    bpm = np.array([120.0, 80.0, 126.0, 121.0, 114.0, 120.0, 200.0])
+    window = 0.05
+
+    rows, cols = _bpm_candidate_pairs(bpm, window)
+
+    expected = [
+        (i, j)
+        for i in range(len(bpm))
+        for j in range(i + 1, len(bpm))
+        if abs(bpm[i] - bpm[j]) / bpm[i] <= window
+    ]
+    assert list(zip(rows.tolist(), cols.tolist())) == expected
+    assert len(_bpm_candidate_pairs(bpm, -0.01)[0]) == 0
+
+
+@pytest.mark.parametrize("block_rows", [1, 2, 3, 256])
+@pytest.mark.parametrize("compiled", [False, True], ids=["numpy", "numba"])
+def test_passing_pairs_matches_dense_scores(
+    monkeypatch, block_rows, compiled, song_a_meta, song_b_meta, song_c_meta
+):
+    """Test row-blocked scoring keeps exactly the passing i < j pairs, in order."""
+    if compiled:
+        pytest.importorskip("numba")
+        monkeypatch.setattr("mixer.agents.curator.NUMBA_MIN_SONGS", 0)
+    metas = [
+        song_a_meta,
+        song_b_meta,
+        song_c_meta,
+        SongMetadata(camelot="Unknown"),
+        SongMetadata(bpm=90.0, energy_level=2),
+        song_b_meta,
+        SongMetadata(bpm=122.0, primary_genre="Rock"),
+    ]
+    songs = _song_arrays(metas)
+    weights = {"bpm": 0.35, "key": 0.30, "energy": 0.20, "genre": 0.15}
+    monkeypatch.setattr("mixer.agents.curator.PAIR_BLOCK_ROWS", block_rows)
+
+    rows, cols, scores = _passing_pairs(songs, weights, 0.6)
+
+    dense = _score_matrix(songs, weights)
+    i, j = np.triu_indices(len(metas), k=1)
+    keep = dense[i, j] >= 0.6
+    assert rows.tolist() == i[keep].tolist()
+    assert cols.tolist() == j[keep].tolist()
+    assert np.array_equal(scores, dense[i, j][keep])
+
+
+def test_calculate_camelot_distance():
+    """Test Camelot wheel distances, including wrap-around and bad keys."""
+    assert _calculate_camelot_distance("8B", "8B") == 0
+    assert _calculate_camelot_distance("8B", "9B") == 1
+    assert _calculate_camelot_distance("8B", "8A") == 1
+    assert _calculate_camelot_distance("12A", "1A") == 1
+    assert _calculate_camelot_distance("8B", "9A") == 2
+    assert _calculate_camelot_distance("2B", "8B") == 6
+    assert _calculate_camelot_distance("8B", "Unknown") == 6
+
+
 # Tests for recommend_mashup_type
 def test_recommend_mashup_type_classic(song_a_meta, song_b_meta):
     """Test classic mashup recommendation for simple case."""
     # Modify metadata to favor classic mashup (good vocals, different energy)
-    song_a_classic = song_a_meta.copy()
-    song_b_classic = song_b_meta.copy()
-    song_a_classic["has_vocals"] = True
-    song_b_classic["has_vocals"] = False  # No vocals = instrumental
+    song_a_classic = dict(song_a_meta, has_vocals=True)
+    song_b_classic = dict(song_b_meta, has_vocals=False)  # No vocals = instrumental
 
     recommendation = recommend_mashup_type(song_a_classic, song_b_classic)
 
@@ -212,15 +312,14 @@ def test_recommend_mashup_type_energy_matched(song_a_meta, song_b_meta):
 
 def test_recommend_mashup_type_theme_fusion(song_a_meta, song_b_meta):
     """Test theme fusion recommendation."""
-    # Add overlapping themes to favor theme fusion
-    song_a_themed = song_a_meta.copy()
-    song_b_themed = song_b_meta.copy()
-
-    # Ensure sections have themes
-    if song_a_themed["sections"]:
-        song_a_themed["sections"][0]["themes"] = ["love", "hope"]
-    if song_b_themed["sections"]:
-        song_b_themed["sections"][0]["themes"] = ["love", "empowerment"]
+    # Add overlapping themes to favor theme fusion (on copies: the metadata
+    # fixtures are shared across the module)
+    song_a_themed = dict(song_a_meta, sections=[
+        dict(song_a_meta["sections"][0], themes=["love", "hope"])
+    ])
+    song_b_themed = dict(song_b_meta, sections=[
+        dict(song_b_meta["sections"][0], themes=["love", "empowerment"])
+    ])
 
     recommendation = recommend_mashup_type(song_a_themed, song_b_themed)
 
@@ -340,21 +439,52 @@ def test_find_match_genre_filter(mock_get_song, mock_query_hybrid, song_a_meta,
 
 
 # Tests for find_all_pairs
+
+class _FakeCollection:
+    """Minimal stand-in for a ChromaDB collection's get()."""
+
+    def __init__(self, data):
+        self._data = data
+        self.calls = 0
+
+    def get(self, where=None, include=None):
+        self.calls += 1
+        if not where:
+            return self._data
+        keep = [
+            i for i, meta in enumerate(self._data["metadatas"])
+            if all(meta.get(k) == v for k, v in where.items())
+        ]
+        return {
+            "ids": [self._data["ids"][i] for i in keep],
+            "metadatas": [self._data["metadatas"][i] for i in keep],
+        }
+
+
+class _FakeClient:
+    """Minimal stand-in for ChromaClient, serving one fake collection."""
+
+    def __init__(self, data):
+        self.collection = _FakeCollection(data)
+
+    def get_collection(self):
+        return self.collection
+
+
 @patch("mixer.memory.get_client")
 def test_find_all_pairs_success(mock_get_client, song_a_meta, song_b_meta):
     """Test find_all_pairs batch processing."""
-    # Mock ChromaDB client
-    mock_collection = MagicMock()
-    mock_collection.get.return_value = {
+    # Fake ChromaDB client
+    mock_get_client.return_value = _FakeClient({
         "ids": ["artist_a_song_a", "artist_b_song_b"],
         "metadatas": [song_a_meta, song_b_meta],
-    }
-    mock_client = MagicMock()
-    mock_client.get_collection.return_value = mock_collection
-    mock_get_client.return_value = mock_client
+    })
 
     results = find_all_pairs(max_pairs=10, min_compatibility=0.5)
 
+    # Whole library is fetched in a single query
+    assert mock_get_client.return_value.collection.calls == 1
+
     # Should return at least one pair (A-B or B-A)
     assert len(results) >= 0, "Should return list of pairs"
     assert isinstance(results, list), "Should return list"
@@ -363,15 +493,11 @@ def test_find_all_pairs_success(mock_get_client, song_a_meta, song_b_meta):
 @patch("mixer.memory.get_client")
 def test_find_all_pairs_min_compatibility_filter(mock_get_client, song_a_meta, song_c_meta):
     """Test find_all_pairs filters by minimum compatibility."""
-    # Mock ChromaDB with incompatible songs
-    mock_collection = MagicMock()
-    mock_collection.get.return_value = {
+    # Fake ChromaDB with incompatible songs
+    mock_get_client.return_value = _FakeClient({
         "ids": ["artist_a_song_a", "artist_c_song_c"],
         "metadatas": [song_a_meta, song_c_meta],
-    }
-    mock_client = MagicMock()
-    mock_client.get_collection.return_value = mock_collection
-    mock_get_client.return_value = mock_client
+    })
 
     results = find_all_pairs(max_pairs=5, min_compatibility=0.8)
 
@@ -386,15 +512,11 @@ def test_find_all_pairs_min_compatibility_filter(mock_get_client, song_a_meta, s
 @patch("mixer.memory.get_client")
 def test_find_all_pairs_genre_filter(mock_get_client, song_a_meta, song_b_meta, song_c_meta):
     """Test find_all_pairs with genre filtering."""
-    # Mock ChromaDB with mixed genres
-    mock_collection = MagicMock()
-    mock_collection.get.return_value = {
+    # Fake ChromaDB with mixed genres
+    mock_get_client.return_value = _FakeClient({
         "ids": ["artist_a_song_a", "artist_b_song_b", "artist_c_song_c"],
         "metadatas": [song_a_meta, song_b_meta, song_c_meta],
-    }
-    mock_client = MagicMock()
-    mock_client.get_collection.return_value = mock_collection
-    mock_get_client.return_value = mock_client
+    })
 
     results = find_all_pairs(max_pairs=5, genre_filter="Pop")
 
@@ -407,15 +529,32 @@ def test_find_all_pairs_genre_filter(mock_get_client, song_a_meta, song_b_meta,
         assert song_a_id != "artist_c_song_c" or song_b_id != "artist_c_song_c"
 
 
+@patch("mixer.memory.get_client")
+def test_find_all_pairs_top_pairs_ordered(mock_get_client, song_a_meta, song_b_meta, song_c_meta):
+    """Test find_all_pairs returns the best max_pairs pairs, best first."""
+    metas = [song_a_meta, song_b_meta, song_c_meta, dict(song_b_meta, bpm=121.0)]
+    ids = ["a", "b", "c", "d"]
+    mock_get_client.return_value = _FakeClient({"ids": ids, "metadatas": metas})
+
+    results = find_all_pairs(max_pairs=2, min_compatibility=0.0)
+
+    expected = sorted(
+        (
+            (calculate_compatibility_score(metas[i], metas[j])[0], ids[i], ids[j])
+            for i in range(len(ids))
+            for j in range(i + 1, len(ids))
+        ),
+        key=lambda x: x[0],
+        reverse=True,
+    )[:2]
+    assert [(p["compatibility_score"], p["song_a_id"], p["song_b_id"]) for p in results] == expected
+
+
 @patch("mixer.memory.get_client")
 def test_find_all_pairs_empty_library(mock_get_client):
     """Test find_all_pairs with empty library."""
-    # Mock empty ChromaDB
-    mock_collection = MagicMock()
-    mock_collection.get.return_value = {"ids": [], "metadatas": []}
-    mock_client = MagicMock()
-    mock_client.get_collection.return_value = mock_collection
-    mock_get_client.return_value = mock_client
+    # Fake empty ChromaDB
+    mock_get_client.return_value = _FakeClient({"ids": [], "metadatas": []})
 
     results = find_all_pairs(max_pairs=10)
 
@@ -3,8 +3,10 @@
 import pytest
 import numpy as np
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import DEFAULT, Mock, patch
 
+from mixer.agents import engineer
 from mixer.agents.engineer import (
     create_classic_mashup,
     create_stem_swap_mashup,
@@ -26,55 +28,55 @@ from mixer.audio.processing import (
     calculate_semitone_shift,
     ProcessingError
 )
+from tests.helpers import frozen_sections
 
+# librosa/numba deprecation and user warnings are noise here; no test
+# asserts on warnings
+pytestmark = pytest.mark.filterwarnings(
+    "ignore::DeprecationWarning", "ignore::UserWarning"
+)
+
+
+# Values mirror the engineer's own fallbacks in config.get()
+_ENGINEER_CONFIG = MappingProxyType({
+    "models.demucs_model": "htdemucs",
+    "curator.max_stretch_ratio": 1.2,
+    "engineer.vocal_attenuation_db": -2.0,
+    "engineer.default_quality": "high",
+})
 
-@pytest.fixture
-def mock_audio_data():
-    """Generate mock audio data for testing."""
-    sr = 44100
-    duration = 3.0  # 3 seconds
-    samples = int(sr * duration)
-    # Generate simple sine wave
-    audio = np.sin(2 * np.pi * 440 * np.arange(samples) / sr).astype(np.float32)
-    return audio, sr
+
+@pytest.fixture(scope="session")
+def engineer_output_dir(tmp_path_factory):
+    """Output directory shared by all engineer tests; exports are mocked."""
+    return tmp_path_factory.mktemp("engineer")
 
 
 @pytest.fixture
-def mock_song_metadata():
-    """Mock song metadata."""
-    return {
-        "path": "/fake/path/song.wav",
-        "bpm": 120.0,
-        "key": "Cmaj",
-        "camelot": "8B",
-        "first_downbeat_sec": 0.5,
-        "sample_rate": 44100,
-        "duration_sec": 180.0,
-        "has_vocals": True,
-        "artist": "Test Artist",
-        "title": "Test Song",
-    }
+def engineer_config_mock(engineer_output_dir):
+    """Mock config returning engineer settings and the shared output dir."""
+    config_mock = Mock(spec=["get", "get_path"])
+    config_mock.get.side_effect = _ENGINEER_CONFIG.get
+    config_mock.get_path.return_value = engineer_output_dir
+    return config_mock
 
 
 @pytest.fixture
-def mock_stems():
-    """Mock separated stems."""
-    sr = 44100
-    duration = 3.0
-    samples = int(sr * duration)
-
-    # Create simple mock stems
-    vocals = np.random.randn(samples).astype(np.float32) * 0.1
-    drums = np.random.randn(samples).astype(np.float32) * 0.1
-    bass = np.random.randn(samples).astype(np.float32) * 0.1
-    other = np.random.randn(samples).astype(np.float32) * 0.1
-
-    return {
-        "vocals": vocals,
-        "drums": drums,
-        "bass": bass,
-        "other": other,
-    }
+def engineer_mocks(engineer_config_mock):
+    """Patch song loading, stem separation and config in the engineer module.
+
+    Patches are entered together through ``patch.multiple``; tests set
+    ``side_effect``/``return_value`` on the yielded mocks instead of stacking
+    ``@patch`` decorators.
+    """
+    with patch.multiple(
+        engineer,
+        _load_song_audio=DEFAULT,
+        separate_stems=DEFAULT,
+        get_config=DEFAULT,
+    ) as mocks:
+        mocks["get_config"].return_value = engineer_config_mock
+        yield mocks
 
 
 class TestStretchRatioCalculation:
@@ -99,9 +101,9 @@ class TestStretchRatioCalculation:
 class TestLoadSongAudio:
     """Test song audio loading from library."""
 
-    @patch("mixer.agents.engineer.get_song")
-    @patch("mixer.agents.engineer.librosa.load")
-    @patch("mixer.agents.engineer.Path")
+    @patch.object(engineer, "get_song")
+    @patch.object(engineer.librosa, "load")
+    @patch.object(engineer, "Path")
     def test_load_song_success(self, mock_path, mock_librosa_load, mock_get_song, mock_audio_data, mock_song_metadata):
         """Should load song audio and metadata successfully."""
         audio, sr = mock_audio_data
@@ -111,11 +113,11 @@ class TestLoadSongAudio:
 
         loaded_audio, loaded_metadata = _load_song_audio("test_song_id")
 
-        assert np.array_equal(loaded_audio, audio)
+        assert loaded_audio is audio
         assert loaded_metadata == mock_song_metadata
         mock_get_song.assert_called_once_with("test_song_id")
 
-    @patch("mixer.agents.engineer.get_song")
+    @patch.object(engineer, "get_song")
     def test_load_song_not_found(self, mock_get_song):
         """Should raise SongNotFoundError when song not in library."""
         mock_get_song.return_value = None
@@ -123,8 +125,8 @@ class TestLoadSongAudio:
         with pytest.raises(SongNotFoundError, match="not found in library"):
             _load_song_audio("nonexistent_song")
 
-    @patch("mixer.agents.engineer.get_song")
-    @patch("mixer.agents.engineer.Path")
+    @patch.object(engineer, "get_song")
+    @patch.object(engineer, "Path")
     def test_load_song_file_missing(self, mock_path, mock_get_song, mock_song_metadata):
         """Should raise EngineerError when audio file doesn't exist."""
         mock_get_song.return_value = mock_song_metadata
@@ -133,9 +135,9 @@ class TestLoadSongAudio:
         with pytest.raises(EngineerError, match="Audio file not found"):
             _load_song_audio("test_song")
 
-    @patch("mixer.agents.engineer.get_song")
-    @patch("mixer.agents.engineer.librosa.load")
-    @patch("mixer.agents.engineer.Path")
+    @patch.object(engineer, "get_song")
+    @patch.object(engineer.librosa, "load")
+    @patch.object(engineer, "Path")
     def test_load_song_librosa_error(self, mock_path, mock_librosa_load, mock_get_song, mock_song_metadata):
         """Should raise EngineerError when librosa fails to load."""
         mock_get_song.return_value = mock_song_metadata
@@ -149,55 +151,39 @@ class TestLoadSongAudio:
 class TestClassicMashup:
     """Test classic mashup creation (vocal A + instrumental B)."""
 
-    @patch("mixer.agents.engineer._load_song_audio")
-    @patch("mixer.agents.engineer.separate_stems")
-    @patch("mixer.agents.engineer.combine_stems")
-    @patch("mixer.agents.engineer.time_stretch")
-    @patch("mixer.agents.engineer.align_to_grid")
-    @patch("mixer.agents.engineer.mix_and_export")
-    @patch("mixer.agents.engineer.get_config")
+    @patch.object(engineer, "combine_stems")
+    @patch.object(engineer, "time_stretch")
+    @patch.object(engineer, "align_to_grid")
+    @patch.object(engineer, "mix_and_export")
     def test_create_classic_mashup_success(
         self,
-        mock_config,
         mock_mix_export,
         mock_align,
         mock_stretch,
         mock_combine,
-        mock_separate,
-        mock_load,
+        engineer_mocks,
         mock_audio_data,
         mock_song_metadata,
         mock_stems,
-        tmp_path
+        engineer_output_dir
     ):
         """Should create classic mashup successfully."""
         # Setup mocks
         audio, sr = mock_audio_data
-        vocal_meta = mock_song_metadata.copy()
-        vocal_meta["bpm"] = 120.0
-        inst_meta = mock_song_metadata.copy()
-        inst_meta["bpm"] = 100.0
+        vocal_meta = dict(mock_song_metadata, bpm=120.0)
+        inst_meta = dict(mock_song_metadata, bpm=100.0)
 
+        mock_load = engineer_mocks["_load_song_audio"]
+        mock_separate = engineer_mocks["separate_stems"]
         mock_load.side_effect = [(audio, vocal_meta), (audio, inst_meta)]
         mock_separate.return_value = mock_stems
         mock_combine.return_value = audio
         mock_stretch.return_value = audio
         mock_align.return_value = (audio, audio)
 
-        output_path = tmp_path / "mashup.mp3"
+        output_path = engineer_output_dir / "mashup.mp3"
         mock_mix_export.return_value = str(output_path)
 
-        # Mock config
-        config_mock = MagicMock()
-        config_mock.get.side_effect = lambda key, default=None: {
-            "models.demucs_model": "htdemucs",
-            "curator.max_stretch_ratio": 1.2,
-            "engineer.vocal_attenuation_db": -2.0,
-            "engineer.default_quality": "high",
-        }.get(key, default)
-        config_mock.get_path.return_value = tmp_path
-        mock_config.return_value = config_mock
-
         # Create mashup
         result = create_classic_mashup("vocal_song", "inst_song", output_format="mp3")
 
@@ -209,131 +195,92 @@ class TestClassicMashup:
         mock_align.assert_called_once()
         mock_mix_export.assert_called_once()
 
-    @patch("mixer.agents.engineer._load_song_audio")
-    @patch("mixer.agents.engineer.separate_stems")
-    @patch("mixer.agents.engineer.combine_stems")
-    @patch("mixer.agents.engineer.get_config")
+    @patch.object(engineer, "combine_stems")
     def test_create_classic_mashup_missing_bpm(
         self,
-        mock_config,
         mock_combine,
-        mock_separate,
-        mock_load,
+        engineer_mocks,
         mock_audio_data,
         mock_song_metadata,
         mock_stems
     ):
         """Should raise EngineerError when BPM metadata is missing."""
         audio, sr = mock_audio_data
-        vocal_meta = mock_song_metadata.copy()
-        vocal_meta["bpm"] = None  # Missing BPM
-        inst_meta = mock_song_metadata.copy()
+        vocal_meta = dict(mock_song_metadata, bpm=None)  # Missing BPM
+        inst_meta = dict(mock_song_metadata)
 
-        mock_load.side_effect = [(audio, vocal_meta), (audio, inst_meta)]
-        mock_separate.return_value = mock_stems
+        engineer_mocks["_load_song_audio"].side_effect = [(audio, vocal_meta), (audio, inst_meta)]
+        engineer_mocks["separate_stems"].return_value = mock_stems
         mock_combine.return_value = audio
 
-        config_mock = MagicMock()
-        config_mock.get.side_effect = lambda key, default=None: {
-            "models.demucs_model": "htdemucs",
-            "engineer.default_quality": "high",
-        }.get(key, default)
-        mock_config.return_value = config_mock
-
         with pytest.raises(EngineerError, match="Missing BPM metadata"):
             create_classic_mashup("vocal_song", "inst_song")
 
-    @patch("mixer.agents.engineer._load_song_audio")
-    @patch("mixer.agents.engineer.separate_stems")
-    @patch("mixer.agents.engineer.get_config")
+    @patch.object(engineer, "time_stretch")
     def test_create_classic_mashup_extreme_stretch(
         self,
-        mock_config,
-        mock_separate,
-        mock_load,
+        mock_stretch,
+        engineer_mocks,
         mock_audio_data,
         mock_song_metadata,
-        mock_stems
+        mock_stems,
+        caplog
     ):
         """Should warn but continue when stretch ratio exceeds max."""
         audio, sr = mock_audio_data
-        vocal_meta = mock_song_metadata.copy()
-        vocal_meta["bpm"] = 80.0  # Very different BPMs
-        inst_meta = mock_song_metadata.copy()
-        inst_meta["bpm"] = 160.0  # Ratio = 2.0
+        vocal_meta = dict(mock_song_metadata, bpm=80.0)  # Very different BPMs
+        inst_meta = dict(mock_song_metadata, bpm=160.0)  # Ratio = 2.0
 
-        mock_load.side_effect = [(audio, vocal_meta), (audio, inst_meta)]
-        mock_separate.return_value = mock_stems
+        # max_stretch_ratio is 1.2 but the ratio here is 2.0
+        engineer_mocks["_load_song_audio"].side_effect = [(audio, vocal_meta), (audio, inst_meta)]
+        engineer_mocks["separate_stems"].return_value = mock_stems
 
-        config_mock = MagicMock()
-        config_mock.get.side_effect = lambda key, default=None: {
-            "models.demucs_model": "htdemucs",
-            "curator.max_stretch_ratio": 1.2,  # Max is 1.2 but ratio is 2.0
-            "engineer.default_quality": "high",
-        }.get(key, default)
-        mock_config.return_value = config_mock
-
-        # Should log warning but not fail (within 0.5-2.0 absolute bounds)
-        # This would continue to time_stretch which we haven't mocked
-        # So it will fail, but for a different reason
-        with pytest.raises(Exception):  # Will fail at time_stretch
+        # Stop at time_stretch; reaching it proves the ratio only warned
+        mock_stretch.side_effect = ProcessingError("stretch exceeds bounds")
+
+        with pytest.raises(ProcessingError, match="stretch exceeds bounds"):
             create_classic_mashup("vocal_song", "inst_song")
 
+        assert mock_stretch.call_args.kwargs["stretch_ratio"] == pytest.approx(2.0)
+        assert "exceeds max" in caplog.text
+
 
 class TestStemSwapMashup:
     """Test stem role swapping mashup."""
 
-    def test_invalid_config_too_few_stems(self):
-        """Should raise MashupConfigError with < 2 stems."""
-        with pytest.raises(MashupConfigError, match="at least 2 stems"):
-            create_stem_swap_mashup({"vocals": "song1"})
-
-    def test_invalid_config_invalid_stem_type(self):
-        """Should raise MashupConfigError for invalid stem type."""
-        with pytest.raises(MashupConfigError, match="Invalid stem type"):
-            create_stem_swap_mashup({
-                "vocals": "song1",
-                "invalid_stem": "song2"
-            })
-
-    def test_invalid_config_same_song(self):
-        """Should raise MashupConfigError when all stems from same song."""
-        with pytest.raises(MashupConfigError, match="at least 2 different songs"):
-            create_stem_swap_mashup({
-                "vocals": "song1",
-                "drums": "song1"
-            })
-
-    @patch("mixer.agents.engineer._load_song_audio")
-    @patch("mixer.agents.engineer.separate_stems")
-    @patch("mixer.agents.engineer.time_stretch")
-    @patch("mixer.agents.engineer.get_config")
+    @pytest.mark.parametrize("stem_config,match", [
+        ({"vocals": "song1"}, "at least 2 stems"),
+        ({"vocals": "song1", "invalid_stem": "song2"}, "Invalid stem type"),
+        ({"vocals": "song1", "drums": "song1"}, "at least 2 different songs"),
+    ])
+    def test_invalid_config(self, stem_config, match):
+        """Should raise MashupConfigError for invalid stem configurations."""
+        with pytest.raises(MashupConfigError, match=match):
+            create_stem_swap_mashup(stem_config)
+
+    @patch.object(engineer, "time_stretch")
     @patch("mixer.audio.processing.numpy_to_audiosegment")
-    @patch("mixer.agents.engineer.Path")
+    @patch.object(engineer, "Path")
     def test_create_stem_swap_success(
         self,
         mock_path_class,
         mock_to_audioseg,
-        mock_config,
         mock_stretch,
-        mock_separate,
-        mock_load,
+        engineer_mocks,
         mock_audio_data,
         mock_song_metadata,
-        mock_stems,
-        tmp_path
+        mock_stems
     ):
         """Should create stem swap mashup successfully."""
         audio, sr = mock_audio_data
 
         # Create different songs with different BPMs
-        song1_meta = mock_song_metadata.copy()
-        song1_meta["bpm"] = 120.0
-        song2_meta = mock_song_metadata.copy()
-        song2_meta["bpm"] = 100.0
-        song3_meta = mock_song_metadata.copy()
-        song3_meta["bpm"] = 110.0
+        song1_meta = dict(mock_song_metadata, bpm=120.0)
+        song2_meta = dict(mock_song_metadata, bpm=100.0)
+        song3_meta = dict(mock_song_metadata, bpm=110.0)
 
+        mock_load = engineer_mocks["_load_song_audio"]
+        mock_separate = engineer_mocks["separate_stems"]
         mock_load.side_effect = [
             (audio, song1_meta),
             (audio, song2_meta),
@@ -342,22 +289,13 @@ class TestStemSwapMashup:
         mock_separate.return_value = mock_stems
         mock_stretch.return_value = audio
 
-        # Mock config
-        config_mock = MagicMock()
-        config_mock.get.side_effect = lambda key, default=None: {
-            "models.demucs_model": "htdemucs",
-            "engineer.default_quality": "high",
-        }.get(key, default)
-        config_mock.get_path.return_value = tmp_path
-        mock_config.return_value = config_mock
-
         # Mock AudioSegment export
-        mock_audioseg = MagicMock()
+        mock_audioseg = Mock(spec=["export"])
         mock_to_audioseg.return_value = mock_audioseg
 
         # Mock Path operations
-        mock_path_instance = MagicMock()
-        mock_path_instance.parent.mkdir = MagicMock()
+        mock_path_instance = Mock(spec=["parent"])
+        mock_path_instance.parent = Mock(spec=["mkdir"])
         mock_path_class.return_value = mock_path_instance
 
         # Create stem swap mashup
@@ -378,14 +316,9 @@ class TestStemSwapMashup:
         assert mock_stretch.call_count == 3
         mock_audioseg.export.assert_called_once()
 
-    @patch("mixer.agents.engineer._load_song_audio")
-    @patch("mixer.agents.engineer.separate_stems")
-    @patch("mixer.agents.engineer.get_config")
     def test_create_stem_swap_missing_bpm(
         self,
-        mock_config,
-        mock_separate,
-        mock_load,
+        engineer_mocks,
         mock_audio_data,
         mock_song_metadata,
         mock_stems
@@ -393,17 +326,11 @@ class TestStemSwapMashup:
         """Should raise EngineerError when any song is missing BPM."""
         audio, sr = mock_audio_data
 
-        song1_meta = mock_song_metadata.copy()
-        song1_meta["bpm"] = 120.0
-        song2_meta = mock_song_metadata.copy()
-        song2_meta["bpm"] = None  # Missing!
-
-        mock_load.side_effect = [(audio, song1_meta), (audio, song2_meta)]
-        mock_separate.return_value = mock_stems
+        song1_meta = dict(mock_song_metadata, bpm=120.0)
+        song2_meta = dict(mock_song_metadata, bpm=None)  # Missing!
 
-        config_mock = MagicMock()
-        config_mock.get.return_value = "htdemucs"
-        mock_config.return_value = config_mock
+        engineer_mocks["_load_song_audio"].side_effect = [(audio, song1_meta), (audio, song2_meta)]
+        engineer_mocks["separate_stems"].return_value = mock_stems
 
         with pytest.raises(EngineerError, match="Missing BPM"):
             create_stem_swap_mashup({
@@ -415,114 +342,89 @@ class TestStemSwapMashup:
 class TestIntegration:
     """Integration tests with minimal mocking."""
 
-    @patch("mixer.agents.engineer.get_song")
-    @patch("mixer.agents.engineer.librosa.load")
-    @patch("mixer.agents.engineer.Path")
-    def test_load_song_integration(self, mock_path, mock_librosa, mock_get_song):
+    @patch.object(engineer, "get_song")
+    @patch.object(engineer.librosa, "load")
+    @patch.object(engineer, "Path")
+    def test_load_song_integration(
+        self, mock_path, mock_librosa, mock_get_song, mock_stems
+    ):
         """Test _load_song_audio with realistic data."""
+        # Any stem works as a loaded audio buffer
+        audio = mock_stems["vocals"]
+        sr = 8000
+
         # Create realistic metadata
         metadata = {
             "path": "/fake/song.wav",
             "bpm": 120.0,
             "key": "Cmaj",
-            "sample_rate": 44100,
+            "sample_rate": sr,
             "duration_sec": 180.0,
         }
 
-        # Create realistic audio
-        sr = 44100
-        duration = 1.0
-        samples = int(sr * duration)
-        audio = np.random.randn(samples).astype(np.float32) * 0.1
-
         mock_get_song.return_value = metadata
         mock_librosa.return_value = (audio, sr)
         mock_path.return_value.exists.return_value = True
 
         loaded_audio, loaded_meta = _load_song_audio("test_song")
 
-        assert loaded_audio.shape == audio.shape
+        assert loaded_audio is audio
         assert loaded_meta == metadata
 
 
 class TestPitchShifting:
     """Test pitch-shifting and key conversion."""
 
-    def test_calculate_semitone_shift_same_key(self):
-        """Should return 0 for same key."""
-        shift = calculate_semitone_shift("Cmaj", "Cmaj")
-        assert shift == 0
-
-    def test_calculate_semitone_shift_up(self):
-        """Should calculate positive shift for higher keys."""
-        shift = calculate_semitone_shift("Cmaj", "Dmaj")
-        assert shift == 2
-
-    def test_calculate_semitone_shift_down(self):
-        """Should calculate negative shift for lower keys."""
-        shift = calculate_semitone_shift("Dmaj", "Cmaj")
-        assert shift == -2
-
-    def test_calculate_semitone_shift_sharp(self):
-        """Should handle sharp keys."""
-        shift = calculate_semitone_shift("Cmaj", "F#maj")
-        assert shift == 6
-
-    def test_calculate_semitone_shift_flat(self):
-        """Should handle flat keys."""
-        shift = calculate_semitone_shift("Cmaj", "Bbmaj")
-        assert shift == -2  # Shortest path
-
-    def test_calculate_semitone_shift_shortest_path(self):
-        """Should use shortest path on chromatic circle."""
-        # C to F# = +6 (not +6 or -6, both work)
-        shift = calculate_semitone_shift("Cmaj", "F#maj")
-        assert abs(shift) == 6
-
-    def test_calculate_semitone_shift_normalized_format(self):
-        """Should handle various key format normalizations."""
-        assert calculate_semitone_shift("C major", "D major") == 2
-        assert calculate_semitone_shift("A minor", "B minor") == 2
+    @pytest.mark.parametrize("source,target,expected", [
+        ("Cmaj", "Cmaj", 0),
+        ("Cmaj", "Dmaj", 2),
+        ("Dmaj", "Cmaj", -2),
+        ("Cmaj", "F#maj", 6),  # Tritone: +6, either direction is shortest
+        ("Cmaj", "Bbmaj", -2),  # Shortest path on chromatic circle
+        ("C major", "D major", 2),  # Normalized key formats
+        ("A minor", "B minor", 2),
+    ])
+    def test_calculate_semitone_shift(self, source, target, expected):
+        """Should calculate the shortest semitone shift between keys."""
+        assert calculate_semitone_shift(source, target) == expected
 
     def test_calculate_semitone_shift_invalid_key(self):
         """Should raise ProcessingError for invalid keys."""
         with pytest.raises(ProcessingError, match="Invalid key"):
             calculate_semitone_shift("Xmaj", "Cmaj")
 
-    def test_pitch_shift_zero_semitones(self, mock_audio_data):
+    def test_pitch_shift_zero_semitones(self):
         """Should skip processing for zero semitones."""
-        audio, sr = mock_audio_data
+        audio = np.empty(0, dtype=np.float32)
 
-        result = pitch_shift(audio, sr, semitones=0)
+        result = pitch_shift(audio, 44100, semitones=0)
 
         # Should return original audio without calling librosa
-        assert np.array_equal(result, audio)
+        assert result is audio
+
+
+# Sections with energy levels for energy matching.
+_ENERGY_SECTIONS_A = frozen_sections([
+    {"section_type": "intro", "start_sec": 0.0, "end_sec": 10.0, "energy_level": 0.3},
+    {"section_type": "verse", "start_sec": 10.0, "end_sec": 30.0, "energy_level": 0.5},
+    {"section_type": "chorus", "start_sec": 30.0, "end_sec": 50.0, "energy_level": 0.9},
+])
+_ENERGY_SECTIONS_B = frozen_sections([
+    {"section_type": "intro", "start_sec": 0.0, "end_sec": 8.0, "energy_level": 0.4},
+    {"section_type": "verse", "start_sec": 8.0, "end_sec": 28.0, "energy_level": 0.6},
+    {"section_type": "chorus", "start_sec": 28.0, "end_sec": 48.0, "energy_level": 0.8},
+])
 
 
 class TestEnergyMatchedMashup:
     """Test energy-matched mashup creation."""
 
-    @pytest.fixture
-    def mock_sections(self):
-        """Create mock section metadata."""
-        sections_a = [
-            {"section_type": "intro", "start_sec": 0.0, "end_sec": 10.0, "energy_level": 0.3},
-            {"section_type": "verse", "start_sec": 10.0, "end_sec": 30.0, "energy_level": 0.5},
-            {"section_type": "chorus", "start_sec": 30.0, "end_sec": 50.0, "energy_level": 0.9},
-        ]
-        sections_b = [
-            {"section_type": "intro", "start_sec": 0.0, "end_sec": 8.0, "energy_level": 0.4},
-            {"section_type": "verse", "start_sec": 8.0, "end_sec": 28.0, "energy_level": 0.6},
-            {"section_type": "chorus", "start_sec": 28.0, "end_sec": 48.0, "energy_level": 0.8},
-        ]
-        return sections_a, sections_b
-
-    @patch("mixer.agents.engineer._load_song_audio")
-    @patch("mixer.agents.engineer.time_stretch")
-    @patch("mixer.agents.engineer.get_config")
+    @patch.object(engineer, "_load_song_audio")
+    @patch.object(engineer, "time_stretch")
+    @patch.object(engineer, "get_config")
     @patch("mixer.audio.processing.numpy_to_audiosegment")
     @patch("pydub.effects.normalize")
-    @patch("mixer.agents.engineer.Path")
+    @patch.object(engineer, "Path")
     def test_create_energy_matched_success(
         self,
         mock_path_class,
@@ -533,39 +435,29 @@ class TestEnergyMatchedMashup:
         mock_load,
         mock_audio_data,
         mock_song_metadata,
-        mock_sections,
-        tmp_path
+        engineer_config_mock
     ):
         """Should create energy-matched mashup successfully."""
         audio, sr = mock_audio_data
-        sections_a, sections_b = mock_sections
 
         # Setup metadata with sections
-        meta_a = mock_song_metadata.copy()
-        meta_a["sections"] = sections_a
-        meta_a["bpm"] = 120.0
-
-        meta_b = mock_song_metadata.copy()
-        meta_b["sections"] = sections_b
-        meta_b["bpm"] = 100.0
+        meta_a = dict(mock_song_metadata, sections=_ENERGY_SECTIONS_A, bpm=120.0)
+        meta_b = dict(mock_song_metadata, sections=_ENERGY_SECTIONS_B, bpm=100.0)
 
         mock_load.side_effect = [(audio, meta_a), (audio, meta_b)]
         mock_stretch.return_value = audio
 
         # Mock config
-        config_mock = MagicMock()
-        config_mock.get.return_value = "high"
-        config_mock.get_path.return_value = tmp_path
-        mock_config.return_value = config_mock
+        mock_config.return_value = engineer_config_mock
 
         # Mock AudioSegment
-        mock_audioseg = MagicMock()
+        mock_audioseg = Mock(spec=["export"])
         mock_to_audioseg.return_value = mock_audioseg
         mock_normalize.return_value = mock_audioseg
 
         # Mock Path
-        mock_path_instance = MagicMock()
-        mock_path_instance.parent.mkdir = MagicMock()
+        mock_path_instance = Mock(spec=["parent"])
+        mock_path_instance.parent = Mock(spec=["mkdir"])
         mock_path_class.return_value = mock_path_instance
 
         # Create energy-matched mashup
@@ -581,7 +473,7 @@ class TestEnergyMatchedMashup:
         mock_stretch.assert_called_once()
         mock_audioseg.export.assert_called_once()
 
-    @patch("mixer.agents.engineer._load_song_audio")
+    @patch.object(engineer, "_load_song_audio")
     def test_create_energy_matched_missing_sections(
         self,
         mock_load,
@@ -592,10 +484,8 @@ class TestEnergyMatchedMashup:
         audio, sr = mock_audio_data
 
         # No sections metadata
-        meta_a = mock_song_metadata.copy()
-        meta_a["sections"] = []
-        meta_b = mock_song_metadata.copy()
-        meta_b["sections"] = []
+        meta_a = dict(mock_song_metadata, sections=[])
+        meta_b = dict(mock_song_metadata, sections=[])
 
         mock_load.side_effect = [(audio, meta_a), (audio, meta_b)]
 
@@ -606,15 +496,15 @@ class TestEnergyMatchedMashup:
 class TestAdaptiveHarmonyMashup:
     """Test adaptive harmony mashup with pitch-shifting."""
 
-    @patch("mixer.agents.engineer._load_song_audio")
-    @patch("mixer.agents.engineer.separate_stems")
-    @patch("mixer.agents.engineer.combine_stems")
-    @patch("mixer.agents.engineer.pitch_shift")
-    @patch("mixer.agents.engineer.calculate_semitone_shift")
-    @patch("mixer.agents.engineer.time_stretch")
-    @patch("mixer.agents.engineer.align_to_grid")
-    @patch("mixer.agents.engineer.mix_and_export")
-    @patch("mixer.agents.engineer.get_config")
+    @patch.object(engineer, "_load_song_audio")
+    @patch.object(engineer, "separate_stems")
+    @patch.object(engineer, "combine_stems")
+    @patch.object(engineer, "pitch_shift")
+    @patch.object(engineer, "calculate_semitone_shift")
+    @patch.object(engineer, "time_stretch")
+    @patch.object(engineer, "align_to_grid")
+    @patch.object(engineer, "mix_and_export")
+    @patch.object(engineer, "get_config")
     def test_create_adaptive_harmony_with_shift(
         self,
         mock_config,
@@ -629,19 +519,15 @@ class TestAdaptiveHarmonyMashup:
         mock_audio_data,
         mock_song_metadata,
         mock_stems,
-        tmp_path
+        engineer_output_dir,
+        engineer_config_mock
     ):
         """Should create adaptive harmony mashup with pitch-shifting."""
         audio, sr = mock_audio_data
 
         # Setup metadata with different keys
-        meta_a = mock_song_metadata.copy()
-        meta_a["key"] = "Cmaj"
-        meta_a["bpm"] = 120.0
-
-        meta_b = mock_song_metadata.copy()
-        meta_b["key"] = "Dmaj"  # Different key
-        meta_b["bpm"] = 120.0
+        meta_a = dict(mock_song_metadata, key="Cmaj", bpm=120.0)
+        meta_b = dict(mock_song_metadata, key="Dmaj", bpm=120.0)  # Different key
 
         mock_load.side_effect = [(audio, meta_a), (audio, meta_b)]
         mock_separate.return_value = mock_stems
@@ -650,17 +536,10 @@ class TestAdaptiveHarmonyMashup:
         mock_pitch_shift.return_value = audio
         mock_stretch.return_value = audio
         mock_align.return_value = (audio, audio)
-        mock_mix_export.return_value = str(tmp_path / "output.mp3")
+        mock_mix_export.return_value = str(engineer_output_dir / "output.mp3")
 
         # Mock config
-        config_mock = MagicMock()
-        config_mock.get.side_effect = lambda key, default=None: {
-            "models.demucs_model": "htdemucs",
-            "engineer.vocal_attenuation_db": -2.0,
-            "engineer.default_quality": "high",
-        }.get(key, default)
-        config_mock.get_path.return_value = tmp_path
-        mock_config.return_value = config_mock
+        mock_config.return_value = engineer_config_mock
 
         # Create adaptive harmony mashup
         result = create_adaptive_harmony_mashup("song_a", "song_b")
@@ -670,7 +549,7 @@ class TestAdaptiveHarmonyMashup:
         mock_pitch_shift.assert_called()  # Should pitch-shift
         mock_mix_export.assert_called_once()
 
-    @patch("mixer.agents.engineer._load_song_audio")
+    @patch.object(engineer, "_load_song_audio")
     def test_create_adaptive_harmony_missing_keys(
         self,
         mock_load,
@@ -680,9 +559,8 @@ class TestAdaptiveHarmonyMashup:
         """Should raise EngineerError when keys missing."""
         audio, sr = mock_audio_data
 
-        meta_a = mock_song_metadata.copy()
-        meta_a["key"] = None
-        meta_b = mock_song_metadata.copy()
+        meta_a = dict(mock_song_metadata, key=None)
+        meta_b = dict(mock_song_metadata)
 
         mock_load.side_effect = [(audio, meta_a), (audio, meta_b)]
 
@@ -690,99 +568,94 @@ class TestAdaptiveHarmonyMashup:
             create_adaptive_harmony_mashup("song_a", "song_b")
 
 
+# Sections with themes for theme fusion.
+_THEME_SECTIONS_A = frozen_sections([
+    {
+        "section_type": "verse",
+        "start_sec": 0.0,
+        "end_sec": 20.0,
+        "energy_level": 0.5,
+        "themes": ["love", "longing"],
+        "emotional_tone": "melancholic"
+    },
+    {
+        "section_type": "chorus",
+        "start_sec": 20.0,
+        "end_sec": 40.0,
+        "energy_level": 0.8,
+        "themes": ["heartbreak"],
+        "emotional_tone": "sad"
+    },
+])
+_THEME_SECTIONS_B = frozen_sections([
+    {
+        "section_type": "verse",
+        "start_sec": 0.0,
+        "end_sec": 18.0,
+        "energy_level": 0.6,
+        "themes": ["love", "hope"],
+        "emotional_tone": "hopeful"
+    },
+    {
+        "section_type": "bridge",
+        "start_sec": 18.0,
+        "end_sec": 30.0,
+        "energy_level": 0.4,
+        "themes": ["reflection"],
+        "emotional_tone": "contemplative"
+    },
+])
+
+
 class TestThemeFusionMashup:
     """Test theme fusion mashup creation."""
 
     @pytest.fixture
-    def mock_theme_sections(self):
-        """Create mock sections with themes."""
-        sections_a = [
-            {
-                "section_type": "verse",
-                "start_sec": 0.0,
-                "end_sec": 20.0,
-                "energy_level": 0.5,
-                "themes": ["love", "longing"],
-                "emotional_tone": "melancholic"
-            },
-            {
-                "section_type": "chorus",
-                "start_sec": 20.0,
-                "end_sec": 40.0,
-                "energy_level": 0.8,
-                "themes": ["heartbreak"],
-                "emotional_tone": "sad"
-            },
-        ]
-        sections_b = [
-            {
-                "section_type": "verse",
-                "start_sec": 0.0,
-                "end_sec": 18.0,
-                "energy_level": 0.6,
-                "themes": ["love", "hope"],
-                "emotional_tone": "hopeful"
-            },
-            {
-                "section_type": "bridge",
-                "start_sec": 18.0,
-                "end_sec": 30.0,
-                "energy_level": 0.4,
-                "themes": ["reflection"],
-                "emotional_tone": "contemplative"
-            },
-        ]
-        return sections_a, sections_b
+    def theme_fusion_ctx(self, mock_audio_data, mock_song_metadata):
+        """Patch song loading and time-stretching for two themed songs.
 
-    @patch("mixer.agents.engineer._load_song_audio")
-    @patch("mixer.agents.engineer.time_stretch")
-    @patch("mixer.agents.engineer.get_config")
+        Yields:
+            Tuple of (mock_load, mock_stretch, meta_a, meta_b); tests may
+            replace ``mock_load.side_effect`` before creating the mashup.
+        """
+        audio, sr = mock_audio_data
+
+        meta_a = dict(mock_song_metadata, sections=_THEME_SECTIONS_A, bpm=120.0)
+        meta_b = dict(mock_song_metadata, sections=_THEME_SECTIONS_B, bpm=100.0)
+
+        with patch.object(engineer, "_load_song_audio") as mock_load, \
+                patch.object(engineer, "time_stretch") as mock_stretch:
+            mock_load.side_effect = [(audio, meta_a), (audio, meta_b)]
+            mock_stretch.return_value = audio
+            yield mock_load, mock_stretch, meta_a, meta_b
+
+    @patch.object(engineer, "get_config")
     @patch("mixer.audio.processing.numpy_to_audiosegment")
     @patch("pydub.effects.normalize")
-    @patch("mixer.agents.engineer.Path")
+    @patch.object(engineer, "Path")
     def test_create_theme_fusion_success(
         self,
         mock_path_class,
         mock_normalize,
         mock_to_audioseg,
         mock_config,
-        mock_stretch,
-        mock_load,
-        mock_audio_data,
-        mock_song_metadata,
-        mock_theme_sections,
-        tmp_path
+        theme_fusion_ctx,
+        engineer_config_mock
     ):
         """Should create theme fusion mashup with matching theme."""
-        audio, sr = mock_audio_data
-        sections_a, sections_b = mock_theme_sections
-
-        # Setup metadata with themed sections
-        meta_a = mock_song_metadata.copy()
-        meta_a["sections"] = sections_a
-        meta_a["bpm"] = 120.0
-
-        meta_b = mock_song_metadata.copy()
-        meta_b["sections"] = sections_b
-        meta_b["bpm"] = 100.0
-
-        mock_load.side_effect = [(audio, meta_a), (audio, meta_b)]
-        mock_stretch.return_value = audio
+        mock_load, mock_stretch, _, _ = theme_fusion_ctx
 
         # Mock config
-        config_mock = MagicMock()
-        config_mock.get.return_value = "high"
-        config_mock.get_path.return_value = tmp_path
-        mock_config.return_value = config_mock
+        mock_config.return_value = engineer_config_mock
 
         # Mock AudioSegment
-        mock_audioseg = MagicMock()
+        mock_audioseg = Mock(spec=["export"])
         mock_to_audioseg.return_value = mock_audioseg
         mock_normalize.return_value = mock_audioseg
 
         # Mock Path
-        mock_path_instance = MagicMock()
-        mock_path_instance.parent.mkdir = MagicMock()
+        mock_path_instance = Mock(spec=["parent"])
+        mock_path_instance.parent = Mock(spec=["mkdir"])
         mock_path_class.return_value = mock_path_instance
 
         # Create theme fusion mashup
@@ -799,116 +672,89 @@ class TestThemeFusionMashup:
         mock_stretch.assert_called_once()
         mock_audioseg.export.assert_called_once()
 
-    @patch("mixer.agents.engineer._load_song_audio")
-    @patch("mixer.agents.engineer.time_stretch")
-    def test_create_theme_fusion_no_matching_sections(
-        self,
-        mock_stretch,
-        mock_load,
-        mock_audio_data,
-        mock_song_metadata,
-        mock_theme_sections
-    ):
-        """Should raise EngineerError when no sections match theme."""
-        audio, sr = mock_audio_data
-        sections_a, sections_b = mock_theme_sections
-
-        meta_a = mock_song_metadata.copy()
-        meta_a["sections"] = sections_a
-        meta_a["bpm"] = 120.0
-
-        meta_b = mock_song_metadata.copy()
-        meta_b["sections"] = sections_b
-        meta_b["bpm"] = 100.0
-
-        mock_load.side_effect = [(audio, meta_a), (audio, meta_b)]
-        mock_stretch.return_value = audio
-
-        # Try to find theme that doesn't exist
-        with pytest.raises(EngineerError, match="No sections found matching theme"):
-            create_theme_fusion_mashup("song_a", "song_b", theme="nonexistent")
-
-    @patch("mixer.agents.engineer._load_song_audio")
-    def test_create_theme_fusion_missing_sections(
+    @pytest.mark.parametrize("theme,has_sections,match", [
+        ("nonexistent", True, "No sections found matching theme"),
+        ("love", False, "section-level metadata"),
+    ])
+    def test_create_theme_fusion_errors(
         self,
-        mock_load,
+        theme_fusion_ctx,
         mock_audio_data,
-        mock_song_metadata
+        theme,
+        has_sections,
+        match
     ):
-        """Should raise EngineerError when sections missing."""
-        audio, sr = mock_audio_data
-
-        meta_a = mock_song_metadata.copy()
-        meta_a["sections"] = []
-        meta_b = mock_song_metadata.copy()
-        meta_b["sections"] = []
-
-        mock_load.side_effect = [(audio, meta_a), (audio, meta_b)]
-
-        with pytest.raises(EngineerError, match="section-level metadata"):
-            create_theme_fusion_mashup("song_a", "song_b", theme="love")
+        """Should raise EngineerError when no sections match or none exist."""
+        mock_load, _, meta_a, meta_b = theme_fusion_ctx
+        if not has_sections:
+            audio, sr = mock_audio_data
+            mock_load.side_effect = [
+                (audio, dict(meta_a, sections=[])),
+                (audio, dict(meta_b, sections=[])),
+            ]
+
+        with pytest.raises(EngineerError, match=match):
+            create_theme_fusion_mashup("song_a", "song_b", theme=theme)
+
+
+# Sections with lyrical functions for semantic alignment.
+_SEMANTIC_SECTIONS_A = frozen_sections([
+    {
+        "section_type": "verse",
+        "start_sec": 0.0,
+        "end_sec": 20.0,
+        "lyrical_function": "question",
+        "emotional_tone": "curious"
+    },
+    {
+        "section_type": "chorus",
+        "start_sec": 20.0,
+        "end_sec": 40.0,
+        "lyrical_function": "hook",
+        "emotional_tone": "intense"
+    },
+    {
+        "section_type": "verse",
+        "start_sec": 40.0,
+        "end_sec": 60.0,
+        "lyrical_function": "narrative",
+        "emotional_tone": "descriptive"
+    },
+])
+_SEMANTIC_SECTIONS_B = frozen_sections([
+    {
+        "section_type": "verse",
+        "start_sec": 0.0,
+        "end_sec": 18.0,
+        "lyrical_function": "answer",
+        "emotional_tone": "resolute"
+    },
+    {
+        "section_type": "chorus",
+        "start_sec": 18.0,
+        "end_sec": 35.0,
+        "lyrical_function": "hook",
+        "emotional_tone": "powerful"
+    },
+    {
+        "section_type": "bridge",
+        "start_sec": 35.0,
+        "end_sec": 50.0,
+        "lyrical_function": "reflection",
+        "emotional_tone": "contemplative"
+    },
+])
 
 
 class TestSemanticAlignedMashup:
     """Test semantic-aligned mashup creation."""
 
-    @pytest.fixture
-    def mock_semantic_sections(self):
-        """Create mock sections with lyrical functions."""
-        sections_a = [
-            {
-                "section_type": "verse",
-                "start_sec": 0.0,
-                "end_sec": 20.0,
-                "lyrical_function": "question",
-                "emotional_tone": "curious"
-            },
-            {
-                "section_type": "chorus",
-                "start_sec": 20.0,
-                "end_sec": 40.0,
-                "lyrical_function": "hook",
-                "emotional_tone": "intense"
-            },
-            {
-                "section_type": "verse",
-                "start_sec": 40.0,
-                "end_sec": 60.0,
-                "lyrical_function": "narrative",
-                "emotional_tone": "descriptive"
-            },
-        ]
-        sections_b = [
-            {
-                "section_type": "verse",
-                "start_sec": 0.0,
-                "end_sec": 18.0,
-                "lyrical_function": "answer",
-                "emotional_tone": "resolute"
-            },
-            {
-                "section_type": "chorus",
-                "start_sec": 18.0,
-                "end_sec": 35.0,
-                "lyrical_function": "hook",
-                "emotional_tone": "powerful"
-            },
-            {
-                "section_type": "bridge",
-                "start_sec": 35.0,
-                "end_sec": 50.0,
-                "lyrical_function": "reflection",
-                "emotional_tone": "contemplative"
-            },
-        ]
-        return sections_a, sections_b
-
-    @patch("mixer.agents.engineer._load_song_audio")
-    @patch("mixer.agents.engineer.time_stretch")
-    @patch("mixer.agents.engineer.get_config")
+    @patch.object(engineer, "_load_song_audio")
+    @patch.object(engineer, "time_stretch")
+    @patch.object(engineer, "get_config")
     @patch("mixer.audio.processing.numpy_to_audiosegment")
     @patch("pydub.effects.normalize")
-    @patch("mixer.agents.engineer.Path")
+    @patch.object(engineer, "Path")
     def test_create_semantic_aligned_success(
         self,
         mock_path_class,
@@ -919,39 +765,29 @@ class TestSemanticAlignedMashup:
         mock_load,
         mock_audio_data,
         mock_song_metadata,
-        mock_semantic_sections,
-        tmp_path
+        engineer_config_mock
     ):
         """Should create semantic-aligned mashup with function pairs."""
         audio, sr = mock_audio_data
-        sections_a, sections_b = mock_semantic_sections
 
         # Setup metadata with semantic sections
-        meta_a = mock_song_metadata.copy()
-        meta_a["sections"] = sections_a
-        meta_a["bpm"] = 120.0
-
-        meta_b = mock_song_metadata.copy()
-        meta_b["sections"] = sections_b
-        meta_b["bpm"] = 100.0
+        meta_a = dict(mock_song_metadata, sections=_SEMANTIC_SECTIONS_A, bpm=120.0)
+        meta_b = dict(mock_song_metadata, sections=_SEMANTIC_SECTIONS_B, bpm=100.0)
 
         mock_load.side_effect = [(audio, meta_a), (audio, meta_b)]
         mock_stretch.return_value = audio
 
         # Mock config
-        config_mock = MagicMock()
-        config_mock.get.return_value = "high"
-        config_mock.get_path.return_value = tmp_path
-        mock_config.return_value = config_mock
+        mock_config.return_value = engineer_config_mock
 
         # Mock AudioSegment
-        mock_audioseg = MagicMock()
+        mock_audioseg = Mock(spec=["export"])
         mock_to_audioseg.return_value = mock_audioseg
         mock_normalize.return_value = mock_audioseg
 
         # Mock Path
-        mock_path_instance = MagicMock()
-        mock_path_instance.parent.mkdir = MagicMock()
+        mock_path_instance = Mock(spec=["parent"])
+        mock_path_instance.parent = Mock(spec=["mkdir"])
         mock_path_class.return_value = mock_path_instance
 
         # Create semantic-aligned mashup
@@ -967,7 +803,7 @@ class TestSemanticAlignedMashup:
         mock_stretch.assert_called_once()
         mock_audioseg.export.assert_called_once()
 
-    @patch("mixer.agents.engineer._load_song_audio")
+    @patch.object(engineer, "_load_song_audio")
     def test_create_semantic_aligned_missing_sections(
         self,
         mock_load,
@@ -977,10 +813,8 @@ class TestSemanticAlignedMashup:
         """Should raise EngineerError when sections missing."""
         audio, sr = mock_audio_data
 
-        meta_a = mock_song_metadata.copy()
-        meta_a["sections"] = []
-        meta_b = mock_song_metadata.copy()
-        meta_b["sections"] = []
+        meta_a = dict(mock_song_metadata, sections=[])
+        meta_b = dict(mock_song_metadata, sections=[])
 
         mock_load.side_effect = [(audio, meta_a), (audio, meta_b)]
 
@@ -1,9 +1,12 @@
 """Unit tests for Ingestion Agent."""
 
 import os
+import sys
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from subprocess import CompletedProcess
+from types import ModuleType, SimpleNamespace
+from unittest.mock import patch
 
 from mixer.agents.ingestion import (
     detect_source_type,
@@ -17,6 +20,20 @@ from mixer.agents.ingestion import (
     ValidationError,
 )
 
+def _ytdlp_runner(*results):
+    """subprocess.run stand-in returning canned yt-dlp results in order.
+
+    Commands it was called with are recorded on ``.calls``.
+    """
+    queue = iter(results)
+
+    def run(cmd, **kwargs):
+        run.calls.append(cmd)
+        return next(queue)
+
+    run.calls = []
+    return run
+
 
 class TestSourceDetection:
     """Test input source type detection."""
@@ -95,23 +112,36 @@ class TestArtistTitleExtraction:
         assert title == "Just A Title"
 
 
+class _FakeCollection:
+    """Just enough of a ChromaDB collection for check_cache: get() by id."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def get(self, ids=None):
+        hits = [song_id for song_id in ids if song_id in self.store]
+        return {"ids": hits, "metadatas": [self.store[i] for i in hits]}
+
+
+@pytest.fixture
+def cached_songs(monkeypatch):
+    """Route check_cache to an in-memory store; tests add songs to the dict."""
+    store = {}
+    collection = _FakeCollection(store)
+    client = SimpleNamespace(get_collection=lambda: collection)
+    monkeypatch.setattr("mixer.agents.ingestion.get_client", lambda: client)
+    return store
+
+
 class TestCacheChecking:
     """Test ChromaDB cache checking."""
 
-    @patch('mixer.agents.ingestion.get_client')
-    def test_check_cache_hit(self, mock_get_client):
+    def test_check_cache_hit(self, cached_songs):
         """Should return metadata when song is cached."""
-        # Mock ChromaDB client
-        mock_collection = Mock()
-        mock_collection.get.return_value = {
-            'ids': ['taylor_swift_shake_it_off'],
-            'metadatas': [{'path': '/path/to/song.wav', 'bpm': 120.0}]
+        cached_songs['taylor_swift_shake_it_off'] = {
+            'path': '/path/to/song.wav', 'bpm': 120.0
         }
 
-        mock_client = Mock()
-        mock_client.get_collection.return_value = mock_collection
-        mock_get_client.return_value = mock_client
-
         # Call check_cache
         result = check_cache('taylor_swift_shake_it_off')
 
@@ -119,25 +149,52 @@ class TestCacheChecking:
         assert result['path'] == '/path/to/song.wav'
         assert result['bpm'] == 120.0
 
-    @patch('mixer.agents.ingestion.get_client')
-    def test_check_cache_miss(self, mock_get_client):
+    def test_check_cache_miss(self, cached_songs):
         """Should return None when song not cached."""
-        # Mock ChromaDB client
-        mock_collection = Mock()
-        mock_collection.get.return_value = {
-            'ids': [],
-            'metadatas': []
-        }
-
-        mock_client = Mock()
-        mock_client.get_collection.return_value = mock_collection
-        mock_get_client.return_value = mock_client
-
         # Call check_cache
         result = check_cache('nonexistent_song')
 
         assert result is None
 
+    def test_check_cache_many(self, cached_songs):
+        """Should map each cached ID to its metadata in one probe."""
+        cached_songs['artist_song'] = {'bpm': 120.0}
+        cached_songs['artist_song_v2'] = {'bpm': 128.0}
+
+        result = check_cache(['artist_song', 'artist_song_v2', 'artist_song_v3'])
+
+        assert result == {
+            'artist_song': {'bpm': 120.0},
+            'artist_song_v2': {'bpm': 128.0},
+        }
+        assert check_cache(['artist_song_v3']) is None
+
+
+@pytest.fixture(scope="session")
+def padded_wav(tmp_path_factory):
+    """200KB file, above validate_audio_file's 100KB floor, written once.
+
+    Contents are never decoded (librosa is stubbed), so tests share it
+    read-only.
+    """
+    path = tmp_path_factory.mktemp("wav") / "padded.wav"
+    path.write_bytes(bytes(200_000))
+    return path
+
+
+@pytest.fixture
+def stub_librosa(request, monkeypatch):
+    """Stand-in ``librosa`` whose get_duration reports ``request.param`` seconds.
+
+    validate_audio_file imports librosa lazily, so a sys.modules entry keeps
+    these tests from loading the real package (numba, scipy, soundfile).
+    The real check is covered by tests/integration/test_ingestion_validation.py.
+    """
+    stub = ModuleType("librosa")
+    stub.get_duration = lambda path=None, **kwargs: request.param
+    monkeypatch.setitem(sys.modules, "librosa", stub)
+    return stub
+
 
 class TestFileValidation:
     """Test audio file validation."""
@@ -155,31 +212,25 @@ class TestFileValidation:
         with pytest.raises(ValidationError, match="File too small"):
             validate_audio_file(str(small_file))
 
-    @patch('librosa.get_duration')
-    def test_validate_file_too_short(self, mock_get_duration, tmp_path):
+    @pytest.mark.parametrize("stub_librosa", [15.0], indirect=True)
+    def test_validate_file_too_short(self, stub_librosa, padded_wav):
         """Should raise error for audio < 30 seconds."""
-        # Create a file > 100KB
-        test_file = tmp_path / "short.wav"
-        test_file.write_bytes(b"x" * 200000)  # 200KB
-
-        # Mock duration
-        mock_get_duration.return_value = 15.0  # 15 seconds
-
         with pytest.raises(ValidationError, match="Audio too short"):
-            validate_audio_file(str(test_file))
+            validate_audio_file(str(padded_wav))
 
-    @patch('librosa.get_duration')
-    def test_validate_success(self, mock_get_duration, tmp_path):
+    @pytest.mark.parametrize("stub_librosa", [180.0], indirect=True)
+    def test_validate_success(self, stub_librosa, padded_wav):
         """Should pass validation for valid file."""
-        # Create a file > 100KB
-        test_file = tmp_path / "valid.wav"
-        test_file.write_bytes(b"x" * 200000)  # 200KB
+        # Should not raise
+        validate_audio_file(str(padded_wav))
 
-        # Mock duration
-        mock_get_duration.return_value = 180.0  # 3 minutes
 
-        # Should not raise
-        validate_audio_file(str(test_file))
+@pytest.fixture
+def library_dir(tmp_path, monkeypatch):
+    """Point ingestion's library cache and failed-files dirs at tmp_path."""
+    config = SimpleNamespace(get_path=lambda name: tmp_path)
+    monkeypatch.setattr("mixer.agents.ingestion.get_config", lambda: config)
+    return tmp_path
 
 
 class TestLocalFileIngestion:
@@ -193,23 +244,18 @@ class TestLocalFileIngestion:
         mock_validate,
         mock_convert,
         mock_cache,
-        tmp_path
+        library_dir
     ):
         """Should successfully ingest a local file."""
         # Setup
         mock_cache.return_value = None  # Not cached
 
         # Create test file
-        test_file = tmp_path / "Taylor Swift - Shake It Off.mp3"
+        test_file = library_dir / "Taylor Swift - Shake It Off.mp3"
         test_file.touch()
 
         # Call ingest_song
-        with patch('mixer.agents.ingestion.get_config') as mock_config:
-            mock_cfg = Mock()
-            mock_cfg.get_path.return_value = tmp_path
-            mock_config.return_value = mock_cfg
-
-            result = ingest_song(str(test_file))
+        result = ingest_song(str(test_file))
 
         # Assertions
         assert result['id'] == 'taylor_swift_shake_it_off'
@@ -221,10 +267,10 @@ class TestLocalFileIngestion:
         mock_validate.assert_called_once()
 
     @patch('mixer.agents.ingestion.check_cache')
-    def test_ingest_local_file_cached(self, mock_cache, tmp_path):
+    def test_ingest_local_file_cached(self, mock_cache, library_dir):
         """Should return cached result without processing."""
         # Setup cached metadata
-        cached_path = str(tmp_path / "cached.wav")
+        cached_path = str(library_dir / "cached.wav")
         Path(cached_path).touch()  # Create the cached file
 
         mock_cache.return_value = {
@@ -233,7 +279,7 @@ class TestLocalFileIngestion:
         }
 
         # Create test file
-        test_file = tmp_path / "Artist - Song.mp3"
+        test_file = library_dir / "Artist - Song.mp3"
         test_file.touch()
 
         # Call ingest_song
@@ -248,83 +294,62 @@ class TestLocalFileIngestion:
 class TestYouTubeIngestion:
     """Test YouTube URL ingestion."""
 
-    @patch('subprocess.run')
     @patch('mixer.agents.ingestion.check_cache')
     @patch('mixer.agents.ingestion.validate_audio_file')
     def test_ingest_youtube_url_success(
         self,
         mock_validate,
         mock_cache,
-        mock_subprocess,
-        tmp_path
+        library_dir
     ):
         """Should successfully download from YouTube."""
         # Setup
         mock_cache.return_value = None  # Not cached
 
-        # Mock metadata fetch
-        metadata_result = Mock()
-        metadata_result.returncode = 0
-        metadata_result.stdout = '{"title": "Taylor Swift - Shake It Off"}'
-
-        # Mock download
-        download_result = Mock()
-        download_result.returncode = 0
-
-        # Mock subprocess calls (metadata then download)
-        mock_subprocess.side_effect = [metadata_result, download_result]
+        # yt-dlp metadata fetch, then download
+        runner = _ytdlp_runner(
+            CompletedProcess(
+                ["yt-dlp"], 0, stdout='{"title": "Taylor Swift - Shake It Off"}'
+            ),
+            CompletedProcess(["yt-dlp"], 0),
+        )
 
         # Create the expected output file
-        output_file = tmp_path / "taylor_swift_shake_it_off.wav"
+        output_file = library_dir / "taylor_swift_shake_it_off.wav"
         output_file.touch()
 
         # Call ingest_song
         url = "https://www.youtube.com/watch?v=test123"
 
-        with patch('mixer.agents.ingestion.get_config') as mock_config:
-            mock_cfg = Mock()
-            mock_cfg.get_path.return_value = tmp_path
-            mock_config.return_value = mock_cfg
-
-            with patch('os.path.exists', return_value=True):
-                result = ingest_song(url)
+        with patch('os.path.exists', return_value=True):
+            result = ingest_song(url, runner=runner)
 
         # Assertions
         assert result['id'] == 'taylor_swift_shake_it_off'
         assert result['cached'] is False
         assert result['source'] == 'youtube'
 
-        # Verify subprocess was called twice (metadata + download)
-        assert mock_subprocess.call_count == 2
+        # Verify yt-dlp was run twice (metadata + download)
+        assert len(runner.calls) == 2
+        assert all(cmd[0] == "yt-dlp" for cmd in runner.calls)
 
-    @patch('subprocess.run')
     @patch('mixer.agents.ingestion.check_cache')
-    def test_ingest_youtube_url_download_failure(self, mock_cache, mock_subprocess, tmp_path):
+    def test_ingest_youtube_url_download_failure(self, mock_cache, library_dir):
         """Should raise DownloadError when download fails."""
         # Setup
         mock_cache.return_value = None  # Not cached
 
-        # Mock metadata fetch (success)
-        metadata_result = Mock()
-        metadata_result.returncode = 0
-        metadata_result.stdout = '{"title": "Test Video"}'
-
-        # Mock download (failure)
-        download_result = Mock()
-        download_result.returncode = 1
-        download_result.stderr = "Download error"
-
-        mock_subprocess.side_effect = [metadata_result, download_result]
+        # Metadata fetch succeeds, download fails
+        runner = _ytdlp_runner(
+            CompletedProcess(["yt-dlp"], 0, stdout='{"title": "Test Video"}'),
+            CompletedProcess(["yt-dlp"], 1, stderr="Download error"),
+        )
 
         url = "https://www.youtube.com/watch?v=test123"
 
-        with patch('mixer.agents.ingestion.get_config') as mock_config:
-            mock_cfg = Mock()
-            mock_cfg.get_path.return_value = tmp_path
-            mock_config.return_value = mock_cfg
-
-            with pytest.raises(DownloadError, match="yt-dlp download failed"):
-                ingest_song(url, max_retries=1)  # Only 1 retry for faster test
+        with pytest.raises(DownloadError, match="yt-dlp download failed"):
+            # Only 1 retry for faster test
+            ingest_song(url, max_retries=1, runner=runner)
 
 
 class TestIntegration: